@@ -1,6 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.schemas.user import (
+    CurrentUser,
     UserCreate,
     UserLogin,
     UserUpdate,
@@ -11,8 +14,20 @@ from app.schemas.user import (
     UserIdByTokenResponse,
 )
 from app.models.user import UserModel
-from app.core.security import hash_password, verify_password
+from app.core.security import (
+    hash_password_async,
+    verify_password_async,
+    verify_and_update_password_async,
+)
+from app.core.etag import not_modified, set_etag, version_etag
 from app.core.jwt import decode_token, create_access_token
+from app.core.responses import fast_json, fast_json_enabled, rows_to_dicts
+from app.services.auth_service import (
+    service_get_user,
+    service_get_user_row,
+    service_invalidate_user,
+    service_refresh_user,
+)
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -22,7 +37,7 @@ bearer = HTTPBearer(auto_error=False)
 # 로그인을 한 유저인지 확인
 async def get_current_user(
     cred: HTTPAuthorizationCredentials | None = Depends(bearer),
-) -> UserModel:
+) -> CurrentUser:
     if cred is None or cred.scheme.lower() != "bearer":
         raise HTTPException(status_code=401, detail="인증 정보가 없습니다.")
 
@@ -31,10 +46,18 @@ async def get_current_user(
     if not user_id:
         raise HTTPException(status_code=401, detail="유효하지 않은 토큰입니다.")
 
-    user = await UserModel.filter(user_id=int(user_id)).first()
+    user = await service_get_user(int(user_id))
+    if user and user.password_version != payload.get("pwv"):
+        # 다른 워커에서 비밀번호가 바뀌어 이 워커의 스냅샷이 오래됐을 수 있으니
+        # 한 번 다시 읽어 확인합니다.
+        user = await service_refresh_user(user.user_id)
     if not user:
         raise HTTPException(status_code=401, detail="사용자를 찾을 수 없습니다.")
 
+    # 비밀번호를 바꾸기 전에 발급된 토큰
+    if user.password_version != payload.get("pwv"):
+        raise HTTPException(status_code=401, detail="유효하지 않은 토큰입니다.")
+
     if not user.is_active:
         raise HTTPException(status_code=403, detail="비활성화된 사용자 입니다.")
 
@@ -55,7 +78,7 @@ async def register(payload: UserCreate):
     if exists:
         raise HTTPException(status_code=409, detail="이미 사용 중인 이메일 입니다.")
 
-    pw_hash = hash_password(payload.password)
+    pw_hash = await hash_password_async(payload.password)
 
     user = await UserModel.create(
         username=payload.username,
@@ -64,14 +87,8 @@ async def register(payload: UserCreate):
         is_active=True,
     )
 
-    return UserResponse(
-        id=user.user_id,
-        username=user.username,
-        email=user.email,
-        is_active=user.is_active,
-        created_at=user.created_at,
-        updated_at=user.updated_at,
-    )
+    # response_model(UserResponse)이 ORM 객체를 한 번만 검증 / 직렬화합니다.
+    return user
 
 
 # 로그인
@@ -94,81 +111,96 @@ async def login(payload: UserLogin):
             status_code=status.HTTP_403_FORBIDDEN, detail="비활성화된 사용자 입니다."
         )
 
-    if not verify_password(payload.password, user.password_hash):
+    verified, new_hash = await verify_and_update_password_async(
+        payload.password, user.password_hash
+    )
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="이메일 또는 비밀번호가 올바르지 않습니다.",
         )
 
-    token = create_access_token(subject=str(user.user_id))
+    # bcrypt cost(BCRYPT_ROUNDS)가 바뀌었으면 로그인 성공 시 새 cost로 다시 저장
+    # (해시가 바뀌므로 이 사용자의 이전 토큰도 함께 무효가 됩니다)
+    if new_hash:
+        user.password_hash = new_hash
+        await user.save(update_fields=["password_hash"])
+        service_invalidate_user(user.user_id)
+
+    token = create_access_token(subject=str(user.user_id), pwv=user.password_version)
     return TokenResponse(access_token=token, token_type="bearer")
 
 
 # 조회
 @router.get("/me", response_model=UserResponse)
-async def me(user: UserModel = Depends(get_current_user)):
+async def me(
+    response: Response,
+    user: CurrentUser = Depends(get_current_user),
+    if_none_match: Optional[str] = Header(None),
+):
     """
     - 토큰 기반 사용자 정보 조회
     - 로그인된 사용자만 접근 가능
+    - If-None-Match가 ETag(updated_at 기준)와 같으면 본문 없이 304
     """
-    return UserResponse(
-        id=user.user_id,
-        username=user.username,
-        email=user.email,
-        is_active=user.is_active,
-        created_at=user.created_at,
-        updated_at=user.updated_at,
-    )
+    etag = version_etag("u", user.user_id, user.updated_at)
+    cached = not_modified(if_none_match, etag)
+    if cached is not None:
+        return cached
+
+    set_etag(response, etag)
+    if fast_json_enabled():
+        return fast_json(rows_to_dicts([user], UserResponse)[0], response)
+    # response_model(UserResponse)이 캐시 스냅샷을 한 번만 검증 / 직렬화합니다.
+    return user
 
 
 # 수정
 @router.patch("/me", response_model=UserResponse)
-async def update_me(payload: UserUpdate, user: UserModel = Depends(get_current_user)):
+async def update_me(payload: UserUpdate, user: CurrentUser = Depends(get_current_user)):
     """
     - 로그인한 사용자 정보 수정
-    -  수정 가능 항목 : username,email
+    -  수정 가능 항목 : username,email,timezone
     """
     # 아무것도 안보내는거 방지
-    if payload.username is None and payload.email is None:
+    changes = payload.model_dump(exclude_none=True)
+    if not changes:
         raise HTTPException(status_code=400, detail="수정할 항목이 없습니다.")
 
-    if payload.email is not None and payload.email != user.email:
-        exists = await UserModel.filter(email=payload.email).exists()
+    if changes.get("email", user.email) != user.email:
+        exists = await UserModel.filter(email=changes["email"]).exists()
         if exists:
             raise HTTPException(status_code=409, detail="이미 사용 중인 이메일 입니다.")
-        user.email = payload.email
 
-    if payload.username is not None:
-        user.username = payload.username
+    # 캐시 스냅샷이 아니라 행을 다시 읽고 바꾼 컬럼만 저장합니다.
+    # (다른 워커가 바꾼 password_hash / is_active를 덮어쓰지 않도록)
+    user = await service_get_user_row(user.user_id)
+    user.update_from_dict(changes)
+    await user.save(update_fields=[*changes, "updated_at"])
+    service_invalidate_user(user.user_id)
 
-    await user.save()
-
-    return UserResponse(
-        id=user.user_id,
-        username=user.username,
-        email=user.email,
-        is_active=user.is_active,
-        created_at=user.created_at,
-        updated_at=user.updated_at,
-    )
+    return user
 
 
 # 비밀번호 변경
 @router.patch("/me/password", status_code=status.HTTP_204_NO_CONTENT)
 async def change_password(
-    payload: PasswordChange, user: UserModel = Depends(get_current_user)
+    payload: PasswordChange, user: CurrentUser = Depends(get_current_user)
 ):
     """
     - 로그인된 사용자 비밀번호 변경
     - 기존 비밀번호 검증 후 변경
+    - 변경 전에 발급된 토큰은 더 이상 쓸 수 없습니다. (다시 로그인)
     """
+    user = await service_get_user_row(user.user_id)
     # 현재 비밀번호 확인
-    if not verify_password(payload.current_password, user.password_hash):
+    if not await verify_password_async(payload.current_password, user.password_hash):
         raise HTTPException(
             status_code=400, detail="현재 비밀번호가 올바르지 않습니다."
         )
-    user.password_hash = hash_password(payload.new_password)
+    user.password_hash = await hash_password_async(payload.new_password)
     await user.save(update_fields=["password_hash"])
+    service_invalidate_user(user.user_id)
 
     return None
 
@@ -1,30 +1,45 @@
-from typing import List
-from fastapi import APIRouter, HTTPException
+from datetime import datetime
+from typing import Literal, Optional
+from fastapi import APIRouter, Header, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from fastapi.params import Depends
 from starlette.status import (
     HTTP_201_CREATED,
     HTTP_404_NOT_FOUND,
-    HTTP_500_INTERNAL_SERVER_ERROR,
 )
 
 from app.api.v1.auth import get_user_id_by_token, get_current_user
-from app.models.user import UserModel
-
+from app.core.etag import (
+    not_modified,
+    parse_if_match,
+    set_etag,
+    timestamp_etag,
+    version_etag,
+)
+from app.core.responses import fast_json, fast_json_enabled, rows_to_dicts
 from app.schemas.diary import (
     DiaryResponse,
+    DiaryPageResponse,
     CreateDiaryRequest,
     UpdateDiaryRequest,
+    PatchDiaryRequest,
     DeleteDiaryResponse,
+    DiaryImportResponse,
+    DiarySearchItem,
+    DiarySearchResponse,
 )
 
-from app.schemas.user import UserIdByTokenRequest
+from app.schemas.user import CurrentUser, UserIdByTokenRequest
+from app.services.diary_export import EXPORT_FORMATS, service_export_diaries
+from app.services.diary_import import service_import_diaries
 from app.services.diary_service import (
     service_create_diary,
     service_get_diaries,
     service_get_diary,
+    service_get_diary_version,
+    service_search_diaries,
     service_delete_diary,
-    service_update_diary_title,
-    service_update_diary_content,
+    service_update_diary,
 )
 
 # 라우터 생성
@@ -32,38 +47,35 @@ diary_router = APIRouter(prefix="/v1/diary", tags=["Diary"], redirect_slashes=Fa
 
 
 # CREATE
-@diary_router.post("/", description="일기를 생성합니다.", status_code=HTTP_201_CREATED)
+@diary_router.post(
+    "/",
+    description="일기를 생성합니다.",
+    status_code=HTTP_201_CREATED,
+    response_model=DiaryResponse,
+)
 async def api_create_diary_by_token(
-    diary_data: CreateDiaryRequest, user: UserModel = Depends(get_current_user)
-) -> DiaryResponse:
+    diary_data: CreateDiaryRequest, user: CurrentUser = Depends(get_current_user)
+):
     """
     토큰정보를 불러와 토큰으로부터 user_id를 얻습니다
     user_id에 새로운 diary를 생성합니다.
     """
     user_id = user.user_id
 
-    diary = await service_create_diary(user_id, diary_data)
-    await diary.fetch_related("user")
-
-    return DiaryResponse(
-        id=diary.id,
-        user_id=diary.user.user_id,
-        title=diary.title,
-        content=diary.content,
-        created_at=diary.created_at,
-        updated_at=diary.updated_at,
-    )
+    # response_model(DiaryResponse)이 ORM 객체를 한 번만 검증 / 직렬화합니다.
+    return await service_create_diary(user_id, diary_data)
 
 
 @diary_router.post(
     "/str",
     description="토큰 str값으로 일기를 생성합니다.",
     status_code=HTTP_201_CREATED,
+    response_model=DiaryResponse,
 )
 async def api_create_diary_by_token_str(
     diary_data: CreateDiaryRequest,
     token: str,
-) -> DiaryResponse:
+):
     """
     발급된 토큰값을 str로 입력하면 str값에서 user_id를 얻습니다
     user_id에 새로운 diary를 생성합니다.
@@ -71,96 +83,230 @@ async def api_create_diary_by_token_str(
     response = await get_user_id_by_token(UserIdByTokenRequest(token=token))
     user_id = response.user_id
 
-    diary = await service_create_diary(user_id, diary_data)
-    await diary.fetch_related("user")
+    # response_model(DiaryResponse)이 ORM 객체를 한 번만 검증 / 직렬화합니다.
+    return await service_create_diary(user_id, diary_data)
 
-    return DiaryResponse(
-        id=diary.id,
-        user_id=diary.user.user_id,
-        title=diary.title,
-        content=diary.content,
-        created_at=diary.created_at,
-        updated_at=diary.updated_at,
-    )
+
+@diary_router.post(
+    "/import",
+    description="NDJSON / CSV 로 여러 일기를 한 번에 가져옵니다.",
+    response_model=DiaryImportResponse,
+)
+async def api_import_diaries(
+    request: Request,
+    user: CurrentUser = Depends(get_current_user),
+    fmt: Optional[Literal["ndjson", "csv"]] = Query(
+        None,
+        alias="format",
+        description="없으면 Content-Type으로 판단 (text/csv → csv)",
+    ),
+):
+    """
+    요청 바디를 스트림으로 읽으면서 한 줄씩 CreateDiaryRequest 형식으로 검증하고
+    묶음(bulk_create) 단위로 저장합니다.
+    - NDJSON: 한 줄에 {"title": ..., "content": ..., "created_at": ...}
+    - CSV: 첫 줄 헤더(title,content[,created_at])
+    """
+    if fmt is None:
+        content_type = request.headers.get("content-type", "")
+        fmt = "csv" if "csv" in content_type else "ndjson"
+
+    return await service_import_diaries(user.user_id, request.stream(), fmt)
 
 
 # READ
-@diary_router.get("/", response_model=List[DiaryResponse])
-async def api_read_diaries_by_token(user: UserModel = Depends(get_current_user)):
+@diary_router.get("/", response_model=DiaryPageResponse)
+async def api_read_diaries_by_token(
+    response: Response,
+    user: CurrentUser = Depends(get_current_user),
+    limit: int = Query(20, ge=1, le=100, description="한 페이지 일기 개수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    created_from: Optional[datetime] = Query(None, description="이 시각 이후 작성"),
+    created_to: Optional[datetime] = Query(None, description="이 시각 이전 작성"),
+    if_none_match: Optional[str] = Header(None),
+):
     """
     토큰정보를 불러와 토큰으로부터 user_id를 얻습니다
-    user_id에 속한 diary를 불러옵니다.
+    user_id에 속한 diary를 최신순으로 한 페이지씩 불러옵니다.
+    일기를 쓰거나 고치거나 지울 때마다 바뀌는 ETag를 붙이며,
+    If-None-Match가 같으면 목록을 조회하지 않고 304를 반환합니다.
     """
     user_id = user.user_id
 
-    return await service_get_diaries(user_id)
+    etag = version_etag("d", user_id, await service_get_diary_version(user_id))
+    cached = not_modified(if_none_match, etag)
+    if cached is not None:
+        return cached
+
+    diaries, next_cursor = await service_get_diaries(
+        user_id, limit, cursor, created_from, created_to
+    )
+    set_etag(response, etag)
+    if fast_json_enabled():
+        page = {
+            "items": rows_to_dicts(diaries, DiaryResponse),
+            "next_cursor": next_cursor,
+        }
+        return fast_json(page, response)
+    return {"items": diaries, "next_cursor": next_cursor}
 
 
-@diary_router.get("/str", response_model=List[DiaryResponse])
-async def api_read_diaries_by_token_str(token: str):
+@diary_router.get("/str", response_model=DiaryPageResponse)
+async def api_read_diaries_by_token_str(
+    response: Response,
+    token: str,
+    limit: int = Query(20, ge=1, le=100, description="한 페이지 일기 개수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    created_from: Optional[datetime] = Query(None, description="이 시각 이후 작성"),
+    created_to: Optional[datetime] = Query(None, description="이 시각 이전 작성"),
+    if_none_match: Optional[str] = Header(None),
+):
     """
     발급된 토큰값을 str로 입력하면 str값에서 user_id를 얻습니다
-    user_id에 속한 diary를 불러옵니다.
+    user_id에 속한 diary를 최신순으로 한 페이지씩 불러옵니다.
+    (ETag / If-None-Match 는 GET / 과 같습니다)
     """
-    response = await get_user_id_by_token(UserIdByTokenRequest(token=token))
-    user_id = response.user_id
+    token_user = await get_user_id_by_token(UserIdByTokenRequest(token=token))
+    user_id = token_user.user_id
+
+    etag = version_etag("d", user_id, await service_get_diary_version(user_id))
+    cached = not_modified(if_none_match, etag)
+    if cached is not None:
+        return cached
+
+    diaries, next_cursor = await service_get_diaries(
+        user_id, limit, cursor, created_from, created_to
+    )
+    set_etag(response, etag)
+    if fast_json_enabled():
+        page = {
+            "items": rows_to_dicts(diaries, DiaryResponse),
+            "next_cursor": next_cursor,
+        }
+        return fast_json(page, response)
+    return {"items": diaries, "next_cursor": next_cursor}
+
+
+@diary_router.get(
+    "/export",
+    description="내 일기 전체를 NDJSON / CSV / Markdown ZIP 파일로 내보냅니다.",
+    response_class=StreamingResponse,
+)
+async def api_export_diaries(
+    user: CurrentUser = Depends(get_current_user),
+    fmt: Literal["ndjson", "csv", "zip"] = Query(
+        "ndjson", alias="format", description="내보낼 형식"
+    ),
+):
+    """
+    일기를 일정 개수씩 읽어 바로 인코딩해 흘려보냅니다.
+    일기 수가 많아도 서버 메모리 사용량은 늘지 않습니다.
+    """
+    media_type, extension = EXPORT_FORMATS[fmt]
+    filename = f"diaries-{datetime.now():%Y%m%d}.{extension}"
+    return StreamingResponse(
+        service_export_diaries(user.user_id, fmt),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
-    return await service_get_diaries(user_id)
+
+@diary_router.get("/search", response_model=DiarySearchResponse)
+async def api_search_diaries(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어"),
+    limit: int = Query(20, ge=1, le=100, description="한 페이지 결과 개수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    user: CurrentUser = Depends(get_current_user),
+):
+    """
+    내 일기의 제목과 내용에서 검색어를 찾아 관련도순으로 한 페이지씩 불러옵니다.
+    snippet은 일치 부분이 <mark>로 감싸진 html 조각입니다.
+    일치하는 일기 중 최근 DIARY_SEARCH_MAX_CANDIDATES(기본 1000)개만 검색하며,
+    이 상한에 걸려 더 오래된 일기를 건너뛰었으면 truncated가 true입니다.
+    """
+    items, next_cursor, truncated = await service_search_diaries(
+        user.user_id, q, limit, cursor
+    )
+    if fast_json_enabled():
+        page = {
+            "items": rows_to_dicts(items, DiarySearchItem),
+            "next_cursor": next_cursor,
+            "truncated": truncated,
+        }
+        return fast_json(page)
+    return {"items": items, "next_cursor": next_cursor, "truncated": truncated}
 
 
 @diary_router.get("/{diary_id}", response_model=DiaryResponse)
-async def api_read_diary(diary_id: int):
+async def api_read_diary(diary_id: int, response: Response):
     """
     diary_id를 입력하면 해당하는 diary 객체의 정보를 불러옵니다.
+    응답의 ETag를 수정/삭제 시 If-Match로 보내면 동시 수정을 감지합니다.
     """
     diary = await service_get_diary(diary_id)
     if not diary:
         raise HTTPException(
             status_code=HTTP_404_NOT_FOUND, detail="일기를 찾을 수 없음"
         )
+    response.headers["ETag"] = timestamp_etag(diary.updated_at)
     return diary
 
 
 @diary_router.put("/{diary_id}", response_model=DiaryResponse)
-async def api_update_diary(diary_id: int, diary_data: UpdateDiaryRequest):
+async def api_update_diary(
+    diary_id: int,
+    diary_data: UpdateDiaryRequest,
+    response: Response,
+    user: CurrentUser = Depends(get_current_user),
+    if_match: Optional[str] = Header(None),
+):
     """
     diary_id로 조회하고 해당 객체가 존재하면 diary_data의 정보로 업데이트 합니다.
-    diary_data에는 title, content가 있습니다.
+    diary_data에는 title, content가 있습니다. (content가 비어 있으면 유지)
     """
-    diary = await service_get_diary(diary_id)
-    if not diary:
-        raise HTTPException(
-            status_code=HTTP_404_NOT_FOUND, detail="일기를 찾을 수 없음"
-        )
+    values = {"title": diary_data.title}
+    if diary_data.content:
+        values["content"] = diary_data.content
 
-    await service_update_diary_title(diary_id, diary_data.title)
+    diary = await service_update_diary(
+        diary_id, user.user_id, values, parse_if_match(if_match)
+    )
+    response.headers["ETag"] = timestamp_etag(diary.updated_at)
+    return diary
 
-    if diary_data.content:
-        await service_update_diary_content(diary_id, diary_data.content)
 
-    updated_diary = await service_get_diary(diary_id)
-    await updated_diary.fetch_related("user")
+@diary_router.patch("/{diary_id}", response_model=DiaryResponse)
+async def api_patch_diary(
+    diary_id: int,
+    diary_data: PatchDiaryRequest,
+    response: Response,
+    user: CurrentUser = Depends(get_current_user),
+    if_match: Optional[str] = Header(None),
+):
+    """
+    보낸 필드(title, content)만 수정하고 수정된 일기를 반환합니다.
+    If-Match가 있으면 그 버전일 때만 수정합니다. (아니면 412)
+    """
+    values = diary_data.model_dump(exclude_none=True)
+    if not values:
+        raise HTTPException(status_code=400, detail="수정할 항목이 없습니다.")
 
-    return updated_diary
+    diary = await service_update_diary(
+        diary_id, user.user_id, values, parse_if_match(if_match)
+    )
+    response.headers["ETag"] = timestamp_etag(diary.updated_at)
+    return diary
 
 
 @diary_router.delete("/{diary_id}", response_model=DeleteDiaryResponse)
 async def api_delete_diary(
     diary_id: int,
+    user: CurrentUser = Depends(get_current_user),
+    if_match: Optional[str] = Header(None),
 ):
     """
     diary_id에 해당하는 객체를 삭제합니다.
     """
-    diary = await service_get_diary(diary_id)
-    if not diary:
-        raise HTTPException(
-            status_code=HTTP_404_NOT_FOUND, detail="일기를 찾을 수 없음"
-        )
-
-    success = await service_delete_diary(diary_id) > 0
-    if not success:
-        raise HTTPException(
-            status_code=HTTP_500_INTERNAL_SERVER_ERROR, detail="삭제 중 오류"
-        )
+    await service_delete_diary(diary_id, user.user_id, parse_if_match(if_match))
 
     return DeleteDiaryResponse(id=diary_id)
@@ -1,16 +1,20 @@
 from fastapi import APIRouter, Depends
 from app.api.v1.auth import get_current_user
-from app.models.user import UserModel
+from app.schemas.user import CurrentUser
 from app.services.question_service import QuestionService
 
 router = APIRouter(prefix="/questions", tags=["questions"])
 
 
 @router.get("/random")
-async def get_random_question(user: UserModel = Depends(get_current_user)):
-    question = await QuestionService.get_random_question(user)
+async def get_random_question(user: CurrentUser = Depends(get_current_user)):
+    """
+    오늘의 질문 (유저 시간대 기준 하루 1개, 같은 날 다시 호출하면 같은 질문)
+    """
+    question, issue_date = await QuestionService.get_today_question(user)
 
     return {
         "question_id": question.id,
         "question": question.question_text,
+        "issue_date": issue_date,
     }
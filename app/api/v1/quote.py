@@ -1,18 +1,31 @@
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, Header, HTTPException, Query, Response, status, Depends
 from fastapi.responses import JSONResponse
-from typing import List
-import random
+from typing import List, Optional
 
-from app.models.bookmark import BookmarkModel
-from app.models.quote import QuoteModel  # <- models와의 연동
+from app.models.quote import QuoteModel, quote_content_hash  # <- models와의 연동
 from app.schemas.quote import (
+    BookmarkedQuoteResponse,
+    BookmarkPageResponse,
     CreateQuoteRequest,
+    PopularQuoteResponse,
     QuoteResponse,
 )
+from app.core.config import settings
+from app.core.etag import not_modified, set_etag, version_etag
+from app.core.responses import fast_json, fast_json_enabled, rows_to_dicts
+from app.services.bookmark_service import (
+    service_add_bookmark,
+    service_delete_bookmark,
+    service_get_bookmark_version,
+    service_get_bookmarks,
+)
+from app.services.quote_popularity import popular_quotes
+from app.services.quote_sampler import quote_sampler
+from app.services.quote_service import service_get_random_quote
 
 # ✅ auth.py 안에 있는 get_current_user를 그대로 사용
 from app.api.v1.auth import get_current_user
-from app.models.user import UserModel
+from app.schemas.user import CurrentUser
 
 router = APIRouter(prefix="/quote", tags=["quote"])
 
@@ -20,12 +33,7 @@ router = APIRouter(prefix="/quote", tags=["quote"])
 # 1) 랜덤 명언 1개
 @router.get("/random", response_model=QuoteResponse)
 async def get_random_quote():
-    total = await QuoteModel.all().count()
-    if total == 0:
-        raise HTTPException(status_code=404, detail="명언을 찾지 못했습니다.")
-
-    offset = random.randrange(total)
-    quote = await QuoteModel.all().offset(offset).first()
+    quote = await service_get_random_quote()
 
     if quote is None:
         raise HTTPException(status_code=404, detail="명언을 찾지 못했습니다.")
@@ -33,12 +41,28 @@ async def get_random_quote():
     return QuoteResponse.model_validate(quote)
 
 
+# 1-1) 인기 명언 (북마크 많은 순)
+@router.get("/popular", response_model=List[PopularQuoteResponse])
+async def get_popular_quotes(
+    limit: int = Query(
+        10, ge=1, le=settings.QUOTE_POPULAR_SIZE, description="가져올 명언 개수"
+    ),
+):
+    """
+    북마크 수가 많은 명언 순으로 반환합니다.
+    - 서버 메모리의 목록을 돌려주며 QUOTE_POPULAR_REFRESH_SECONDS 마다 갱신됩니다.
+    """
+    items = await popular_quotes.get(limit)
+    if fast_json_enabled():
+        return fast_json(rows_to_dicts(items, PopularQuoteResponse))
+    return items
+
+
 # 2) 명언 생성 (스크래핑 저장용)
 @router.post("", response_model=QuoteResponse, status_code=status.HTTP_201_CREATED)
 async def create_quote(payload: CreateQuoteRequest):
     exists = await QuoteModel.get_or_none(
-        content=payload.content,
-        author=payload.author,
+        content_hash=quote_content_hash(payload.content),
     )
 
     if exists:
@@ -48,6 +72,7 @@ async def create_quote(payload: CreateQuoteRequest):
         content=payload.content,
         author=payload.author,
     )
+    quote_sampler.add(quote.id)
 
     return QuoteResponse.model_validate(quote)
 
@@ -56,24 +81,16 @@ async def create_quote(payload: CreateQuoteRequest):
 @router.post("/{quote_id}/bookmark")
 async def add_bookmark(
     quote_id: int,
-    user: UserModel = Depends(get_current_user),
+    user: CurrentUser = Depends(get_current_user),
 ):
-    # 1) 명언 존재 확인
-    quote = await QuoteModel.get_or_none(id=quote_id)
-    if not quote:
-        raise HTTPException(status_code=404, detail="명언을 찾지 못했습니다.")
-
-    # 2) 중복 방지
-    exists = await BookmarkModel.get_or_none(user=user, quote=quote)
-    if exists:
+    # 북마크 생성 + 북마크 수 증가 (명언이 없으면 404, 중복이면 생성하지 않음)
+    created = await service_add_bookmark(user.user_id, quote_id)
+    if not created:
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={"message": "이미 북마크된 명언입니다."},
         )
 
-    # 3) 북마크 생성
-    await BookmarkModel.create(user=user, quote=quote)
-
     return JSONResponse(
         status_code=status.HTTP_201_CREATED,
         content={"message": "북마크에 추가되었습니다."},
@@ -81,30 +98,43 @@ async def add_bookmark(
 
 
 # 4) 북마크 조회 (✅ Query user_id 제거 / ✅ 토큰에서 유저 꺼냄)
-@router.get("/bookmark", response_model=List[QuoteResponse])
+@router.get("/bookmark", response_model=BookmarkPageResponse)
 async def get_bookmarks(
-    user: UserModel = Depends(get_current_user),
+    response: Response,
+    user: CurrentUser = Depends(get_current_user),
+    limit: int = Query(20, ge=1, le=100, description="한 페이지 북마크 개수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    if_none_match: Optional[str] = Header(None),
 ):
-    bookmarks = await BookmarkModel.filter(user=user).prefetch_related("quote")
-    return [QuoteResponse.model_validate(bookmark.quote) for bookmark in bookmarks]
+    # 북마크 추가/해제 때마다 바뀌는 버전으로 ETag를 만들고, 같으면 목록 조회 없이 304
+    etag = version_etag(
+        "b", user.user_id, await service_get_bookmark_version(user.user_id)
+    )
+    cached = not_modified(if_none_match, etag)
+    if cached is not None:
+        return cached
+
+    items, next_cursor, total = await service_get_bookmarks(user.user_id, limit, cursor)
+    set_etag(response, etag)
+    if fast_json_enabled():
+        page = {
+            "items": rows_to_dicts(items, BookmarkedQuoteResponse),
+            "next_cursor": next_cursor,
+            "total": total,
+        }
+        return fast_json(page, response)
+    return {"items": items, "next_cursor": next_cursor, "total": total}
 
 
 # 5) 북마크 해제 (✅ Query user_id 제거 / ✅ 토큰에서 유저 꺼냄)
 @router.delete("/{quote_id}/bookmark")
 async def delete_bookmark(
     quote_id: int,
-    user: UserModel = Depends(get_current_user),
+    user: CurrentUser = Depends(get_current_user),
 ):
-    # 1) 명언 존재 확인
-    quote = await QuoteModel.get_or_none(id=quote_id)
-    if not quote:
-        raise HTTPException(status_code=404, detail="명언을 찾지 못했습니다.")
-
-    # 2) 북마크 존재 확인
-    bookmark = await BookmarkModel.get_or_none(user=user, quote=quote)
-    if not bookmark:
+    # 삭제 + 북마크 수 감소 (명언이나 북마크가 없으면 404)
+    deleted = await service_delete_bookmark(user.user_id, quote_id)
+    if not deleted:
         raise HTTPException(status_code=404, detail="북마크가 존재하지 않습니다.")
 
-    # 3) 삭제
-    await bookmark.delete()
     return {"message": "북마크가 해제되었습니다."}
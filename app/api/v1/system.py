@@ -0,0 +1,40 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.jwt import token_cache
+from app.core.metrics import render_metrics
+from app.core.security import password_hash_stats
+from app.db.pool import pool_stats
+from app.services.auth_service import user_cache
+from app.services.quote_popularity import bookmark_count_reconciler, popular_quotes
+from app.services.quote_scheduler import quote_refresh_scheduler
+
+router = APIRouter(prefix="/system", tags=["system"])
+# Prometheus가 기본으로 긁어가는 경로(/metrics)는 prefix 없이 둡니다.
+metrics_router = APIRouter(tags=["system"])
+
+
+@metrics_router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """
+    - Prometheus 텍스트 형식 지표 (워커 프로세스별 값)
+    """
+    return PlainTextResponse(
+        render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+@router.get("/stats")
+async def get_stats():
+    """
+    - 프로세스 내 캐시 등 운영 지표를 반환합니다. (워커 프로세스별 값)
+    """
+    return {
+        "db_pool": pool_stats.stats(),
+        "user_cache": user_cache.stats(),
+        "token_cache": token_cache.stats(),
+        "password_hash": password_hash_stats.stats(),
+        "quote_refresh": quote_refresh_scheduler.stats(),
+        "popular_quotes": popular_quotes.stats(),
+        "bookmark_reconcile": bookmark_count_reconciler.stats(),
+    }
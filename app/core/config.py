@@ -10,6 +10,71 @@ class Settings(BaseSettings):
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
 
+    # DB 커넥션 풀 (워커 프로세스마다 따로 만들어지므로
+    # 워커 수 × DB_POOL_MAX_SIZE 가 Postgres max_connections 보다 작아야 합니다)
+    DB_POOL_MIN_SIZE: int = 1
+    DB_POOL_MAX_SIZE: int = 10
+    # 이 시간(초) 동안 안 쓰인 연결 / 이 횟수만큼 쿼리를 실행한 연결은 닫고 새로 엽니다.
+    DB_POOL_MAX_INACTIVE_LIFETIME_SECONDS: float = 300.0
+    DB_POOL_MAX_QUERIES: int = 50000
+    # 풀이 가득 찼을 때 연결을 기다리는 최대 시간(초), 넘으면 PoolExhausted (API는 503)
+    DB_POOL_ACQUIRE_TIMEOUT_SECONDS: float = 10.0
+    # 연결별 prepared statement 캐시 (PgBouncer transaction 모드에서는 0)
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    # 쿼리 하나의 최대 실행 시간(초)
+    DB_COMMAND_TIMEOUT_SECONDS: float = 30.0
+
+    # 랜덤 명언 추첨용 id 목록을 DB와 다시 비교하는 주기(초)
+    QUOTE_SAMPLER_REFRESH_SECONDS: float = 30.0
+
+    # get_current_user 사용자 캐시 (최대 개수 / 유지 시간(초))
+    USER_CACHE_SIZE: int = 10000
+    USER_CACHE_TTL_SECONDS: float = 60.0
+
+    # 서명 검증이 끝난 JWT claims 캐시 최대 개수
+    TOKEN_CACHE_SIZE: int = 10000
+
+    # 비밀번호 해싱 (bcrypt cost / 전용 스레드 수 / 대기 가능한 최대 작업 수)
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
+
+    # 명언 대량 저장 시 INSERT 한 번에 넣을 행 수
+    QUOTE_IMPORT_BATCH_SIZE: int = 500
+
+    # 백그라운드 명언 수집
+    # (사용 여부 / 반복 주기(초) / 수집 페이지 수 / 동시 요청 / 초당 요청)
+    QUOTE_REFRESH_ENABLED: bool = True
+    QUOTE_REFRESH_INTERVAL_SECONDS: float = 6 * 60 * 60
+    QUOTE_SCRAPE_PAGES: int = 1
+    QUOTE_SCRAPE_CONCURRENCY: int = 4
+    QUOTE_SCRAPE_REQUESTS_PER_SECOND: float = 5.0
+    # 스크래핑한 HTML을 파싱할 프로세스 수 (0이면 이벤트 루프에서 직접 파싱)
+    QUOTE_PARSE_WORKERS: int = 2
+
+    # 인기 명언(북마크 많은 순) 메모리 캐시 (보관 개수 / 갱신 주기(초))
+    QUOTE_POPULAR_SIZE: int = 100
+    QUOTE_POPULAR_REFRESH_SECONDS: float = 10.0
+    # bookmark_count를 bookmarks 테이블과 맞추는 보정 작업 (사용 여부 / 주기(초))
+    BOOKMARK_RECONCILE_ENABLED: bool = True
+    BOOKMARK_RECONCILE_INTERVAL_SECONDS: float = 60 * 60
+    # 보정 작업이 한 트랜잭션에서 잠그고 고칠 명언 수 (id 범위 단위)
+    BOOKMARK_RECONCILE_BATCH_SIZE: int = 1000
+
+    # 일기 가져오기 (bulk_create 한 번에 넣을 개수 / 한 줄 최대 크기)
+    DIARY_IMPORT_BATCH_SIZE: int = 500
+    DIARY_IMPORT_MAX_LINE_BYTES: int = 1024 * 1024
+
+    # 일기 검색: 유사도 순위를 매길 최근 일치 일기 수 상한
+    # (흔한 검색어도 최근 N개만 점수를 계산하므로 일기 수에 비례해 느려지지 않음)
+    DIARY_SEARCH_MAX_CANDIDATES: int = 1000
+
+    # 일기 내보내기 (DB에서 한 번에 읽을 행 수)
+    DIARY_EXPORT_CHUNK_SIZE: int = 500
+
+    # 목록 응답을 Pydantic 검증 없이 orjson으로 바로 직렬화 (optional dependency "fast")
+    FAST_JSON_RESPONSES: bool = False
+
     @property
     def DATABASE_URL(self) -> str:
         return f"postgres://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
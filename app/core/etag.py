@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from fastapi import HTTPException, Response
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# 브라우저가 응답을 저장하되 쓸 때마다 If-None-Match로 다시 확인하게 합니다.
+# (토큰마다 내용이 다르므로 공유 캐시에는 저장하지 않음)
+_REVALIDATE_HEADERS = {"Cache-Control": "private, no-cache", "Vary": "Authorization"}
+
+
+def _micros(value: datetime) -> int:
+    delta = value.astimezone(timezone.utc) - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def timestamp_etag(updated_at: datetime) -> str:
+    """
+    updated_at(마이크로초)을 그대로 담은 강한 ETag.
+    If-Match로 돌아오면 parse_if_match로 다시 시각으로 바꿉니다.
+    """
+    return f'"{_micros(updated_at)}"'
+
+
+def version_etag(*parts: object) -> str:
+    """
+    목록처럼 여러 행으로 만든 응답용 약한 ETag. (예: 리소스, user_id, 버전)
+    datetime은 마이크로초 정수로 바꿔 담습니다.
+    """
+    values = (_micros(p) if isinstance(p, datetime) else p for p in parts)
+    return 'W/"' + "-".join(str(v) for v in values) + '"'
+
+
+def not_modified(if_none_match: Optional[str], etag: str) -> Optional[Response]:
+    """
+    If-None-Match 가 etag와 (약한 비교로) 일치하면 304 응답을, 아니면 None을 반환합니다.
+    """
+    if if_none_match is None:
+        return None
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return Response(
+                status_code=304, headers={"ETag": etag, **_REVALIDATE_HEADERS}
+            )
+    return None
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """
+    200 응답에 ETag와 재검증 헤더를 붙입니다.
+    """
+    response.headers["ETag"] = etag
+    response.headers.update(_REVALIDATE_HEADERS)
+
+
+def parse_if_match(if_match: Optional[str]) -> Optional[datetime]:
+    """
+    If-Match 헤더를 updated_at 시각으로 바꿉니다.
+    - 헤더가 없거나 * 이면 None (조건 없음)
+    - 해석할 수 없는 값은 어떤 버전과도 일치하지 않으므로 412
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+    try:
+        micros = int(if_match.strip().removeprefix("W/").strip('"'))
+    except ValueError:
+        raise HTTPException(status_code=412, detail="If-Match 값이 올바르지 않습니다.")
+    return _EPOCH + timedelta(microseconds=micros)
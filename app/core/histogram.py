@@ -0,0 +1,48 @@
+import bisect
+from typing import Sequence
+
+# 지연 시간(초)용 기본 구간 (Prometheus 기본값과 같음)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """
+    관측값을 고정 구간(buckets)별 개수로 세는 히스토그램
+    - 메모리는 구간 수만큼만 씁니다.
+    - snapshot()의 buckets는 Prometheus처럼 누적 개수 ("le" 이하)
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """
+        [(구간 상한, 상한 이하 개수), ..., (inf, 전체 개수)]
+        """
+        result = []
+        total = 0
+        for upper, count in zip((*self.buckets, float("inf")), self._counts):
+            total += count
+            result.append((upper, total))
+        return result
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "max": round(self.max, 6),
+            "buckets": {
+                ("+Inf" if upper == float("inf") else str(upper)): count
+                for upper, count in self.cumulative()
+            },
+        }
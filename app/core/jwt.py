@@ -1,13 +1,28 @@
+import hashlib
+import time
+
 from jose import jwt, JWTError
 from datetime import datetime, timedelta, timezone
+from app.core.cache import TTLCache
 from app.core.config import settings
 
 JWT_SECRET_KEY = settings.JWT_SECRET_KEY
 JWT_ALGORITHM = settings.JWT_ALGORITHM
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 
+# 서명 검증이 끝난 토큰의 claims 캐시 (key: 토큰 sha256, 만료: 토큰의 exp)
+token_cache = TTLCache(maxsize=settings.TOKEN_CACHE_SIZE)
+
+
+def password_version(password_hash: str) -> str:
+    """
+    비밀번호 해시의 짧은 지문 (토큰의 pwv claim)
+    - 비밀번호가 바뀌면 달라지므로 그 전에 발급된 토큰을 거부할 수 있습니다.
+    """
+    return hashlib.sha256(password_hash.encode("utf-8")).hexdigest()[:16]
+
 
-def create_access_token(subject: str) -> str:
+def create_access_token(subject: str, pwv: str | None = None) -> str:
     now = datetime.now(timezone.utc)
     exp = now + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
 
@@ -16,12 +31,30 @@ def create_access_token(subject: str) -> str:
         "iat": int(now.timestamp()),
         "exp": int(exp.timestamp()),
     }
+    if pwv is not None:
+        payload["pwv"] = pwv  # password_version(user.password_hash)
 
     return jwt.encode(payload, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
 
 
 def decode_token(token: str) -> dict:
+    """
+    토큰을 검증하고 claims를 반환합니다. 유효하지 않으면 빈 dict.
+    - 같은 토큰은 프로세스당 한 번만 서명 검증하고, exp까지 캐시된 claims를 사용합니다.
+    """
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    claims = token_cache.get(key)
+    if claims is not None:
+        return dict(claims)
+
     try:
-        return jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
+        claims = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
     except JWTError:
         return {}
+
+    exp = claims.get("exp")
+    if isinstance(exp, (int, float)):
+        # exp(unix time)를 캐시가 쓰는 monotonic 시각으로 변환
+        token_cache.set(key, claims, expires_at=time.monotonic() + (exp - time.time()))
+
+    return dict(claims)
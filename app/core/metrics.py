@@ -0,0 +1,210 @@
+"""
+Prometheus 텍스트 형식 지표
+
+- MetricsMiddleware: 요청 수 / 지연 시간 / 처리 중인 요청 / 요청당 DB 쿼리 수·시간
+- route_in_progress: 라우팅 직후 라우트 템플릿(/v1/diary/{diary_id})을 알리는 의존성
+- render_metrics(): GET /metrics 본문
+라벨은 실제 경로가 아니라 라우트 템플릿이라 id 개수만큼 시계열이 늘지 않습니다.
+"""
+
+import time
+from collections import defaultdict
+from typing import Iterable, Optional
+
+from fastapi import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.histogram import DEFAULT_BUCKETS, Histogram
+from app.db.pool import pool_stats
+from app.db.query_stats import QueryStats, query_totals, track_queries
+
+# 라우트에 걸리지 않은 요청(404 등)의 라벨
+UNMATCHED_ROUTE = "<unmatched>"
+
+# 요청당 쿼리 수 구간 (N+1이면 오른쪽 구간으로 몰립니다)
+DB_QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+# (method, route) 라벨별 값
+_requests_total: dict[tuple[str, str, str], int] = defaultdict(int)
+_in_progress: dict[tuple[str, str], int] = defaultdict(int)
+_durations: dict[tuple[str, str], Histogram] = {}
+_db_queries: dict[tuple[str, str], Histogram] = {}
+_db_durations: dict[tuple[str, str], Histogram] = {}
+
+
+class _RequestState:
+    __slots__ = ("route", "queries")
+
+    def __init__(self, queries: QueryStats):
+        self.route: Optional[str] = None
+        self.queries = queries
+
+
+def _histogram(
+    store: dict[tuple[str, str], Histogram], key: tuple[str, str], buckets
+) -> Histogram:
+    histogram = store.get(key)
+    if histogram is None:
+        histogram = store[key] = Histogram(buckets)
+    return histogram
+
+
+async def route_in_progress(request: Request) -> None:
+    """
+    앱 전체 의존성으로 등록합니다. (FastAPI(dependencies=[Depends(route_in_progress)]))
+    라우팅이 끝난 시점에 라우트 템플릿을 기록하고 처리 중 요청 수를 올립니다.
+    """
+    state: Optional[_RequestState] = request.scope.get("metrics")
+    if state is None or state.route is not None:
+        return
+    state.route = request.scope["route"].path
+    _in_progress[(request.method, state.route)] += 1
+
+
+class MetricsMiddleware:
+    """
+    순수 ASGI 미들웨어 (BaseHTTPMiddleware보다 요청당 비용이 적습니다)
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        with track_queries() as queries:
+            state = scope["metrics"] = _RequestState(queries)
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                _observe(scope, state, status_code, time.perf_counter() - started)
+
+
+def _observe(
+    scope: Scope, state: _RequestState, status_code: int, elapsed: float
+) -> None:
+    method = scope["method"]
+    route = state.route
+    if route is None:
+        # 앱 의존성을 거치지 않은 요청은 라우팅 결과로 판단합니다.
+        if scope.get("route") is not None:
+            route = scope["route"].path
+        elif "endpoint" in scope:
+            # Mount(/static 등)는 마운트 경로가 root_path에 들어 있습니다.
+            route = scope.get("root_path") or "/"
+        else:
+            route = UNMATCHED_ROUTE
+    else:
+        _in_progress[(method, route)] -= 1
+
+    key = (method, route)
+    _requests_total[(method, route, str(status_code))] += 1
+    _histogram(_durations, key, DEFAULT_BUCKETS).observe(elapsed)
+    _histogram(_db_queries, key, DB_QUERY_COUNT_BUCKETS).observe(state.queries.count)
+    _histogram(_db_durations, key, DEFAULT_BUCKETS).observe(state.queries.seconds)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels: str) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _header(name: str, kind: str, help_text: str) -> list[str]:
+    return [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+
+
+def _format_le(upper: float) -> str:
+    return "+Inf" if upper == float("inf") else repr(float(upper))
+
+
+def _histogram_lines(
+    name: str, histogram: Histogram, labels: dict[str, str]
+) -> Iterable[str]:
+    for upper, count in histogram.cumulative():
+        yield f"{name}_bucket{_labels(**labels, le=_format_le(upper))} {count}"
+    yield f"{name}_sum{_labels(**labels)} {histogram.sum}"
+    yield f"{name}_count{_labels(**labels)} {histogram.count}"
+
+
+def _histogram_family(
+    name: str, help_text: str, store: dict[tuple[str, str], Histogram]
+) -> list[str]:
+    lines = _header(name, "histogram", help_text)
+    for (method, route), histogram in sorted(store.items()):
+        lines.extend(
+            _histogram_lines(name, histogram, {"method": method, "route": route})
+        )
+    return lines
+
+
+def render_metrics() -> str:
+    """
+    Prometheus text exposition format (0.0.4)
+    """
+    lines = _header("http_requests_total", "counter", "HTTP 요청 수")
+    for (method, route, status), count in sorted(_requests_total.items()):
+        labels = _labels(method=method, route=route, status=status)
+        lines.append(f"http_requests_total{labels} {count}")
+
+    lines += _header("http_requests_in_progress", "gauge", "처리 중인 HTTP 요청 수")
+    for (method, route), count in sorted(_in_progress.items()):
+        lines.append(
+            f"http_requests_in_progress{_labels(method=method, route=route)} {count}"
+        )
+
+    lines += _histogram_family(
+        "http_request_duration_seconds", "HTTP 요청 처리 시간(초)", _durations
+    )
+    lines += _histogram_family(
+        "http_request_db_queries", "HTTP 요청 1회당 DB 쿼리 수", _db_queries
+    )
+    lines += _histogram_family(
+        "http_request_db_duration_seconds",
+        "HTTP 요청 1회당 DB 쿼리 시간 합계(초)",
+        _db_durations,
+    )
+
+    lines += _header("db_queries_total", "counter", "DB 쿼리 수 (백그라운드 작업 포함)")
+    lines.append(f"db_queries_total {query_totals.count}")
+    lines += _header(
+        "db_query_duration_seconds_total", "counter", "DB 쿼리 시간 합계(초)"
+    )
+    lines.append(f"db_query_duration_seconds_total {query_totals.seconds}")
+
+    pool = pool_stats.stats()
+    for field, help_text in (
+        ("size", "열려 있는 DB 연결 수"),
+        ("idle", "쉬고 있는 DB 연결 수"),
+        ("in_use", "사용 중인 DB 연결 수"),
+        ("waiting", "DB 연결을 기다리는 요청 수"),
+    ):
+        lines += _header(f"db_pool_{field}", "gauge", help_text)
+        lines.append(f"db_pool_{field} {pool[field]}")
+    lines += _header(
+        "db_pool_acquire_timeouts_total", "counter", "DB 연결 대기 시간 초과 횟수"
+    )
+    lines.append(f"db_pool_acquire_timeouts_total {pool['timeouts']}")
+    lines += _header(
+        "db_pool_acquire_wait_seconds", "histogram", "DB 연결을 받기까지 걸린 시간(초)"
+    )
+    lines.extend(
+        _histogram_lines("db_pool_acquire_wait_seconds", pool_stats.acquire_wait, {})
+    )
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,50 @@
+import base64
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable, Sequence
+
+from fastapi import HTTPException
+
+
+def encode_cursor(created_at: datetime, row_id: int, *extra: Any) -> str:
+    """
+    (created_at, id[, 추가 정렬 키]) 키셋 위치를
+    클라이언트에 넘길 불투명한 문자열로 만듭니다.
+    """
+    raw = json.dumps([created_at.isoformat(), row_id, *extra], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decimal_key(value: Any) -> Decimal:
+    """
+    문자열로 담은 유한한 소수 정렬 키 (예: 검색 유사도 score)
+    """
+    if not isinstance(value, str):
+        raise TypeError("decimal key must be a string")
+    number = Decimal(value)
+    if not number.is_finite():
+        raise ValueError("decimal key must be finite")
+    return number
+
+
+def decode_cursor(cursor: str, extra: Sequence[Callable[[Any], Any]] = ()) -> tuple:
+    """
+    encode_cursor의 역변환.
+    extra: 추가 정렬 키마다 값을 검증 / 변환할 함수 (예: (decimal_key,))
+    반환값: (created_at, id, *추가 정렬 키)
+    형식이 맞지 않으면 (변조된 cursor 포함) 400
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        parts = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(parts, list) or len(parts) != 2 + len(extra):
+            raise ValueError("cursor length")
+        return (
+            datetime.fromisoformat(parts[0]),
+            int(parts[1]),
+            *(parse(value) for parse, value in zip(extra, parts[2:])),
+        )
+    except (ValueError, TypeError, ArithmeticError):
+        # ArithmeticError: Decimal 변환 실패(InvalidOperation)
+        raise HTTPException(status_code=400, detail="잘못된 cursor 입니다.")
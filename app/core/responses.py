@@ -0,0 +1,87 @@
+"""
+큰 목록 응답용 빠른 JSON 경로 (FAST_JSON_RESPONSES=true 일 때)
+
+response_model 이 있으면 FastAPI가 ORM 행마다 Pydantic 검증을 거쳐 직렬화합니다.
+이미 DB 스키마로 타입이 보장된 행은 검증 없이 응답 스키마의 필드만 골라
+orjson으로 바로 bytes를 만듭니다.
+- 기본 응답 클래스는 바꾸지 않습니다. (FastAPI가 response_model을 Pydantic으로
+  바로 bytes로 만드는 경로는 기본 클래스일 때만 쓰입니다)
+- 응답 모양은 response_model 경로와 같습니다. (OpenAPI 문서도 그대로)
+- orjson이 없으면(optional dependency "fast") 항상 기존 경로를 씁니다.
+"""
+
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Iterable, Optional
+
+from fastapi import Response
+from pydantic import BaseModel
+
+from app.core.config import settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Pydantic JSON과 같은 모양 (UTC는 "Z")
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS if orjson else 0
+
+
+def fast_json_enabled() -> bool:
+    return settings.FAST_JSON_RESPONSES and orjson is not None
+
+
+def _default(value: Any) -> Any:
+    # orjson이 직접 다루지 못하는 타입 (raw SQL의 numeric 등)
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+
+
+@lru_cache(maxsize=None)
+def _fields(schema: type[BaseModel]) -> tuple[tuple[str, str], ...]:
+    # (응답 키, 읽을 이름) - validation_alias가 있으면 그 이름으로 읽습니다.
+    return tuple(
+        (name, alias if isinstance(alias, str) else name)
+        for name, alias in (
+            (name, field.validation_alias)
+            for name, field in schema.model_fields.items()
+        )
+    )
+
+
+def rows_to_dicts(rows: Iterable[Any], schema: type[BaseModel]) -> list[dict]:
+    """
+    ORM 객체 또는 .values() dict 목록에서 schema의 필드만 골라 dict 목록으로 만듭니다.
+    (검증 / 변환 없음, validation_alias는 response_model 경로와 같게 따름)
+    """
+    fields = _fields(schema)
+    return [
+        {key: row[source] for key, source in fields}
+        if isinstance(row, dict)
+        else {key: getattr(row, source) for key, source in fields}
+        for row in rows
+    ]
+
+
+def fast_json(
+    content: Any, response: Optional[Response] = None, status_code: int = 200
+) -> FastJSONResponse:
+    """
+    content를 바로 직렬화한 응답을 만듭니다.
+    - response: 핸들러가 주입받은 Response에 붙인 헤더(ETag 등)를 옮겨 담습니다.
+    """
+    fast = FastJSONResponse(content, status_code=status_code)
+    if response is not None:
+        fast.raw_headers.extend(
+            (k, v) for k, v in response.raw_headers if k != b"content-length"
+        )
+    return fast
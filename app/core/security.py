@@ -1,16 +1,129 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
 from passlib.context import CryptContext
 from fastapi import HTTPException
 
-_pwd = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.config import settings
 
+T = TypeVar("T")
 
-def hash_password(password: str) -> str:
+# 저장된 해시의 rounds가 BCRYPT_ROUNDS와 다르면 needs_update로 판단해 로그인 시 다시 해싱합니다.
+_pwd = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+)
+
+# bcrypt는 GIL을 놓고 계산하므로 스레드 풀로도 여러 코어를 사용합니다.
+_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"
+)
+
+
+class PasswordHashStats:
+    """
+    해싱 스레드 풀 지표 (대기 시간 = 풀에 넣은 뒤 실행되기까지, 해시 시간 = bcrypt 계산)
+    """
+
+    def __init__(self):
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.queue_wait_seconds_total = 0.0
+        self.queue_wait_seconds_max = 0.0
+        self.hash_seconds_total = 0.0
+        self.hash_seconds_max = 0.0
+
+    def record(self, queue_wait: float, hash_time: float) -> None:
+        self.completed += 1
+        self.queue_wait_seconds_total += queue_wait
+        self.queue_wait_seconds_max = max(self.queue_wait_seconds_max, queue_wait)
+        self.hash_seconds_total += hash_time
+        self.hash_seconds_max = max(self.hash_seconds_max, hash_time)
+
+    def stats(self) -> dict:
+        return {
+            "workers": settings.PASSWORD_HASH_WORKERS,
+            "max_pending": settings.PASSWORD_HASH_MAX_PENDING,
+            "bcrypt_rounds": settings.BCRYPT_ROUNDS,
+            "pending": self.pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "queue_wait_seconds_total": round(self.queue_wait_seconds_total, 6),
+            "queue_wait_seconds_max": round(self.queue_wait_seconds_max, 6),
+            "hash_seconds_total": round(self.hash_seconds_total, 6),
+            "hash_seconds_max": round(self.hash_seconds_max, 6),
+        }
+
+
+password_hash_stats = PasswordHashStats()
+
+
+def _check_length(password: str) -> None:
     if len(password.encode("utf-8")) > 72:
         raise HTTPException(
             status_code=400, detail="Password too long (max 72 bytes for bcrypt)"
         )
+
+
+def hash_password(password: str) -> str:
+    _check_length(password)
     return _pwd.hash(password)
 
 
 def verify_password(plain_password: str, password_hash: str) -> bool:
     return _pwd.verify(plain_password, password_hash)
+
+
+async def _run_in_pool(fn: Callable[..., T], *args) -> T:
+    """
+    fn을 해싱 전용 스레드 풀에서 실행해 이벤트 루프를 막지 않습니다.
+    대기 중인 작업이 PASSWORD_HASH_MAX_PENDING 이상이면 503으로 바로 거절합니다.
+    """
+    stats = password_hash_stats
+    if stats.pending >= settings.PASSWORD_HASH_MAX_PENDING:
+        stats.rejected += 1
+        raise HTTPException(
+            status_code=503, detail="요청이 많습니다. 잠시 후 다시 시도해 주세요."
+        )
+
+    submitted = time.perf_counter()
+
+    def _timed():
+        started = time.perf_counter()
+        result = fn(*args)
+        return result, started, time.perf_counter()
+
+    stats.pending += 1
+    try:
+        loop = asyncio.get_running_loop()
+        result, started, finished = await loop.run_in_executor(_executor, _timed)
+    finally:
+        stats.pending -= 1
+
+    stats.record(queue_wait=started - submitted, hash_time=finished - started)
+    return result
+
+
+async def hash_password_async(password: str) -> str:
+    _check_length(password)
+    return await _run_in_pool(_pwd.hash, password)
+
+
+async def verify_password_async(plain_password: str, password_hash: str) -> bool:
+    return await _run_in_pool(_pwd.verify, plain_password, password_hash)
+
+
+async def verify_and_update_password_async(
+    plain_password: str, password_hash: str
+) -> tuple[bool, Optional[str]]:
+    """
+    비밀번호를 검증하고, 저장된 해시의 cost가 BCRYPT_ROUNDS와 다르면 새 해시를 함께 반환합니다.
+    반환값: (일치 여부, 새 해시 또는 None)
+    """
+    return await _run_in_pool(_pwd.verify_and_update, plain_password, password_hash)
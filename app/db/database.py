@@ -9,11 +9,33 @@ MODELS = [
     "app.models.question",
     "app.models.bookmark",
     "app.models.user_question",
+    "app.models.question_deck",
+    "app.models.user_version",
     "aerich.models",  # Aerich용 모델 추가
 ]
 
 TORTOISE_CONFIG = {
-    "connections": {"default": settings.DATABASE_URL},
+    "connections": {
+        "default": {
+            # asyncpg 풀에 대기 시간 계측을 더한 엔진 (app/db/pool.py)
+            "engine": "app.db.pool",
+            "credentials": {
+                "host": settings.POSTGRES_HOST,
+                "port": settings.POSTGRES_PORT,
+                "user": settings.POSTGRES_USER,
+                "password": settings.POSTGRES_PASSWORD,
+                "database": settings.POSTGRES_DB,
+                "minsize": settings.DB_POOL_MIN_SIZE,
+                "maxsize": settings.DB_POOL_MAX_SIZE,
+                "max_inactive_connection_lifetime": (
+                    settings.DB_POOL_MAX_INACTIVE_LIFETIME_SECONDS
+                ),
+                "max_queries": settings.DB_POOL_MAX_QUERIES,
+                "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+                "command_timeout": settings.DB_COMMAND_TIMEOUT_SECONDS,
+            },
+        }
+    },
     "apps": {
         "models": {
             "models": MODELS,
@@ -0,0 +1,124 @@
+"""
+계측이 붙은 asyncpg 커넥션 풀 엔진
+
+TORTOISE_CONFIG 의 "engine": "app.db.pool" 로 사용합니다.
+tortoise가 풀에서 연결을 꺼낼 때(쿼리, 트랜잭션 시작)마다 대기 시간을 재서
+요청이 쿼리 자체가 아니라 연결을 기다리느라 느린지 구분할 수 있게 합니다.
+쿼리 횟수 / 시간은 QueryTimingMixin(app.db.query_stats)으로 셉니다.
+"""
+
+import time
+from typing import Any, Optional
+
+import asyncpg
+from tortoise.backends.asyncpg.client import AsyncpgDBClient, TransactionWrapper
+from tortoise.backends.base.client import (
+    NestedTransactionContext,
+    TransactionContext,
+    TransactionContextPooled,
+)
+
+from app.core.config import settings
+from app.core.histogram import DEFAULT_BUCKETS, Histogram
+from app.db.query_stats import QueryTimingMixin
+
+# 연결 대기 시간은 대부분 0에 가까우므로 짧은 구간을 촘촘히 둡니다.
+ACQUIRE_WAIT_BUCKETS = (0.0005, 0.001, 0.0025, *DEFAULT_BUCKETS)
+
+
+class PoolExhausted(Exception):
+    """
+    DB_POOL_ACQUIRE_TIMEOUT_SECONDS 안에 풀에서 연결을 받지 못했습니다.
+    (API에서는 app.main의 예외 핸들러가 503으로 바꿉니다)
+    """
+
+
+class PoolStats:
+    """
+    커넥션 풀 지표 (워커 프로세스별 값)
+    - in_use / idle / size: asyncpg 풀의 현재 상태
+    - waiting: 지금 연결을 기다리는 중인 요청 수
+    - acquire_wait_seconds: 연결을 받기까지 걸린 시간 분포
+    - timeouts: DB_POOL_ACQUIRE_TIMEOUT_SECONDS 안에 연결을 못 받은 횟수
+    """
+
+    def __init__(self):
+        self.pool: Optional[asyncpg.Pool] = None
+        self.waiting = 0
+        self.acquired = 0
+        self.timeouts = 0
+        self.acquire_wait = Histogram(ACQUIRE_WAIT_BUCKETS)
+
+    def stats(self) -> dict:
+        size = idle = 0
+        if self.pool is not None:
+            size = self.pool.get_size()
+            idle = self.pool.get_idle_size()
+        return {
+            "min_size": settings.DB_POOL_MIN_SIZE,
+            "max_size": settings.DB_POOL_MAX_SIZE,
+            "size": size,
+            "idle": idle,
+            "in_use": size - idle,
+            "waiting": self.waiting,
+            "acquired": self.acquired,
+            "timeouts": self.timeouts,
+            "acquire_wait_seconds": self.acquire_wait.snapshot(),
+        }
+
+
+pool_stats = PoolStats()
+
+
+class InstrumentedPool:
+    """
+    asyncpg.Pool 을 감싸 acquire() 대기 시간을 기록합니다.
+    나머지 메서드(release, close, expire_connections ...)는 그대로 넘깁니다.
+    """
+
+    def __init__(self, pool: asyncpg.Pool, stats: PoolStats, timeout: float):
+        self._pool = pool
+        self._stats = stats
+        self._timeout = timeout
+
+    async def acquire(self) -> asyncpg.Connection:
+        stats = self._stats
+        stats.waiting += 1
+        started = time.perf_counter()
+        try:
+            connection = await self._pool.acquire(timeout=self._timeout)
+        except TimeoutError:
+            stats.timeouts += 1
+            raise PoolExhausted(
+                f"{self._timeout}초 안에 DB 연결을 받지 못했습니다."
+            ) from None
+        finally:
+            stats.waiting -= 1
+            stats.acquire_wait.observe(time.perf_counter() - started)
+        stats.acquired += 1
+        return connection
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._pool, name)
+
+
+class InstrumentedTransactionWrapper(QueryTimingMixin, TransactionWrapper):
+    def _in_transaction(self) -> TransactionContext:
+        return NestedTransactionContext(InstrumentedTransactionWrapper(self))
+
+
+class InstrumentedAsyncpgDBClient(QueryTimingMixin, AsyncpgDBClient):
+    # 트랜잭션 안의 쿼리도 같은 방식으로 세도록 트랜잭션 래퍼를 바꿉니다.
+    def _in_transaction(self) -> TransactionContext:
+        return TransactionContextPooled(InstrumentedTransactionWrapper(self))
+
+    async def create_pool(self, **kwargs) -> InstrumentedPool:
+        pool = await super().create_pool(**kwargs)
+        pool_stats.pool = pool
+        return InstrumentedPool(
+            pool, pool_stats, timeout=settings.DB_POOL_ACQUIRE_TIMEOUT_SECONDS
+        )
+
+
+# tortoise가 engine 모듈에서 찾는 이름
+client_class = InstrumentedAsyncpgDBClient
@@ -0,0 +1,126 @@
+"""
+DB 쿼리 횟수 / 시간 집계
+
+DB 클라이언트(app.db.pool)의 execute_* 메서드를 QueryTimingMixin으로 감싸
+ORM 쿼리와 raw SQL(app.db.raw_sql)을 모두 셉니다.
+- 프로세스 전체 합계: query_totals
+- 요청(또는 작업) 단위: track_queries() 로 시작한 QueryStats
+- capture=True 로 시작하면 SQL 문과 호출 위치까지 기록합니다. (테스트의 쿼리 예산)
+"""
+
+import os
+import time
+import traceback
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, List, Optional, Tuple
+
+# 호출 위치는 app/ 아래 프레임만 남깁니다. (DB 계층 자체는 제외)
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_DB_DIR = os.path.join(_APP_DIR, "db")
+
+
+class QueryStats:
+    __slots__ = ("count", "seconds", "parent", "statements")
+
+    def __init__(self, parent: Optional["QueryStats"] = None, capture: bool = False):
+        self.count = 0
+        self.seconds = 0.0
+        # 바깥에서 이미 집계 중이면 그쪽에도 같이 더합니다. (테스트 안의 요청 등)
+        self.parent = parent
+        # (SQL, 호출 위치) 목록 - capture=True 일 때만
+        self.statements: Optional[List[Tuple[str, List[str]]]] = [] if capture else None
+
+
+def _call_site() -> List[str]:
+    """
+    현재 호출 스택에서 app/ 아래(app/db 제외) 프레임을 "파일:줄 함수" 형태로
+    반환합니다.
+    """
+    site = []
+    for frame in traceback.extract_stack():
+        filename = os.path.abspath(frame.filename)
+        if not filename.startswith(_APP_DIR) or filename.startswith(_DB_DIR):
+            continue
+        path = os.path.relpath(filename, os.path.dirname(_APP_DIR))
+        site.append(f"{path}:{frame.lineno} {frame.name}")
+    return site
+
+
+# 프로세스 전체 (백그라운드 작업 포함)
+query_totals = QueryStats()
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries(capture: bool = False) -> Iterator[QueryStats]:
+    """
+    with 블록 안(같은 컨텍스트)에서 나가는 쿼리를 새 QueryStats에 모읍니다.
+    - capture: 실행된 SQL 문과 호출 위치도 statements에 남김 (느리므로 테스트용)
+    """
+    stats = QueryStats(parent=_current.get(), capture=capture)
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def _record(elapsed: float, query: str) -> None:
+    query_totals.count += 1
+    query_totals.seconds += elapsed
+    stats = _current.get()
+    site = None
+    while stats is not None:
+        stats.count += 1
+        stats.seconds += elapsed
+        if stats.statements is not None:
+            if site is None:
+                site = _call_site()
+            stats.statements.append((query, site))
+        stats = stats.parent
+
+
+class QueryTimingMixin:
+    """
+    tortoise DB 클라이언트의 쿼리 실행 메서드마다 실행 시간을 기록합니다.
+    (클라이언트 클래스보다 앞에 상속)
+    """
+
+    async def execute_insert(self, query: str, values: list) -> Any:
+        started = time.perf_counter()
+        try:
+            return await super().execute_insert(query, values)
+        finally:
+            _record(time.perf_counter() - started, query)
+
+    async def execute_query(self, query: str, values: Optional[list] = None) -> Any:
+        started = time.perf_counter()
+        try:
+            return await super().execute_query(query, values)
+        finally:
+            _record(time.perf_counter() - started, query)
+
+    async def execute_query_dict(
+        self, query: str, values: Optional[list] = None
+    ) -> Any:
+        started = time.perf_counter()
+        try:
+            return await super().execute_query_dict(query, values)
+        finally:
+            _record(time.perf_counter() - started, query)
+
+    async def execute_many(self, query: str, values: list) -> Any:
+        started = time.perf_counter()
+        try:
+            return await super().execute_many(query, values)
+        finally:
+            _record(time.perf_counter() - started, query)
+
+    async def execute_script(self, query: str) -> Any:
+        started = time.perf_counter()
+        try:
+            return await super().execute_script(query)
+        finally:
+            _record(time.perf_counter() - started, query)
@@ -0,0 +1,97 @@
+import re
+from typing import Any, Optional, Sequence
+
+from tortoise import connections
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.transactions import in_transaction
+
+# PostgreSQL 스타일($1, $2 ...) 파라미터를 SQLite 번호 파라미터(?1, ?2 ...)로 바꿀 때 사용
+_PG_PARAM = re.compile(r"\$(\d+)")
+
+
+def _get_connection(
+    connection: Optional[BaseDBAsyncClient] = None,
+) -> BaseDBAsyncClient:
+    return connection or connections.get("default")
+
+
+def get_dialect(connection: Optional[BaseDBAsyncClient] = None) -> str:
+    """
+    "postgres" / "sqlite" 등 현재 연결의 SQL 방언
+    """
+    return _get_connection(connection).capabilities.dialect
+
+
+def _for_dialect(connection: BaseDBAsyncClient, sql: str) -> str:
+    if connection.capabilities.dialect == "sqlite":
+        return _PG_PARAM.sub(r"?\1", sql)
+    return sql
+
+
+async def fetch_all(
+    sql: str,
+    values: Sequence[Any] = (),
+    connection: Optional[BaseDBAsyncClient] = None,
+) -> list[dict]:
+    """
+    ORM으로 표현하기 어려운 쿼리(UPDATE ... RETURNING, ON CONFLICT 등)를 실행합니다.
+    - sql은 PostgreSQL 문법($1 파라미터)으로 작성합니다.
+    """
+    conn = _get_connection(connection)
+    return await conn.execute_query_dict(_for_dialect(conn, sql), list(values))
+
+
+async def fetch_one(
+    sql: str,
+    values: Sequence[Any] = (),
+    connection: Optional[BaseDBAsyncClient] = None,
+) -> Optional[dict]:
+    rows = await fetch_all(sql, values, connection)
+    return rows[0] if rows else None
+
+
+# copy_merge가 만드는 임시 테이블 이름 (merge_sql에서 이 이름으로 부릅니다)
+STAGING_TABLE = "_staging"
+
+
+async def copy_merge(
+    columns: dict[str, str],
+    records: Sequence[tuple],
+    merge_sql: str,
+    values: Sequence[Any] = (),
+) -> int:
+    """
+    records를 임시 스테이징 테이블에 한 번에 넣은 뒤 merge_sql 한 번으로
+    본 테이블에 합치고, merge_sql이 바꾼 행 수를 반환합니다. (한 트랜잭션)
+    - columns: {컬럼 이름: 타입} (records 튜플과 같은 순서)
+    - PostgreSQL: asyncpg copy_records_to_table (COPY ... FROM STDIN, 바이너리)
+    - 그 외(SQLite 테스트 DB): executemany INSERT
+    - 스테이징 테이블은 트랜잭션이 끝나면 지워집니다.
+    """
+    conn = _get_connection()
+    create_sql = "CREATE TEMP TABLE {} ({})".format(
+        STAGING_TABLE, ", ".join(f"{name} {type_}" for name, type_ in columns.items())
+    )
+
+    if conn.capabilities.dialect == "postgres":
+        async with conn.acquire_connection() as raw:
+            async with raw.transaction():
+                await raw.execute(f"{create_sql} ON COMMIT DROP")
+                await raw.copy_records_to_table(
+                    STAGING_TABLE, records=records, columns=list(columns)
+                )
+                status = await raw.execute(merge_sql, *values)
+        # "INSERT 0 123" / "UPDATE 123"
+        return int(status.rsplit(" ", 1)[-1])
+
+    # SQLite는 DDL도 트랜잭션에 묶이므로 실패하면 임시 테이블도 같이 롤백됩니다.
+    async with in_transaction() as tx:
+        await tx.execute_script(create_sql)
+        placeholders = ", ".join("?" for _ in columns)
+        await tx.execute_many(
+            f"INSERT INTO {STAGING_TABLE} VALUES ({placeholders})",
+            [list(record) for record in records],
+        )
+        changed, _ = await tx.execute_query(_for_dialect(tx, merge_sql), list(values))
+        await tx.execute_script(f"DROP TABLE {STAGING_TABLE}")
+    return changed
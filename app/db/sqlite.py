@@ -0,0 +1,33 @@
+"""
+쿼리 집계가 붙은 SQLite 엔진 (테스트용)
+
+TORTOISE_CONFIG 의 "engine": "app.db.sqlite" 로 사용합니다.
+app.db.pool 과 같은 QueryTimingMixin을 붙여 테스트에서도 요청별 쿼리 수를
+운영과 같은 방식으로 셀 수 있게 합니다.
+"""
+
+from tortoise.backends.base.client import NestedTransactionContext, TransactionContext
+from tortoise.backends.sqlite.client import (
+    SqliteClient,
+    SqliteTransactionContext,
+    SqliteTransactionWrapper,
+)
+
+from app.db.query_stats import QueryTimingMixin
+
+
+class InstrumentedSqliteTransactionWrapper(QueryTimingMixin, SqliteTransactionWrapper):
+    def _in_transaction(self) -> TransactionContext:
+        return NestedTransactionContext(InstrumentedSqliteTransactionWrapper(self))
+
+
+class InstrumentedSqliteClient(QueryTimingMixin, SqliteClient):
+    # 트랜잭션 안의 쿼리도 같은 방식으로 세도록 트랜잭션 래퍼를 바꿉니다.
+    def _in_transaction(self) -> TransactionContext:
+        return SqliteTransactionContext(
+            InstrumentedSqliteTransactionWrapper(self), self._lock
+        )
+
+
+# tortoise가 engine 모듈에서 찾는 이름
+client_class = InstrumentedSqliteClient
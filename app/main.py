@@ -1,45 +1,69 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse
 import os
 
 from app.api.v1.diary import diary_router
 from app.db.base import init_db
+from app.db.pool import PoolExhausted
 from app.api.v1.auth import router as auth_router
 from app.api.v1.question import router as question_router
 from app.api.v1.quote import router as quote_router
+from app.api.v1.system import metrics_router, router as system_router
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
-from app.scraping.quote_scraper import scrape_quotes
-from app.services.quote_service import service_save_bulk_quotes
+from app.core.config import settings
+from app.core.metrics import MetricsMiddleware, route_in_progress
+from app.scraping.quote_scraper import shutdown_parse_executor
+from app.services.quote_popularity import bookmark_count_reconciler
+from app.services.quote_sampler import quote_sampler
+from app.services.quote_scheduler import quote_refresh_scheduler
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # [Startup]
-    print("서버 시작: 명언 데이터를 수집합니다...")
-    try:
-        # HTTP 요청 대신 내부 함수를 직접 호출하여 DB에 저장
-        quotes = await scrape_quotes(page=1)
-        if quotes:
-            count = await service_save_bulk_quotes(quotes)
-            print(f"성공적으로 {count}개의 새로운 명언을 DB에 직접 저장했습니다.")
-    except Exception as e:
-        print(f"초기 스크레이핑 실패: {e}")
+    # 랜덤 명언 추첨용 id 목록 적재
+    loaded = await quote_sampler.load()
+    print(f"랜덤 명언 추첨 대상 {loaded}개를 메모리에 적재했습니다.")
+
+    # 명언 수집은 백그라운드에서 실행하고 서버는 바로 요청을 받습니다.
+    if settings.QUOTE_REFRESH_ENABLED:
+        quote_refresh_scheduler.start()
+    if settings.BOOKMARK_RECONCILE_ENABLED:
+        bookmark_count_reconciler.start()
 
     yield
+
+    await quote_refresh_scheduler.stop()
+    await bookmark_count_reconciler.stop()
+    shutdown_parse_executor()
     print("서버를 종료합니다.")
 
 
-app = FastAPI(lifespan=lifespan)
+# route_in_progress: 라우팅 직후 라우트 템플릿을 지표 미들웨어에 알려 줍니다.
+app = FastAPI(lifespan=lifespan, dependencies=[Depends(route_in_progress)])
 
 # DB 초기화
 init_db(app)
 
+
+# DB 연결 풀이 모자라면 잠시 후 다시 시도하도록 503
+@app.exception_handler(PoolExhausted)
+async def pool_exhausted_handler(request: Request, exc: PoolExhausted):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "DB 연결이 부족합니다. 잠시 후 다시 시도해주세요."},
+        headers={"Retry-After": "1"},
+    )
+
+
 app.include_router(auth_router)
 app.include_router(question_router)
 app.include_router(diary_router)
 app.include_router(quote_router)
+app.include_router(system_router)
+app.include_router(metrics_router)
 
 app.add_middleware(
     CORSMiddleware,
@@ -48,6 +72,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# 가장 바깥에서 CORS 처리까지 포함한 전체 요청 시간을 잽니다.
+app.add_middleware(MetricsMiddleware)
 
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
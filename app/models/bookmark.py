@@ -1,7 +1,10 @@
+from datetime import datetime
+
 from app.models.base_model import BaseModel
 from app.models.user import UserModel
 from app.models.quote import QuoteModel
 from tortoise import fields
+from tortoise.expressions import Q
 
 
 class BookmarkModel(BaseModel):
@@ -21,3 +24,46 @@ class BookmarkModel(BaseModel):
     class Meta:
         table = "bookmarks"
         unique_together = ("user", "quote")
+        # 내 북마크 최신순 목록 / 개수 (키셋 페이지네이션)
+        indexes = (("user_id", "created_at", "id"),)
+
+    @classmethod
+    async def get_page_by_user(
+        cls,
+        user_id: int,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+    ) -> list[dict]:
+        """
+        북마크한 명언을 북마크한 시각 최신순으로 가져옵니다.
+        - quotes 와 JOIN 한 쿼리 1회로 응답에 필요한 컬럼만 읽습니다.
+          (id / content / author / created_at 은 명언 컬럼)
+        after: 이전 페이지 마지막 북마크의 (created_at, id)
+        """
+        query = cls.filter(user_id=user_id)
+        if after is not None:
+            created_at, bookmark_id = after
+            query = query.filter(
+                Q(created_at__lt=created_at)
+                | Q(created_at=created_at, id__lt=bookmark_id)
+            )
+
+        return (
+            await query.order_by("-created_at", "-id")
+            .limit(limit)
+            .values(
+                id="quote__id",
+                content="quote__content",
+                author="quote__author",
+                created_at="quote__created_at",
+                bookmark_id="id",
+                bookmarked_at="created_at",
+            )
+        )
+
+    @classmethod
+    async def count_by_user(cls, user_id: int) -> int:
+        """
+        (user_id, created_at, id) 인덱스만 읽는 개수 조회
+        """
+        return await cls.filter(user_id=user_id).count()
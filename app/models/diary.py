@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import re
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from app.core.config import settings
+from app.db.raw_sql import fetch_all, fetch_one, get_dialect
 from app.models.base_model import BaseModel
 from app.models.user import UserModel
 from tortoise import fields
+from tortoise.expressions import Q
 
 
 class DiaryModel(BaseModel):
@@ -18,6 +25,8 @@ class DiaryModel(BaseModel):
 
     class Meta:
         table = "diaries"
+        # 키셋 페이지네이션용 (user_id, created_at DESC, id DESC) 인덱스
+        indexes = (("user_id", "created_at", "id"),)
 
     # CREATE
     @classmethod
@@ -33,6 +42,123 @@ class DiaryModel(BaseModel):
     async def get_all_by_user(cls, user_id: int) -> list[DiaryModel]:
         return await cls.filter(user_id=user_id).order_by("-created_at").all()
 
+    @classmethod
+    async def get_page_by_user(
+        cls,
+        user_id: int,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> list[DiaryModel]:
+        """
+        (created_at, id) 내림차순으로 after 위치 다음부터 limit개를 가져옵니다.
+        OFFSET 없이 인덱스 위치에서 바로 읽기 때문에 일기 개수와 상관없이 일정합니다.
+        """
+        query = cls.filter(user_id=user_id)
+        if after is not None:
+            created_at, diary_id = after
+            query = query.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=diary_id)
+            )
+        if created_from is not None:
+            query = query.filter(created_at__gte=created_from)
+        if created_to is not None:
+            query = query.filter(created_at__lt=created_to)
+
+        return await query.order_by("-created_at", "-id").limit(limit)
+
+    @classmethod
+    async def search_by_user(
+        cls,
+        user_id: int,
+        query: str,
+        limit: int,
+        after: tuple[datetime, int, Decimal] | None = None,
+    ) -> tuple[list[dict], bool]:
+        """
+        제목+내용에 query가 들어있는 일기를 유사도(score) 높은 순으로 가져옵니다.
+        - PostgreSQL: (user_id, title || ' ' || content) pg_trgm GIN 인덱스로
+          후보를 찾고 word_similarity로 순위를 매깁니다.
+          (한글도 글자 단위 trigram으로 매칭)
+        - 그 외(SQLite 테스트 DB): 대소문자 구분 없는 LIKE, score는 모두 1
+        - 일치하는 일기 중 최근 DIARY_SEARCH_MAX_CANDIDATES개만 순위를 매깁니다.
+          흔한 검색어는 (user_id, created_at, id) 인덱스를 최신순으로 훑다가
+          상한에서 멈추고, 드문 검색어는 trigram 인덱스로 바로 찾습니다.
+          상한을 넘는 일치 일기가 있으면 truncated가 True입니다.
+          (상한보다 오래된 일치 일기는 검색 결과에 나오지 않습니다)
+        after: 이전 페이지 마지막 (created_at, id, score)
+        반환값: (id, title, content, created_at, updated_at, score 를 담은 dict 목록,
+                truncated)
+        """
+        pattern = "%" + re.sub(r"([\\%_])", r"\\\1", query) + "%"
+        is_postgres = get_dialect() == "postgres"
+        if is_postgres:
+            match_sql = "(title || ' ' || content) ILIKE $2"
+            score_sql = (
+                "round(word_similarity($3, title || ' ' || content)::numeric, 4)"
+            )
+        else:
+            match_sql = "(title || ' ' || content) LIKE $2 ESCAPE '\\'"
+            score_sql = "1.0"
+
+        params: list = [
+            user_id,
+            pattern,
+            query,
+            limit,
+            settings.DIARY_SEARCH_MAX_CANDIDATES,
+        ]
+        after_sql = ""
+        if after is not None:
+            created_at, diary_id, score = after
+            score_value = score if is_postgres else float(score)
+            params += [score_value, created_at, diary_id]
+            after_sql = "WHERE (score, created_at, id) < ($6, $7, $8)"
+
+        # 후보를 상한보다 하나 더 가져와 잘림 여부를 같은 쿼리에서 셉니다.
+        # 일치하는 일기가 없어도 truncated를 담은 행이 하나 나옵니다. (LEFT JOIN)
+        rows = await fetch_all(
+            f"""
+            WITH candidates AS (
+                SELECT id, title, content, created_at, updated_at
+                FROM diaries
+                WHERE user_id = $1 AND {match_sql}
+                ORDER BY created_at DESC, id DESC
+                LIMIT $5 + 1
+            ),
+            page AS (
+                SELECT id, title, content, created_at, updated_at, score
+                FROM (
+                    SELECT id, title, content, created_at, updated_at,
+                           {score_sql} AS score
+                    FROM (
+                        SELECT * FROM candidates
+                        ORDER BY created_at DESC, id DESC
+                        LIMIT $5
+                    ) ranked
+                ) matched
+                {after_sql}
+                ORDER BY score DESC, created_at DESC, id DESC
+                LIMIT $4
+            )
+            SELECT page.*, counted.truncated
+            FROM (SELECT COUNT(*) > $5 AS truncated FROM candidates) counted
+            LEFT JOIN page ON 1 = 1
+            ORDER BY page.score DESC, page.created_at DESC, page.id DESC
+            """,
+            params,
+        )
+        truncated = bool(rows[0]["truncated"])
+        rows = [row for row in rows if row["id"] is not None]
+        # 드라이버마다 datetime/숫자 표현이 달라 모델 필드 기준으로 맞춥니다.
+        for row in rows:
+            del row["truncated"]
+            for name in ("created_at", "updated_at"):
+                row[name] = cls._meta.fields_map[name].to_python_value(row[name])
+            row["score"] = float(row["score"])
+        return rows, truncated
+
     # UPDATE
     @classmethod
     async def update_diary_title(cls, diary_id: int, title: str) -> int:
@@ -42,7 +168,52 @@ class DiaryModel(BaseModel):
     async def update_diary_content(cls, diary_id: int, content: str) -> int:
         return await cls.filter(id=diary_id).update(content=content)
 
+    @classmethod
+    async def update_returning(
+        cls,
+        diary_id: int,
+        user_id: int,
+        values: dict,
+        expected_updated_at: datetime | None = None,
+    ) -> DiaryModel | None:
+        """
+        UPDATE ... WHERE id AND user_id [AND updated_at] RETURNING 한 번으로 수정하고
+        수정된 일기를 반환합니다. 대상이 없거나 updated_at이 다르면 None.
+        values: 수정할 컬럼만 (title, content)
+        """
+        values = {k: v for k, v in values.items() if k in ("title", "content")}
+        values["updated_at"] = datetime.now(timezone.utc)
+
+        set_sql = ", ".join(f"{column} = ${i + 3}" for i, column in enumerate(values))
+        params = [diary_id, user_id, *values.values()]
+        where_sql = "id = $1 AND user_id = $2"
+        if expected_updated_at is not None:
+            params.append(expected_updated_at)
+            where_sql += f" AND updated_at = ${len(params)}"
+
+        row = await fetch_one(
+            f"""
+            UPDATE diaries SET {set_sql}
+            WHERE {where_sql}
+            RETURNING id, created_at, title, content, updated_at, user_id
+            """,
+            params,
+        )
+        return cls._init_from_db(**row) if row else None
+
     # DELETE
     @classmethod
     async def delete_diary(cls, diary_id: int) -> int:
         return await cls.filter(id=diary_id).delete()
+
+    @classmethod
+    async def delete_by_owner(
+        cls,
+        diary_id: int,
+        user_id: int,
+        expected_updated_at: datetime | None = None,
+    ) -> int:
+        query = cls.filter(id=diary_id, user_id=user_id)
+        if expected_updated_at is not None:
+            query = query.filter(updated_at=expected_updated_at)
+        return await query.delete()
@@ -1,4 +1,7 @@
+from datetime import datetime, timezone
+
 from tortoise import fields
+from app.db.raw_sql import STAGING_TABLE, copy_merge
 from app.models.base_model import BaseModel
 
 
@@ -11,3 +14,29 @@ class QuestionModel(BaseModel):
 
     class Meta:
         table = "questions"
+
+    # CREATE (bulk)
+    @classmethod
+    async def copy_insert_new(cls, texts: list[str]) -> int:
+        """
+        대량 적재용. COPY로 스테이징 테이블에 넣은 뒤
+        같은 question_text가 아직 없는 것만 INSERT ... SELECT 한 번으로 합치고,
+        새로 들어간 개수를 반환합니다. (texts 안의 값은 서로 달라야 합니다)
+        - question_text에는 unique 제약이 없으므로 동시에 두 번 적재하면
+          중복이 생길 수 있습니다. (적재는 한 번에 하나씩)
+        """
+        if not texts:
+            return 0
+
+        return await copy_merge(
+            {"question_text": "TEXT"},
+            [(text,) for text in texts],
+            f"""
+            INSERT INTO questions (question_text, created_at)
+            SELECT s.question_text, $1 FROM {STAGING_TABLE} AS s
+            WHERE NOT EXISTS (
+                SELECT 1 FROM questions AS q WHERE q.question_text = s.question_text
+            )
+            """,
+            [datetime.now(timezone.utc)],
+        )
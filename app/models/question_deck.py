@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import random
+import struct
+from typing import Optional
+
+from tortoise import fields
+from tortoise.exceptions import IntegrityError
+from tortoise.transactions import in_transaction
+
+from app.db.raw_sql import fetch_one
+from app.models.base_model import BaseModel
+from app.models.user import UserModel
+
+
+# 질문 id 하나는 little-endian int64(8 bytes)로 저장합니다.
+def pack_ids(question_ids: list[int]) -> bytes:
+    return struct.pack(f"<{len(question_ids)}q", *question_ids)
+
+
+def unpack_id(chunk: bytes) -> int:
+    return struct.unpack("<q", chunk)[0]
+
+
+class QuestionDeckModel(BaseModel):
+    """
+    유저별로 섞어 둔 질문 덱
+    - deck: 질문 id를 int64로 이어 붙인 bytes
+    - position: 지금까지 뽑은 개수 (다음에 뽑을 위치)
+    """
+
+    user: fields.OneToOneRelation[UserModel] = fields.OneToOneField(
+        "models.UserModel",
+        related_name="question_deck",
+        db_constraint=True,
+        on_delete=fields.CASCADE,
+    )
+    deck = fields.BinaryField(description="섞인 질문 id 목록 (int64 packed)")
+    size = fields.IntField(description="덱에 들어있는 질문 수")
+    position = fields.IntField(default=0, description="다음에 뽑을 위치")
+
+    class Meta:
+        table = "question_decks"
+
+    # 덱에서 다음 질문 id를 꺼냅니다. 덱이 없거나 다 뽑았으면 None
+    @classmethod
+    async def pop_next(cls, user_id: int) -> Optional[int]:
+        row = await fetch_one(
+            """
+            UPDATE question_decks
+            SET position = position + 1
+            WHERE user_id = $1 AND position < size
+            RETURNING substr(deck, (position - 1) * 8 + 1, 8) AS chunk
+            """,
+            [user_id],
+        )
+        if row is None:
+            return None
+        return unpack_id(bytes(row["chunk"]))
+
+    # 질문 id 전체를 섞어 새 덱을 만들고 첫 번째 id를 꺼낸 상태로 저장합니다.
+    # 다른 요청이 먼저 다시 섞었다면 None을 반환합니다.
+    # force: 덱이 남아 있어도 다시 섞습니다. (덱에 삭제된 질문이 섞여 있을 때)
+    @classmethod
+    async def reshuffle(
+        cls, user_id: int, question_ids: list[int], force: bool = False
+    ) -> Optional[int]:
+        shuffled = list(question_ids)
+        random.shuffle(shuffled)
+        deck = pack_ids(shuffled)
+
+        row = await fetch_one(
+            f"""
+            UPDATE question_decks
+            SET deck = $2, size = $3, position = 1
+            WHERE user_id = $1{"" if force else " AND position >= size"}
+            RETURNING id
+            """,
+            [user_id, deck, len(shuffled)],
+        )
+        if row is None:
+            try:
+                # 바깥 트랜잭션 안에서 불려도 실패가 전체를 깨뜨리지 않도록 savepoint
+                async with in_transaction():
+                    await cls.create(
+                        user_id=user_id, deck=deck, size=len(shuffled), position=1
+                    )
+            except IntegrityError:
+                # 동시에 들어온 다른 요청이 이미 덱을 만들었음
+                return None
+
+        return shuffled[0]
@@ -1,6 +1,33 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from datetime import datetime, timezone
+from typing import Optional
+
 from tortoise import fields
+from tortoise.transactions import in_transaction
+
+from app.core.config import settings
+from app.db.raw_sql import STAGING_TABLE, copy_merge, fetch_all, get_dialect
 from app.models.base_model import BaseModel
 
+AUTHOR_MAX_LENGTH = 100
+
+# PostgreSQL 한 문장의 바인드 파라미터 상한(32767) / 행당 파라미터 3개
+BULK_INSERT_MAX_ROWS = 32767 // 3
+
+
+def normalize_quote_content(content: str) -> str:
+    """
+    공백을 하나로 합치고 앞뒤 공백을 제거합니다. (중복 판단 기준)
+    """
+    return re.sub(r"\s+", " ", content).strip()
+
+
+def quote_content_hash(content: str) -> str:
+    return hashlib.sha256(normalize_quote_content(content).encode("utf-8")).hexdigest()
+
 
 class QuoteModel(BaseModel):
     """
@@ -9,10 +36,154 @@ class QuoteModel(BaseModel):
 
     content = fields.TextField(description="명언 내용")
     author = fields.CharField(
-        max_length=100,
+        max_length=AUTHOR_MAX_LENGTH,
         null=True,
         description="작성자",
     )
+    content_hash = fields.CharField(
+        max_length=64,
+        null=True,
+        unique=True,
+        description="정규화한 명언 내용의 sha256 (중복 방지)",
+    )
+    bookmark_count = fields.IntField(
+        default=0,
+        description="북마크 수 (북마크 추가/해제와 같은 트랜잭션에서 증감)",
+    )
 
     class Meta:
         table = "quotes"
+        # 인기 명언 top-N
+        indexes = (("bookmark_count", "id"),)
+
+    async def save(self, *args, update_fields=None, **kwargs) -> None:
+        # 어떤 경로로 저장하든 content_hash를 지금 content로 다시 계산합니다.
+        # (content를 고쳐 저장해도 중복 판단 기준이 어긋나지 않게)
+        self.content_hash = quote_content_hash(self.content)
+        if update_fields is not None and "content" in update_fields:
+            update_fields = {*update_fields, "content_hash"}
+        await super().save(*args, update_fields=update_fields, **kwargs)
+
+    # CREATE (bulk)
+    @classmethod
+    async def bulk_insert_ignore_duplicates(
+        cls, rows: list[tuple[str, str | None, str]]
+    ) -> list[int]:
+        """
+        rows: [(content, author, content_hash), ...]
+        INSERT ... ON CONFLICT (content_hash) DO NOTHING 한 번으로 저장하고,
+        실제로 새로 들어간 id 목록을 반환합니다.
+        - 행당 파라미터 3개라 한 번에 BULK_INSERT_MAX_ROWS행까지 넣을 수 있습니다.
+        """
+        if not rows:
+            return []
+
+        values_sql = ", ".join(
+            f"(${i * 3 + 1}, ${i * 3 + 2}, ${i * 3 + 3})" for i in range(len(rows))
+        )
+        params = [value for row in rows for value in row]
+
+        inserted = await fetch_all(
+            f"""
+            INSERT INTO quotes (content, author, content_hash)
+            VALUES {values_sql}
+            ON CONFLICT (content_hash) DO NOTHING
+            RETURNING id
+            """,
+            params,
+        )
+        return [row["id"] for row in inserted]
+
+    @classmethod
+    async def copy_insert_ignore_duplicates(
+        cls, rows: list[tuple[str, str | None, str]]
+    ) -> int:
+        """
+        rows: [(content, author, content_hash), ...]
+        대량 적재용. COPY로 스테이징 테이블에 넣은 뒤
+        INSERT ... SELECT ... ON CONFLICT (content_hash) DO NOTHING 한 번으로 합치고,
+        새로 들어간 개수를 반환합니다. (rows 안의 content_hash는 서로 달라야 합니다)
+        """
+        if not rows:
+            return 0
+
+        return await copy_merge(
+            {
+                "content": "TEXT",
+                "author": "VARCHAR(100)",
+                "content_hash": "VARCHAR(64)",
+            },
+            rows,
+            f"""
+            INSERT INTO quotes
+                (content, author, content_hash, bookmark_count, created_at)
+            SELECT content, author, content_hash, 0, $1 FROM {STAGING_TABLE}
+            WHERE true
+            ON CONFLICT (content_hash) DO NOTHING
+            """,
+            [datetime.now(timezone.utc)],
+        )
+
+    # READ
+    @classmethod
+    async def get_most_bookmarked(cls, limit: int) -> list[dict]:
+        """
+        북마크 수가 많은 명언 limit개 (북마크 0개인 명언은 제외)
+        """
+        return (
+            await cls.filter(bookmark_count__gt=0)
+            .order_by("-bookmark_count", "-id")
+            .limit(limit)
+            .values("id", "content", "author", "created_at", "bookmark_count")
+        )
+
+    # UPDATE
+    @classmethod
+    async def reconcile_bookmark_counts(
+        cls, batch_size: Optional[int] = None
+    ) -> list[int]:
+        """
+        bookmark_count를 bookmarks 테이블의 실제 개수로 맞추고,
+        값이 달라서 고친 명언 id 목록을 반환합니다.
+        - id 순으로 batch_size개씩 트랜잭션을 나눕니다.
+          (테이블 전체를 한 번에 잠그거나 집계하지 않음)
+        - 배치의 명언 행을 먼저 FOR UPDATE로 잠근 뒤 다음 문장에서 개수를 셉니다.
+          북마크 추가/해제는 같은 트랜잭션에서 명언 행을 갱신하므로,
+          잠금을 얻은 뒤에는 이미 커밋된 변경은 개수에 보이고
+          진행 중인 변경은 잠금을 기다렸다가 보정한 값에 +1/-1 합니다.
+          (보정이 새 어긋남을 만들지 않음)
+        """
+        batch_size = batch_size or settings.BOOKMARK_RECONCILE_BATCH_SIZE
+        fixed: list[int] = []
+        after = 0
+        while True:
+            async with in_transaction() as conn:
+                # SQLite(테스트 DB)는 FOR UPDATE가 없고 쓰기 트랜잭션이 하나뿐입니다.
+                lock = " FOR UPDATE" if get_dialect(conn) == "postgres" else ""
+                batch = await fetch_all(
+                    f"SELECT id FROM quotes WHERE id > $1 ORDER BY id LIMIT $2{lock}",
+                    [after, batch_size],
+                    conn,
+                )
+                if not batch:
+                    return fixed
+                last = batch[-1]["id"]
+                rows = await fetch_all(
+                    """
+                    UPDATE quotes
+                    SET bookmark_count = (
+                        SELECT COUNT(*) FROM bookmarks
+                        WHERE bookmarks.quote_id = quotes.id
+                    )
+                    WHERE id > $1 AND id <= $2
+                      AND bookmark_count <> (
+                        SELECT COUNT(*) FROM bookmarks
+                        WHERE bookmarks.quote_id = quotes.id
+                      )
+                    RETURNING id
+                    """,
+                    [after, last],
+                    conn,
+                )
+            fixed.extend(row["id"] for row in rows)
+            after = last
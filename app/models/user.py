@@ -1,6 +1,8 @@
 from tortoise import fields
 from tortoise.models import Model
 
+from app.core.jwt import password_version
+
 
 class UserModel(Model):
     user_id = fields.IntField(pk=True)
@@ -12,6 +14,12 @@ class UserModel(Model):
         max_length=255, unique=True, description="User's email address"
     )
     is_active = fields.BooleanField(default=True, description="User's active status")
+    # 오늘의 질문 등 "하루" 경계를 계산할 때 쓰는 IANA 시간대 이름
+    timezone = fields.CharField(
+        max_length=64,
+        default="Asia/Seoul",
+        description="유저 시간대 (IANA 이름, 하루 경계 계산용)",
+    )
     created_at = fields.DatetimeField(auto_now_add=True)
     updated_at = fields.DatetimeField(
         auto_now=True
@@ -19,3 +27,8 @@ class UserModel(Model):
 
     class Meta:
         table = "users"
+
+    @property
+    def password_version(self) -> str:
+        # 토큰의 pwv claim과 비교합니다. (비밀번호를 바꾸면 이전 토큰은 무효)
+        return password_version(self.password_hash)
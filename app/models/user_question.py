@@ -1,3 +1,9 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from typing import Optional
+
+from app.db.raw_sql import fetch_one
 from app.models.base_model import BaseModel
 from app.models.user import UserModel
 from app.models.question import QuestionModel
@@ -5,6 +11,11 @@ from tortoise import fields
 
 
 class UserQuestionModel(BaseModel):
+    """
+    유저가 받은 오늘의 질문 기록 (유저당 하루 1개)
+    - issue_date: 유저 시간대(users.timezone) 기준 날짜
+    """
+
     user: fields.ForeignKeyRelation[UserModel] = fields.ForeignKeyField(
         "models.UserModel",
         related_name="user_questions",
@@ -17,6 +28,41 @@ class UserQuestionModel(BaseModel):
         db_constraint=False,
         on_delete=fields.CASCADE,
     )
+    issue_date = fields.DateField(description="질문을 받은 날짜 (유저 시간대 기준)")
 
     class Meta:
         table = "user_questions"
+        # 하루 1개 보장 + 오늘 질문 조회 (마이그레이션에서는 questions_id를 INCLUDE)
+        unique_together = (("user", "issue_date"),)
+
+    # CREATE
+    @classmethod
+    async def issue(cls, user_id: int, issue_date: date, question_id: int) -> bool:
+        """
+        (user_id, issue_date) 기록을 INSERT 1회로 만듭니다.
+        이미 있으면 아무것도 하지 않습니다. (ON CONFLICT DO NOTHING)
+        새로 만들었으면 True
+        """
+        row = await fetch_one(
+            """
+            INSERT INTO user_questions (user_id, issue_date, questions_id, created_at)
+            VALUES ($1, $2, $3, $4)
+            ON CONFLICT (user_id, issue_date) DO NOTHING
+            RETURNING id
+            """,
+            [user_id, issue_date, question_id, datetime.now(timezone.utc)],
+        )
+        return row is not None
+
+    # READ
+    @classmethod
+    async def get_issued_question(
+        cls, user_id: int, issue_date: date
+    ) -> Optional[QuestionModel]:
+        """
+        그날 받은 질문 (user_questions 와 JOIN 1회)
+        """
+        return await QuestionModel.filter(
+            user_questions__user_id=user_id,
+            user_questions__issue_date=issue_date,
+        ).first()
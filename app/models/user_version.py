@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from tortoise import fields
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+from app.db.raw_sql import fetch_one
+from app.models.base_model import BaseModel
+from app.models.user import UserModel
+
+# 버전을 관리하는 리소스 이름 -> 컬럼
+VERSION_COLUMNS = {
+    "diary": "diary_version",
+    "bookmark": "bookmark_version",
+}
+
+
+class UserVersionModel(BaseModel):
+    """
+    유저별 리소스 버전 (ETag / If-None-Match 용)
+    - 해당 리소스를 바꾸는 트랜잭션 안에서 bump()로 1씩 올립니다.
+    - 행이 없으면 버전 0 으로 봅니다.
+    """
+
+    user: fields.OneToOneRelation[UserModel] = fields.OneToOneField(
+        "models.UserModel",
+        related_name="versions",
+        db_constraint=True,
+        on_delete=fields.CASCADE,
+    )
+    diary_version = fields.BigIntField(default=0, description="일기 변경 횟수")
+    bookmark_version = fields.BigIntField(default=0, description="북마크 변경 횟수")
+
+    class Meta:
+        table = "user_versions"
+
+    @classmethod
+    async def get_version(cls, user_id: int, resource: str) -> int:
+        row = await fetch_one(
+            f"SELECT {VERSION_COLUMNS[resource]} AS version "
+            "FROM user_versions WHERE user_id = $1",
+            [user_id],
+        )
+        return row["version"] if row else 0
+
+    @classmethod
+    async def bump(
+        cls,
+        user_id: int,
+        resource: str,
+        connection: Optional[BaseDBAsyncClient] = None,
+    ) -> int:
+        """
+        resource 버전을 1 올리고 새 버전을 반환합니다. (행이 없으면 만듭니다)
+        connection: 리소스를 바꾼 트랜잭션 (같이 커밋/롤백되도록)
+        """
+        column = VERSION_COLUMNS[resource]
+        row = await fetch_one(
+            f"""
+            INSERT INTO user_versions (user_id, {column}) VALUES ($1, 1)
+            ON CONFLICT (user_id)
+            DO UPDATE SET {column} = user_versions.{column} + 1
+            RETURNING {column} AS version
+            """,
+            [user_id],
+            connection,
+        )
+        return row["version"]
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 
 # --- Diary Create ---
@@ -9,6 +9,26 @@ class CreateDiaryRequest(BaseModel):
     content: Optional[str] = Field(None, description="일기 내용")
 
 
+# --- Diary Import ---
+class ImportDiaryLine(CreateDiaryRequest):
+    created_at: Optional[datetime] = Field(
+        None, description="원래 작성 시각 (없으면 가져온 시각)"
+    )
+
+
+class DiaryImportError(BaseModel):
+    line: int
+    error: str
+
+
+class DiaryImportResponse(BaseModel):
+    inserted: int
+    failed: int
+    errors: List[DiaryImportError] = Field(
+        description="실패한 줄 (최대 100개까지만 표시)"
+    )
+
+
 # --- Diary Read ---
 
 
@@ -21,6 +41,34 @@ class DiaryResponse(BaseModel):
     updated_at: datetime
 
 
+class DiaryPageResponse(BaseModel):
+    items: List[DiaryResponse]
+    next_cursor: str | None = Field(
+        None, description="다음 페이지 조회 시 cursor로 전달 (없으면 마지막 페이지)"
+    )
+
+
+class DiarySearchItem(BaseModel):
+    id: int
+    title: str
+    snippet: str = Field(..., description="일치 부분을 <mark>로 감싼 html 조각")
+    score: float = Field(..., description="관련도 (0~1, 높을수록 관련)")
+    created_at: datetime
+    updated_at: datetime
+
+
+class DiarySearchResponse(BaseModel):
+    items: List[DiarySearchItem]
+    next_cursor: str | None = Field(
+        None, description="다음 페이지 조회 시 cursor로 전달 (없으면 마지막 페이지)"
+    )
+    truncated: bool = Field(
+        False,
+        description="일치하는 일기가 많아 최근 일부만 검색했으면 true "
+        "(더 오래된 일기는 결과에 없음)",
+    )
+
+
 # --- Diary Update ---
 
 
@@ -29,6 +77,11 @@ class UpdateDiaryRequest(BaseModel):
     content: str | None
 
 
+class PatchDiaryRequest(BaseModel):
+    title: Optional[str] = Field(None, max_length=255, description="일기 제목")
+    content: Optional[str] = Field(None, description="일기 내용")
+
+
 # --- Diary Delete ---
 
 
@@ -1,5 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
+from typing import List
 
 
 # --- Quote Create ---
@@ -18,12 +19,30 @@ class QuoteResponse(BaseModel):
     created_at: datetime
 
 
+class PopularQuoteResponse(QuoteResponse):
+    bookmark_count: int
+
+
 # --- Quote Delete ---
 class DeleteQuoteResponse(BaseModel):
     id: int
 
 
 # --- Bookmark (Response만 있으면 충분) ---
+class BookmarkedQuoteResponse(QuoteResponse):
+    bookmarked_at: datetime
+
+
+class BookmarkPageResponse(BaseModel):
+    items: List[BookmarkedQuoteResponse]
+    next_cursor: str | None = Field(
+        None, description="다음 페이지 조회 시 cursor로 전달 (없으면 마지막 페이지)"
+    )
+    total: int | None = Field(
+        None, description="전체 북마크 수 (첫 페이지에서만 계산, 이후 페이지는 null)"
+    )
+
+
 class BookmarkResponse(BaseModel):
     message: str
     quote_id: int
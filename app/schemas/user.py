@@ -1,5 +1,7 @@
 from datetime import datetime
-from pydantic import BaseModel, EmailStr, Field
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 
 
 class UserCreate(BaseModel):  # 회원가입
@@ -13,9 +15,22 @@ class UserLogin(BaseModel):  # 로그인
     password: str
 
 
-class UserUpdate(BaseModel):  # 유저 이름,이메일 변경
+class UserUpdate(BaseModel):  # 유저 이름,이메일,시간대 변경
     username: str | None = Field(default=None, min_length=2, max_length=50)
     email: EmailStr | None = None
+    timezone: str | None = Field(
+        default=None, max_length=64, description="IANA 시간대 (예: Asia/Seoul)"
+    )
+
+    @field_validator("timezone")
+    @classmethod
+    def _known_timezone(cls, value: str | None) -> str | None:
+        if value is not None:
+            try:
+                ZoneInfo(value)
+            except (ZoneInfoNotFoundError, ValueError):
+                raise ValueError("알 수 없는 시간대입니다.")
+        return value
 
 
 class PasswordChange(BaseModel):  # 비밀번호 변경
@@ -24,12 +39,29 @@ class PasswordChange(BaseModel):  # 비밀번호 변경
 
 
 class UserResponse(BaseModel):
-    id: int
+    # UserModel / CurrentUser 를 그대로 검증합니다. (id는 user_id 에서 읽음)
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int = Field(validation_alias="user_id")
     username: str
     email: EmailStr
     is_active: bool
+    timezone: str
+    created_at: datetime
+    updated_at: datetime
+
+
+class CurrentUser(BaseModel):  # 인증된 사용자 (user_cache 스냅샷, 읽기 전용)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    user_id: int
+    username: str
+    email: str
+    is_active: bool
+    timezone: str
     created_at: datetime
     updated_at: datetime
+    password_version: str  # password_hash 지문 (해시 자체는 담지 않습니다)
 
 
 class TokenResponse(BaseModel):
@@ -1,6 +1,9 @@
 import re
 import asyncio
-from typing import List, Optional, Tuple
+import importlib.util
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import AsyncIterator, List, Optional, Tuple
 
 import httpx
 from bs4 import BeautifulSoup
@@ -8,6 +11,15 @@ from bs4 import BeautifulSoup
 BASE_URL = "https://saramro.com/quotes"
 API_BASE = "http://127.0.0.1:8000"  # uvicorn 주소
 API_ENDPOINT = f"{API_BASE}/quote"  # POST /quote
+HEADERS = {"User-Agent": "Mozilla/5.0 (ozdiary-quote-scraper)"}
+
+# 재시도할 HTTP 상태 코드 (요청 과다, 일시적인 서버 오류)
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# lxml이 설치되어 있으면 더 빠른 lxml 파서를 사용합니다. (uv sync --extra fast)
+DEFAULT_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+_parse_executor: Optional[ProcessPoolExecutor] = None
 
 
 def _clean_text(text: str) -> str:
@@ -24,15 +36,16 @@ def _split_content_author(text: str) -> Tuple[str, Optional[str]]:
     return text, None
 
 
-async def scrape_quotes(page: int = 1) -> List[dict]:
-    url = BASE_URL if page == 1 else f"{BASE_URL}?page={page}"
-    headers = {"User-Agent": "Mozilla/5.0 (ozdiary-quote-scraper)"}
+def _page_url(page: int) -> str:
+    return BASE_URL if page == 1 else f"{BASE_URL}?page={page}"
 
-    async with httpx.AsyncClient(timeout=15.0, headers=headers) as client:
-        resp = await client.get(url)
-        resp.raise_for_status()
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+def _parse_quotes(html: str, parser: str = DEFAULT_PARSER) -> List[dict]:
+    """
+    목록 페이지 HTML에서 명언을 추출합니다.
+    네트워크/전역 상태를 쓰지 않는 순수 함수라 프로세스 풀에서 실행할 수 있습니다.
+    """
+    soup = BeautifulSoup(html, parser)
 
     results: List[dict] = []
     rows = soup.select("table tbody tr.even, table tbody tr.odd")
@@ -71,6 +84,150 @@ async def scrape_quotes(page: int = 1) -> List[dict]:
     return list(unique.values())
 
 
+def get_parse_executor(max_workers: int) -> ProcessPoolExecutor:
+    """
+    HTML 파싱 전용 프로세스 풀 (처음 호출할 때 생성)
+    - 이벤트 루프와 다른 스레드가 있는 프로세스라 fork 대신 spawn으로 띄웁니다.
+    """
+    global _parse_executor
+    if _parse_executor is None:
+        _parse_executor = ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _parse_executor
+
+
+def shutdown_parse_executor() -> None:
+    global _parse_executor
+    if _parse_executor is not None:
+        _parse_executor.shutdown(wait=False, cancel_futures=True)
+        _parse_executor = None
+
+
+async def scrape_quotes(page: int = 1) -> List[dict]:
+    async with httpx.AsyncClient(timeout=15.0, headers=HEADERS) as client:
+        resp = await client.get(_page_url(page))
+        resp.raise_for_status()
+
+    return _parse_quotes(resp.text)
+
+
+class _RateLimiter:
+    """
+    초당 rate번을 넘지 않도록 요청 시작 시각의 간격을 맞춥니다.
+    """
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        if not self._interval:
+            return
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            if self._next_at > now:
+                await asyncio.sleep(self._next_at - now)
+                now = self._next_at
+            self._next_at = now + self._interval
+
+
+async def _fetch_page(
+    client: httpx.AsyncClient,
+    page: int,
+    limiter: _RateLimiter,
+    retries: int,
+    backoff: float,
+) -> str:
+    """
+    페이지 HTML을 가져옵니다. 네트워크 오류, 429, 5xx는 지수 백오프로 재시도합니다.
+    """
+    attempt = 0
+    while True:
+        await limiter.wait()
+        try:
+            resp = await client.get(_page_url(page))
+        except httpx.TransportError:
+            if attempt >= retries:
+                raise
+        else:
+            if resp.status_code not in RETRY_STATUS_CODES or attempt >= retries:
+                resp.raise_for_status()
+                return resp.text
+
+        await asyncio.sleep(backoff * 2**attempt)
+        attempt += 1
+
+
+async def crawl_quotes(
+    start_page: int = 1,
+    end_page: int = 1,
+    concurrency: int = 4,
+    requests_per_second: float = 5.0,
+    retries: int = 3,
+    backoff: float = 0.5,
+    client: Optional[httpx.AsyncClient] = None,
+    parse_executor: Optional[Executor] = None,
+) -> AsyncIterator[dict]:
+    """
+    start_page ~ end_page 를 동시에 수집하고,
+    페이지가 끝나는 순서대로 명언 dict를 내보냅니다.
+    - 하나의 keep-alive 클라이언트(커넥션 풀)를 공유합니다.
+    - concurrency: 동시에 요청하는 페이지 수
+    - requests_per_second: 초당 요청 수 상한
+    - retries / backoff: 재시도 횟수와 첫 대기 시간(초), 대기 시간은 2배씩 늘어납니다.
+    - parse_executor: 주어지면 HTML 파싱을 그 풀에서 실행해 이벤트 루프를 비워 둡니다.
+    재시도 후에도 실패한 페이지는 건너뜁니다.
+    """
+    own_client = client is None
+    if own_client:
+        client = httpx.AsyncClient(
+            timeout=15.0,
+            headers=HEADERS,
+            limits=httpx.Limits(
+                max_connections=concurrency, max_keepalive_connections=concurrency
+            ),
+        )
+
+    limiter = _RateLimiter(requests_per_second)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _crawl_page(page: int) -> List[dict]:
+        async with semaphore:
+            html = await _fetch_page(client, page, limiter, retries, backoff)
+        if parse_executor is None:
+            return _parse_quotes(html)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(parse_executor, _parse_quotes, html)
+
+    tasks = [
+        asyncio.create_task(_crawl_page(page))
+        for page in range(start_page, end_page + 1)
+    ]
+    seen = set()
+    try:
+        for done in asyncio.as_completed(tasks):
+            try:
+                quotes = await done
+            except httpx.HTTPError as e:
+                print(f"명언 페이지 수집 실패: {e}")
+                continue
+
+            for q in quotes:
+                key = (q["content"], q["author"])
+                if key not in seen:
+                    seen.add(key)
+                    yield q
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if own_client:
+            await client.aclose()
+
+
 async def save_quotes_to_api(quotes: List[dict]) -> None:
     """
     quotes: [{"content": "...", "author": "..."}, ...]
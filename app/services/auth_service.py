@@ -0,0 +1,58 @@
+from typing import Optional
+
+from fastapi import HTTPException
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.user import UserModel
+from app.schemas.user import CurrentUser
+
+user_cache = TTLCache(
+    maxsize=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS
+)
+
+
+async def service_get_user(user_id: int) -> Optional[CurrentUser]:
+    """
+    user_id로 사용자를 조회합니다.
+    - 캐시에 있으면 DB 조회 없이 스냅샷(CurrentUser)을 그대로 반환합니다.
+    - 스냅샷은 읽기 전용입니다. (password_hash 대신 지문 password_version만 담습니다)
+      수정할 때는 service_get_user_row로 행을 다시 읽어 바뀐 컬럼만 저장합니다.
+    """
+    snapshot = user_cache.get(user_id)
+    if snapshot is not None:
+        return snapshot
+
+    user = await UserModel.filter(user_id=user_id).first()
+    if user is None:
+        return None
+    snapshot = CurrentUser.model_validate(user)
+    user_cache.set(user_id, snapshot)
+    return snapshot
+
+
+async def service_get_user_row(user_id: int) -> UserModel:
+    """
+    수정용으로 사용자 행을 DB에서 다시 읽습니다. (캐시 사용 안 함)
+    """
+    user = await UserModel.filter(user_id=user_id).first()
+    if user is None:
+        raise HTTPException(status_code=401, detail="사용자를 찾을 수 없습니다.")
+    return user
+
+
+async def service_refresh_user(user_id: int) -> Optional[CurrentUser]:
+    """
+    캐시를 버리고 DB에서 다시 읽은 스냅샷을 반환합니다.
+    (다른 워커에서 바뀐 정보가 이 워커의 캐시에 아직 반영되지 않았을 때)
+    """
+    user_cache.pop(user_id)
+    return await service_get_user(user_id)
+
+
+def service_invalidate_user(user_id: int) -> None:
+    """
+    사용자 정보(이름, 이메일, 시간대, 비밀번호, 활성 상태)가 바뀌면 반드시 호출합니다.
+    다른 워커 프로세스의 캐시는 USER_CACHE_TTL_SECONDS 안에 만료됩니다.
+    """
+    user_cache.pop(user_id)
@@ -0,0 +1,97 @@
+from typing import Optional
+
+from fastapi import HTTPException
+from tortoise.exceptions import IntegrityError
+from tortoise.expressions import F
+from tortoise.transactions import in_transaction
+
+from app.core.pagination import decode_cursor, encode_cursor
+from app.models.bookmark import BookmarkModel
+from app.models.quote import QuoteModel
+from app.models.user_version import UserVersionModel
+
+
+# CREATE
+async def service_add_bookmark(user_id: int, quote_id: int) -> bool:
+    """
+    북마크를 추가하고 명언의 bookmark_count와 유저의 북마크 버전을
+    같은 트랜잭션에서 1 올립니다. (쿼리 3회)
+    - 명언이 없으면 404
+    - 이미 북마크되어 있으면 아무것도 바꾸지 않고 False
+    """
+    try:
+        async with in_transaction():
+            # 명언 존재 확인을 겸합니다. (없으면 0행)
+            updated = await QuoteModel.filter(id=quote_id).update(
+                bookmark_count=F("bookmark_count") + 1
+            )
+            if not updated:
+                raise HTTPException(status_code=404, detail="명언을 찾지 못했습니다.")
+            await BookmarkModel.create(user_id=user_id, quote_id=quote_id)
+            await UserVersionModel.bump(user_id, "bookmark")
+    except IntegrityError:
+        # (user, quote) unique 위반 = 이미 북마크됨 (증가분도 함께 롤백)
+        return False
+    return True
+
+
+# READ
+async def service_get_bookmark_version(user_id: int) -> int:
+    """
+    북마크 목록 ETag용 버전 (PK 조회 1회)
+    """
+    return await UserVersionModel.get_version(user_id, "bookmark")
+
+
+async def service_get_bookmarks(
+    user_id: int,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+) -> tuple[list[dict], Optional[str], Optional[int]]:
+    """
+    북마크한 명언을 최신 북마크순으로 한 페이지 가져옵니다.
+    반환값: (명언 목록, 다음 페이지 cursor, 전체 개수)
+    - 전체 개수는 첫 페이지(cursor 없음)에서만 인덱스로 세고, 이후 페이지는 None
+    """
+    rows = await BookmarkModel.get_page_by_user(
+        user_id,
+        limit=limit + 1,
+        after=decode_cursor(cursor) if cursor else None,
+    )
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1]["bookmarked_at"], rows[-1]["bookmark_id"])
+
+    total = None
+    if cursor is None and next_cursor is None:
+        # 한 페이지에 다 들어오면 따로 셀 필요가 없습니다.
+        total = len(rows)
+    elif cursor is None:
+        total = await BookmarkModel.count_by_user(user_id)
+
+    return rows, next_cursor, total
+
+
+# DELETE
+async def service_delete_bookmark(user_id: int, quote_id: int) -> bool:
+    """
+    북마크를 해제하고 명언의 bookmark_count를 1 내리고 유저의 북마크 버전을
+    1 올립니다. (같은 트랜잭션, 쿼리 3회)
+    - 북마크가 없으면 False, 명언 자체가 없으면 404
+    """
+    async with in_transaction():
+        deleted = await BookmarkModel.filter(
+            user_id=user_id, quote_id=quote_id
+        ).delete()
+        if deleted:
+            await QuoteModel.filter(id=quote_id).update(
+                bookmark_count=F("bookmark_count") - 1
+            )
+            await UserVersionModel.bump(user_id, "bookmark")
+
+    if not deleted and not await QuoteModel.exists(id=quote_id):
+        # 실패한 경우에만 원인을 구분하기 위해 한 번 더 조회합니다.
+        raise HTTPException(status_code=404, detail="명언을 찾지 못했습니다.")
+    return deleted > 0
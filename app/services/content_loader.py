@@ -0,0 +1,174 @@
+"""
+명언 / 질문 대량 적재 (scripts.load_content CLI에서 사용)
+
+JSONL / CSV 파일을 읽어 메모리에서 정규화 + 중복 제거한 뒤
+COPY로 스테이징 테이블에 넣고 INSERT ... SELECT 한 번으로 본 테이블에 합칩니다.
+- 명언: content, author (content_hash 기준 중복 제거, 이미 있는 명언은 건너뜀)
+- 질문: question_text (공백 정규화한 내용 기준 중복 제거, 이미 있는 질문은 건너뜀)
+- 한 번의 적재는 한 트랜잭션입니다. (실패하면 아무것도 들어가지 않습니다)
+"""
+
+import csv
+import json
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from app.models.question import QuestionModel
+from app.models.quote import (
+    AUTHOR_MAX_LENGTH,
+    QuoteModel,
+    normalize_quote_content,
+    quote_content_hash,
+)
+
+# 결과에 담을 오류 상세의 최대 개수 (나머지는 개수만 셉니다)
+MAX_REPORTED_ERRORS = 100
+
+DEFAULT_AUTHOR = "작자 미상"
+
+
+def file_format(path: Path) -> str:
+    """
+    확장자로 형식을 정합니다. (.csv 가 아니면 JSONL)
+    """
+    return "csv" if path.suffix.lower() == ".csv" else "jsonl"
+
+
+def iter_records(path: Path, fmt: Optional[str] = None) -> Iterator[tuple[str, object]]:
+    """
+    파일의 레코드를 ("파일:줄", dict 또는 오류) 로 하나씩 돌려줍니다.
+    - CSV: 첫 줄을 헤더로 사용하고, 빈 칸은 값이 없는 것으로 처리합니다.
+    """
+    fmt = fmt or file_format(path)
+    with path.open(encoding="utf-8-sig", newline="") as f:
+        if fmt == "csv":
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield (
+                    f"{path}:{reader.line_num}",
+                    {k.strip(): v for k, v in row.items() if k and v},
+                )
+            return
+
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield f"{path}:{line_no}", json.loads(line)
+            except json.JSONDecodeError as e:
+                yield f"{path}:{line_no}", e
+
+
+class LoadReport:
+    """
+    적재 결과 집계
+    - read: 읽은 레코드 수 / invalid: 형식이 잘못된 레코드 수
+    - duplicates: 입력 안에서 겹친 레코드 수 / inserted: 실제로 새로 들어간 수
+      (read - invalid - duplicates - inserted 는 DB에 이미 있던 수)
+    """
+
+    def __init__(self):
+        self.read = 0
+        self.invalid = 0
+        self.duplicates = 0
+        self.inserted = 0
+        self.errors: list[dict] = []
+
+    def fail(self, where: str, error: str) -> None:
+        self.invalid += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": where, "error": error})
+
+    def stats(self) -> dict:
+        return {
+            "read": self.read,
+            "invalid": self.invalid,
+            "duplicates": self.duplicates,
+            "existing": self.read - self.invalid - self.duplicates - self.inserted,
+            "inserted": self.inserted,
+            "errors": self.errors,
+        }
+
+
+def _not_object(item: object) -> str:
+    # JSON 파싱 오류 또는 객체가 아닌 값(리스트, 문자열 ...)
+    return str(item) if isinstance(item, Exception) else "JSON 객체가 아닙니다."
+
+
+def _text(item: dict, key: str) -> str:
+    value = item.get(key)
+    return normalize_quote_content(value) if isinstance(value, str) else ""
+
+
+def prepare_quotes(
+    records: Iterable[tuple[str, object]], report: LoadReport
+) -> list[tuple[str, str, str]]:
+    """
+    (content, author, content_hash) 목록 (content_hash 기준 중복 제거)
+    """
+    rows: dict[str, tuple[str, str, str]] = {}
+    for where, item in records:
+        report.read += 1
+        if not isinstance(item, dict):
+            report.fail(where, _not_object(item))
+            continue
+        content = _text(item, "content")
+        if not content:
+            report.fail(where, "content가 비어 있습니다.")
+            continue
+        author = _text(item, "author") or DEFAULT_AUTHOR
+        if len(author) > AUTHOR_MAX_LENGTH:
+            report.fail(where, f"author는 {AUTHOR_MAX_LENGTH}자 이하여야 합니다.")
+            continue
+
+        content_hash = quote_content_hash(content)
+        if content_hash in rows:
+            report.duplicates += 1
+            continue
+        rows[content_hash] = (content, author, content_hash)
+    return list(rows.values())
+
+
+def prepare_questions(
+    records: Iterable[tuple[str, object]], report: LoadReport
+) -> list[str]:
+    """
+    공백 정규화한 question_text 목록 (중복 제거)
+    """
+    texts: dict[str, None] = {}
+    for where, item in records:
+        report.read += 1
+        if not isinstance(item, dict):
+            report.fail(where, _not_object(item))
+            continue
+        text = _text(item, "question_text")
+        if not text:
+            report.fail(where, "question_text가 비어 있습니다.")
+            continue
+
+        if text in texts:
+            report.duplicates += 1
+            continue
+        texts[text] = None
+    return list(texts)
+
+
+def _records(paths: Iterable[Path], fmt: Optional[str]) -> Iterator[tuple[str, object]]:
+    for path in paths:
+        yield from iter_records(path, fmt)
+
+
+async def service_load_quotes(paths: Iterable[Path], fmt: Optional[str] = None) -> dict:
+    report = LoadReport()
+    rows = prepare_quotes(_records(paths, fmt), report)
+    report.inserted = await QuoteModel.copy_insert_ignore_duplicates(rows)
+    return report.stats()
+
+
+async def service_load_questions(
+    paths: Iterable[Path], fmt: Optional[str] = None
+) -> dict:
+    report = LoadReport()
+    texts = prepare_questions(_records(paths, fmt), report)
+    report.inserted = await QuestionModel.copy_insert_new(texts)
+    return report.stats()
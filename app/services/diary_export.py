@@ -0,0 +1,137 @@
+import codecs
+import csv
+import io
+import json
+import zipfile
+from typing import AsyncIterator, Iterable, Optional
+
+from app.core.config import settings
+from app.models.diary import DiaryModel
+
+# 내보내기 CSV 컬럼 (가져오기와 같은 이름을 써서 그대로 다시 가져올 수 있습니다)
+CSV_FIELDS = ("id", "title", "content", "created_at", "updated_at")
+
+# 형식별 (Content-Type, 파일 확장자)
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "zip": ("application/zip", "zip"),
+}
+
+
+async def _iter_chunks(
+    user_id: int, chunk_size: Optional[int] = None
+) -> AsyncIterator[list[DiaryModel]]:
+    """
+    (created_at, id) 키셋으로 일기를 chunk_size 개씩 최신순으로 읽습니다.
+    메모리에는 한 chunk만 올라갑니다.
+    """
+    chunk_size = chunk_size or settings.DIARY_EXPORT_CHUNK_SIZE
+    after = None
+    while True:
+        diaries = await DiaryModel.get_page_by_user(
+            user_id, limit=chunk_size, after=after
+        )
+        if not diaries:
+            return
+        yield diaries
+        if len(diaries) < chunk_size:
+            return
+        after = (diaries[-1].created_at, diaries[-1].id)
+
+
+def _row(diary: DiaryModel) -> dict:
+    return {
+        "id": diary.id,
+        "title": diary.title,
+        "content": diary.content,
+        "created_at": diary.created_at.isoformat(),
+        "updated_at": diary.updated_at.isoformat(),
+    }
+
+
+def _encode_ndjson(diaries: Iterable[DiaryModel]) -> bytes:
+    return "".join(
+        json.dumps(_row(diary), ensure_ascii=False) + "\n" for diary in diaries
+    ).encode()
+
+
+def _encode_csv(diaries: Iterable[DiaryModel]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CSV_FIELDS)
+    writer.writerows(_row(diary) for diary in diaries)
+    return buffer.getvalue().encode()
+
+
+def _markdown_name(diary: DiaryModel) -> str:
+    return f"{diary.created_at:%Y-%m-%d}-{diary.id}.md"
+
+
+def _markdown(diary: DiaryModel) -> bytes:
+    return (
+        f"# {diary.title}\n\n"
+        f"- 작성: {diary.created_at.isoformat()}\n"
+        f"- 수정: {diary.updated_at.isoformat()}\n\n"
+        f"{diary.content or ''}\n"
+    ).encode()
+
+
+class _ZipBuffer:
+    """
+    ZipFile이 쓰는 바이트를 모아 두었다가 drain() 때 넘겨주는 쓰기 전용 버퍼
+    - seek/tell이 없으므로 ZipFile은 스트리밍 모드(data descriptor)로 씁니다.
+    """
+
+    def __init__(self):
+        self._parts: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+async def _stream_zip(user_id: int) -> AsyncIterator[bytes]:
+    """
+    일기 1개당 Markdown 파일 1개를 담은 ZIP을 만들면서 바로 내보냅니다.
+    - 파일 본문은 chunk 단위로 흘려보내고, 마지막의 central directory만
+      항목당 수십 바이트씩 쌓입니다.
+    """
+    buffer = _ZipBuffer()
+    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
+        async for diaries in _iter_chunks(user_id):
+            for diary in diaries:
+                zf.writestr(_markdown_name(diary), _markdown(diary))
+            yield buffer.drain()
+    yield buffer.drain()
+
+
+async def service_export_diaries(user_id: int, fmt: str) -> AsyncIterator[bytes]:
+    """
+    내 일기 전체를 fmt(ndjson / csv / zip) 형식의 바이트 스트림으로 내보냅니다.
+    - 일기 수와 관계없이 한 번에 DIARY_EXPORT_CHUNK_SIZE 개만 메모리에 올립니다.
+    - ndjson / csv 는 POST /v1/diary/import 로 다시 가져올 수 있습니다.
+    """
+    if fmt == "zip":
+        async for data in _stream_zip(user_id):
+            yield data
+        return
+
+    if fmt == "csv":
+        # 엑셀에서 한글이 깨지지 않도록 BOM을 붙입니다. (가져오기는 BOM을 무시)
+        header = io.StringIO()
+        csv.DictWriter(header, fieldnames=CSV_FIELDS).writeheader()
+        yield codecs.BOM_UTF8 + header.getvalue().encode()
+        encode = _encode_csv
+    else:
+        encode = _encode_ndjson
+
+    async for diaries in _iter_chunks(user_id):
+        yield encode(diaries)
@@ -0,0 +1,173 @@
+import csv
+import io
+import json
+from typing import AsyncIterator, Optional
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+from tortoise.transactions import in_transaction
+
+from app.core.config import settings
+from app.models.diary import DiaryModel
+from app.models.user_version import UserVersionModel
+from app.schemas.diary import ImportDiaryLine
+
+# 응답에 담을 오류 상세의 최대 개수 (나머지는 개수만 셉니다)
+MAX_REPORTED_ERRORS = 100
+
+
+async def _iter_lines(
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[tuple[int, str | ValueError]]:
+    """
+    요청 바디 청크를 받는 대로 (줄 번호, 줄) 로 나눕니다.
+    전체를 메모리에 올리지 않습니다.
+    - 줄바꿈(0x0A)은 UTF-8 멀티바이트 문자 안에 나오지 않으므로 bytes 그대로 나누고
+      줄마다 디코딩합니다. (DIARY_IMPORT_MAX_LINE_BYTES를 실제 바이트 수로 검사)
+    - UTF-8이 아닌 줄은 줄 대신 오류를 돌려줍니다. (그 줄만 실패로 셉니다)
+    """
+    buffer = b""
+    line_no = 0
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_no += 1
+            yield line_no, _decode_line(line, line_no)
+        if len(buffer) > settings.DIARY_IMPORT_MAX_LINE_BYTES:
+            raise HTTPException(
+                status_code=413, detail=f"{line_no + 1}번째 줄이 너무 깁니다."
+            )
+
+    if buffer:
+        yield line_no + 1, _decode_line(buffer, line_no + 1)
+
+
+def _decode_line(line: bytes, line_no: int) -> str | ValueError:
+    # 첫 줄의 BOM은 버립니다. (utf-8-sig)
+    encoding = "utf-8-sig" if line_no == 1 else "utf-8"
+    try:
+        return line.decode(encoding).rstrip("\r")
+    except UnicodeDecodeError as e:
+        return ValueError(f"UTF-8이 아닌 바이트가 있습니다. (위치 {e.start})")
+
+
+async def _iter_ndjson(
+    lines: AsyncIterator[tuple[int, str | ValueError]],
+) -> AsyncIterator[tuple[int, object]]:
+    async for line_no, line in lines:
+        if isinstance(line, ValueError):
+            yield line_no, line
+            continue
+        if not line.strip():
+            continue
+        try:
+            yield line_no, json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_no, e
+
+
+async def _iter_csv(
+    lines: AsyncIterator[tuple[int, str | ValueError]],
+) -> AsyncIterator[tuple[int, object]]:
+    """
+    첫 줄을 헤더로 사용합니다.
+    따옴표 안의 줄바꿈은 따옴표 개수가 짝수가 될 때까지 다음 줄을 이어 붙입니다.
+    """
+    header: Optional[list[str]] = None
+    record: list[str] = []
+    start_no = 0
+    async for line_no, line in lines:
+        if isinstance(line, ValueError):
+            # 여러 줄에 걸친 레코드 중간이면 그 레코드 전체를 실패로 셉니다.
+            yield (start_no if record else line_no), line
+            record = []
+            continue
+        if not record:
+            if not line.strip():
+                continue
+            start_no = line_no
+        record.append(line)
+        text = "\n".join(record)
+        if text.count('"') % 2:
+            continue
+        record = []
+
+        row = next(csv.reader(io.StringIO(text)))
+        if header is None:
+            header = [column.strip() for column in row]
+            continue
+        # 빈 칸은 값이 없는 것으로 처리합니다.
+        yield start_no, {k: v for k, v in zip(header, row) if v != ""}
+
+    if record:
+        yield start_no, ValueError("닫히지 않은 따옴표가 있습니다.")
+
+
+def _validate(item: object) -> ImportDiaryLine:
+    if isinstance(item, Exception):
+        raise item
+    return ImportDiaryLine.model_validate(item)
+
+
+def _error_message(e: Exception) -> str:
+    if isinstance(e, ValidationError):
+        return "; ".join(
+            f"{'.'.join(map(str, err['loc'])) or 'line'}: {err['msg']}"
+            for err in e.errors()
+        )
+    return str(e)
+
+
+async def _save_batch(user_id: int, batch: list[ImportDiaryLine]) -> None:
+    async with in_transaction() as conn:
+        await DiaryModel.bulk_create(
+            [
+                DiaryModel(
+                    user_id=user_id,
+                    title=line.title,
+                    content=line.content or "",
+                    # 원래 작성 시각이 없으면 auto_now_add로 가져온 시각이 들어갑니다.
+                    **({"created_at": line.created_at} if line.created_at else {}),
+                )
+                for line in batch
+            ],
+            using_db=conn,
+        )
+        await UserVersionModel.bump(user_id, "diary", conn)
+
+
+async def service_import_diaries(
+    user_id: int, chunks: AsyncIterator[bytes], fmt: str
+) -> dict:
+    """
+    NDJSON / CSV 스트림을 한 줄씩 검증해 DIARY_IMPORT_BATCH_SIZE개씩 저장합니다.
+    - 잘못된 줄은 건너뛰고 줄 번호와 사유를 모아 반환합니다.
+    - 배치마다 트랜잭션을 나누므로, 중간에 실패해도 앞서 저장한 배치는 유지됩니다.
+    """
+    records = _iter_csv if fmt == "csv" else _iter_ndjson
+
+    inserted = 0
+    failed = 0
+    errors: list[dict] = []
+    batch: list[ImportDiaryLine] = []
+
+    async for line_no, item in records(_iter_lines(chunks)):
+        try:
+            batch.append(_validate(item))
+        except (ValidationError, ValueError) as e:
+            failed += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append({"line": line_no, "error": _error_message(e)})
+            continue
+
+        if len(batch) >= settings.DIARY_IMPORT_BATCH_SIZE:
+            await _save_batch(user_id, batch)
+            inserted += len(batch)
+            batch = []
+
+    if batch:
+        await _save_batch(user_id, batch)
+        inserted += len(batch)
+
+    return {"inserted": inserted, "failed": failed, "errors": errors}
@@ -1,19 +1,138 @@
+import html
+import re
+from datetime import datetime
+from typing import Optional
+
+from fastapi import HTTPException
+from tortoise.transactions import in_transaction
+
+from app.core.pagination import decimal_key, decode_cursor, encode_cursor
 from app.models.diary import DiaryModel
+from app.models.user_version import UserVersionModel
 from app.schemas.diary import CreateDiaryRequest
 
 
+# 일기를 바꾸는 함수는 모두 같은 트랜잭션에서 유저의 일기 버전(목록 ETag)을 올립니다.
+
+
 # CREATE
 async def service_create_diary(
     user_id: int, diary_data: CreateDiaryRequest
 ) -> DiaryModel:
-    return await DiaryModel.create_diary(
-        user_id=user_id, title=diary_data.title, content=diary_data.content
-    )
+    async with in_transaction():
+        diary = await DiaryModel.create_diary(
+            user_id=user_id, title=diary_data.title, content=diary_data.content
+        )
+        await UserVersionModel.bump(user_id, "diary")
+    return diary
 
 
 # READ
-async def service_get_diaries(user_id: int):
-    return await DiaryModel.get_all_by_user(user_id)
+async def service_get_diaries(
+    user_id: int,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+) -> tuple[list[DiaryModel], Optional[str]]:
+    """
+    최신순으로 일기 한 페이지와 다음 페이지 cursor를 반환합니다.
+    다음 페이지가 없으면 cursor는 None 입니다.
+    """
+    diaries = await DiaryModel.get_page_by_user(
+        user_id,
+        limit=limit + 1,
+        after=decode_cursor(cursor) if cursor else None,
+        created_from=created_from,
+        created_to=created_to,
+    )
+
+    next_cursor = None
+    if len(diaries) > limit:
+        diaries = diaries[:limit]
+        next_cursor = encode_cursor(diaries[-1].created_at, diaries[-1].id)
+
+    return diaries, next_cursor
+
+
+# 검색 결과 snippet에서 일치한 부분 앞뒤로 보여줄 글자 수
+SNIPPET_RADIUS = 60
+
+
+def _highlight(text: str, query: str) -> str:
+    """
+    첫 번째 일치 위치 주변을 잘라 html escape 후 일치 부분을 <mark>로 감쌉니다.
+    """
+    pattern = re.compile(re.escape(query), re.IGNORECASE)
+    match = pattern.search(text)
+    if match is None:
+        snippet = text[: SNIPPET_RADIUS * 2]
+        return html.escape(snippet) + ("…" if len(text) > len(snippet) else "")
+
+    start = max(match.start() - SNIPPET_RADIUS, 0)
+    end = min(match.end() + SNIPPET_RADIUS, len(text))
+    snippet = text[start:end]
+
+    parts = []
+    last = 0
+    for m in pattern.finditer(snippet):
+        parts.append(html.escape(snippet[last : m.start()]))
+        parts.append(f"<mark>{html.escape(m.group())}</mark>")
+        last = m.end()
+    parts.append(html.escape(snippet[last:]))
+
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if end < len(text) else ""
+    return prefix + "".join(parts) + suffix
+
+
+async def service_search_diaries(
+    user_id: int,
+    query: str,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+) -> tuple[list[dict], Optional[str], bool]:
+    """
+    내 일기에서 query를 검색해 관련도순 한 페이지와 다음 페이지 cursor,
+    후보 상한에 걸려 오래된 일기를 건너뛰었는지(truncated)를 반환합니다.
+    - 각 항목의 snippet은 일치 부분을 <mark>로 감싼 html 조각입니다.
+    """
+    query = query.strip()
+    if not query:
+        raise HTTPException(status_code=400, detail="검색어를 입력해주세요.")
+
+    rows, truncated = await DiaryModel.search_by_user(
+        user_id,
+        query,
+        limit=limit + 1,
+        after=decode_cursor(cursor, extra=(decimal_key,)) if cursor else None,
+    )
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last["created_at"], last["id"], str(last["score"]))
+
+    items = [
+        {
+            "id": row["id"],
+            "title": row["title"],
+            "snippet": _highlight(f"{row['title']} {row['content'] or ''}", query),
+            "score": row["score"],
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+        }
+        for row in rows
+    ]
+    return items, next_cursor, truncated
+
+
+async def service_get_diary_version(user_id: int) -> int:
+    """
+    일기 목록 ETag용 버전 (PK 조회 1회)
+    """
+    return await UserVersionModel.get_version(user_id, "diary")
 
 
 async def service_get_diary(diary_id: int):
@@ -21,14 +140,52 @@ async def service_get_diary(diary_id: int):
 
 
 # UPDATE
-async def service_update_diary_title(diary_id: int, title: str):
-    await DiaryModel.update_diary_title(diary_id=diary_id, title=title)
+async def service_update_diary(
+    diary_id: int,
+    user_id: int,
+    values: dict,
+    expected_updated_at: Optional[datetime] = None,
+) -> DiaryModel:
+    """
+    전달된 필드만 수정하고 수정된 일기를 반환합니다. (UPDATE ... RETURNING 1회)
+    expected_updated_at이 있으면 그 버전일 때만 수정합니다.
+    (다른 기기에서 먼저 수정했다면 412)
+    """
+    async with in_transaction():
+        diary = await DiaryModel.update_returning(
+            diary_id, user_id, values, expected_updated_at
+        )
+        if diary is not None:
+            await UserVersionModel.bump(user_id, "diary")
+    if diary is None:
+        await _raise_not_found_or_conflict(diary_id, user_id, expected_updated_at)
+    return diary
 
 
-async def service_update_diary_content(diary_id: int, content: str):
-    await DiaryModel.update_diary_content(diary_id=diary_id, content=content)
+# DELETE
+async def service_delete_diary(
+    diary_id: int,
+    user_id: int,
+    expected_updated_at: Optional[datetime] = None,
+) -> None:
+    async with in_transaction():
+        deleted = await DiaryModel.delete_by_owner(
+            diary_id, user_id, expected_updated_at
+        )
+        if deleted:
+            await UserVersionModel.bump(user_id, "diary")
+    if not deleted:
+        await _raise_not_found_or_conflict(diary_id, user_id, expected_updated_at)
 
 
-# DELETE
-async def service_delete_diary(diary_id: int):
-    return await DiaryModel.delete_diary(diary_id)
+async def _raise_not_found_or_conflict(
+    diary_id: int, user_id: int, expected_updated_at: Optional[datetime]
+) -> None:
+    # 실패한 경우에만 원인을 구분하기 위해 한 번 더 조회합니다.
+    if expected_updated_at is not None and (
+        await DiaryModel.filter(id=diary_id, user_id=user_id).exists()
+    ):
+        raise HTTPException(
+            status_code=412, detail="다른 곳에서 먼저 수정된 일기입니다."
+        )
+    raise HTTPException(status_code=404, detail="일기를 찾을 수 없음")
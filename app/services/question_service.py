@@ -1,46 +1,99 @@
-import random
-from datetime import datetime, timezone, timedelta
+from datetime import date, datetime
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
 from fastapi import HTTPException
+from tortoise.transactions import in_transaction
 
 from app.models.question import QuestionModel
-from app.models.user_question import UserQuestionModel
+from app.models.question_deck import QuestionDeckModel
 from app.models.user import UserModel
+from app.models.user_question import UserQuestionModel
+from app.schemas.user import CurrentUser
+
+DEFAULT_TIMEZONE = "Asia/Seoul"
+
+
+def user_today(tz_name: str) -> date:
+    """
+    유저 시간대 기준 오늘 날짜 (알 수 없는 시간대면 기본 시간대)
+    """
+    try:
+        tz = ZoneInfo(tz_name)
+    except (ZoneInfoNotFoundError, ValueError):
+        tz = ZoneInfo(DEFAULT_TIMEZONE)
+    return datetime.now(tz).date()
 
 
 class QuestionService:
     @staticmethod
-    async def get_random_question(user: UserModel) -> QuestionModel:
+    async def get_today_question(user: CurrentUser) -> tuple[QuestionModel, date]:
+        """
+        오늘의 질문을 반환합니다. 같은 날 다시 호출하면 같은 질문을 돌려줍니다.
+        - 이미 받았으면: 시간대 조회 + (user_id, issue_date) 인덱스로 JOIN 조회 1회
+        - 처음이면: 덱에서 질문을 꺼내 INSERT ... ON CONFLICT DO NOTHING 으로 기록
+          (동시에 들어온 다른 요청이 먼저 기록했다면 덱 꺼내기까지 롤백하고
+          그 요청이 기록한 질문을 돌려줍니다)
+        """
         user_id = int(user.user_id)
-
-        now = datetime.now(timezone.utc)
-        start_today = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        start_tomorrow = start_today + timedelta(days=1)
-
-        today_record = (
-            await UserQuestionModel.filter(
-                user_id=user_id,
-                created_at__gte=start_today,
-                created_at__lt=start_tomorrow,
-            )
-            .order_by("-created_at")
+        # 시간대는 캐시 스냅샷이 아니라 행에서 읽습니다.
+        # (다른 워커에서 PATCH /auth/me로 바꾼 값이 캐시 TTL 동안 늦게 반영되면
+        # 하루 경계가 어긋나 같은 날 질문을 두 번 받을 수 있습니다)
+        tz_name = (
+            await UserModel.filter(user_id=user_id)
             .first()
+            .values_list("timezone", flat=True)
         )
+        issue_date = user_today(tz_name or DEFAULT_TIMEZONE)
 
-        if today_record:
-            raise HTTPException(status_code=400, detail="오늘은 이미 질문을 받았어요")
+        question = await UserQuestionModel.get_issued_question(user_id, issue_date)
+        if question is not None:
+            return question, issue_date
 
-        total = await QuestionModel.all().count()
-        if total == 0:
-            raise HTTPException(status_code=404, detail="질문이 비어있어요")
+        try:
+            async with in_transaction():
+                question = await QuestionService._draw_from_deck(user_id)
+                if not await UserQuestionModel.issue(user_id, issue_date, question.id):
+                    raise _AlreadyIssued
+        except _AlreadyIssued:
+            question = await UserQuestionModel.get_issued_question(user_id, issue_date)
+            if question is None:
+                raise HTTPException(status_code=404, detail="질문을 가져오지 못했어요")
 
-        offset = random.randint(0, total - 1)
-        question = await QuestionModel.all().offset(offset).first()
-        if not question:
-            raise HTTPException(status_code=404, detail="질문을 가져오지 못했어요")
+        return question, issue_date
+
+    @staticmethod
+    async def _draw_from_deck(user_id: int) -> QuestionModel:
+        """
+        유저의 섞인 질문 덱에서 다음 질문을 꺼냅니다.
+        - 덱을 다 쓰면 그때 전체 질문을 다시 섞습니다.
+        - 덱을 한 바퀴 도는 동안 같은 질문은 다시 나오지 않습니다.
+        """
+        # 동시에 다시 섞는 경우를 위해 몇 번 재시도
+        for _ in range(3):
+            question_id = await QuestionDeckModel.pop_next(user_id)
+            if question_id is not None:
+                question = await QuestionModel.get_or_none(id=question_id)
+                if question:
+                    return question
+
+            # 덱을 다 썼거나(None) 덱에 삭제된 질문이 있으면 살아 있는 질문으로
+            # 바로 다시 섞습니다. (삭제된 id를 하나씩 건너뛰지 않음)
+            question_ids = await QuestionModel.all().values_list("id", flat=True)
+            if not question_ids:
+                raise HTTPException(status_code=404, detail="질문이 비어있어요")
+            question_id = await QuestionDeckModel.reshuffle(
+                user_id, question_ids, force=question_id is not None
+            )
+            if question_id is None:
+                continue
+
+            question = await QuestionModel.get_or_none(id=question_id)
+            if question:
+                return question
+
+        raise HTTPException(status_code=404, detail="질문을 가져오지 못했어요")
 
-        await UserQuestionModel.create(
-            user_id=user_id,
-            questions_id=question.id,
-        )
 
-        return question
+class _AlreadyIssued(Exception):
+    # 트랜잭션을 롤백시키기 위한 내부 신호
+    pass
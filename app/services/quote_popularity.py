@@ -0,0 +1,140 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.core.config import settings
+from app.models.quote import QuoteModel
+
+
+class PopularQuotes:
+    """
+    북마크 수 상위 명언 목록을 메모리에 들고 있다가 그대로 돌려줍니다.
+    - 갱신: refresh_interval 이 지난 뒤 첫 요청이
+      (bookmark_count, id) 인덱스로 top-N 1회 조회
+    - 북마크 추가/해제는 quotes.bookmark_count만 바꾸고, 목록은 다음 갱신 때 반영됩니다.
+    """
+
+    def __init__(self, size: int = 100, refresh_interval: float = 10.0):
+        self.size = size
+        self.refresh_interval = refresh_interval
+        self._items: list[dict] = []
+        self._refreshed_at = 0.0
+        self._lock = asyncio.Lock()
+        self.refreshes = 0
+
+    async def refresh(self) -> None:
+        items = await QuoteModel.get_most_bookmarked(self.size)
+        self._items = items
+        self._refreshed_at = time.monotonic()
+        self.refreshes += 1
+
+    def invalidate(self) -> None:
+        self._refreshed_at = 0.0
+
+    async def get(self, limit: int) -> list[dict]:
+        """
+        북마크 수 상위 limit개 (최대 size개)
+        """
+        if time.monotonic() - self._refreshed_at >= self.refresh_interval:
+            async with self._lock:
+                # 기다리는 동안 다른 요청이 이미 갱신했으면 다시 조회하지 않습니다.
+                if time.monotonic() - self._refreshed_at >= self.refresh_interval:
+                    await self.refresh()
+        return self._items[:limit]
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._items),
+            "maxsize": self.size,
+            "refresh_interval_seconds": self.refresh_interval,
+            "refreshes": self.refreshes,
+        }
+
+
+class BookmarkCountReconciler:
+    """
+    quotes.bookmark_count가 bookmarks 테이블과 어긋난 경우
+    (직접 SQL 수정, 동시성 등)를 주기적으로 찾아 고칩니다.
+    - start(): 태스크만 만들고 바로 반환
+    - stop(): 실행 중인 작업을 취소하고 종료를 기다림
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self.runs = 0
+        self.last_finished_at: Optional[datetime] = None
+        self.last_duration_seconds: Optional[float] = None
+        self.last_fixed: Optional[int] = None
+        self.total_fixed = 0
+        self.last_error: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._loop(), name="bookmark-reconcile")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.run_once()
+
+    async def run_once(self) -> int:
+        """
+        어긋난 bookmark_count를 고치고 고친 명언 수를 반환합니다.
+        실패해도 예외를 올리지 않고 last_error에 기록합니다.
+        """
+        self.runs += 1
+        started = time.perf_counter()
+        fixed = 0
+        try:
+            fixed = len(await QuoteModel.reconcile_bookmark_counts())
+            self.total_fixed += fixed
+            self.last_error = None
+            if fixed:
+                popular_quotes.invalidate()
+                print(f"북마크 수 보정: {fixed}개 명언의 bookmark_count를 고쳤습니다.")
+        except Exception as e:
+            self.last_error = str(e)
+            print(f"북마크 수 보정 실패: {e}")
+        finally:
+            self.last_finished_at = datetime.now(timezone.utc)
+            self.last_duration_seconds = time.perf_counter() - started
+            self.last_fixed = fixed
+
+        return fixed
+
+    def stats(self) -> dict:
+        return {
+            "running": self.running,
+            "interval_seconds": self.interval,
+            "runs": self.runs,
+            "last_finished_at": self.last_finished_at,
+            "last_duration_seconds": self.last_duration_seconds,
+            "last_fixed": self.last_fixed,
+            "total_fixed": self.total_fixed,
+            "last_error": self.last_error,
+        }
+
+
+popular_quotes = PopularQuotes(
+    size=settings.QUOTE_POPULAR_SIZE,
+    refresh_interval=settings.QUOTE_POPULAR_REFRESH_SECONDS,
+)
+bookmark_count_reconciler = BookmarkCountReconciler(
+    interval=settings.BOOKMARK_RECONCILE_INTERVAL_SECONDS
+)
@@ -0,0 +1,89 @@
+import asyncio
+import random
+import time
+from array import array
+from typing import Optional
+
+from app.core.config import settings
+from app.models.quote import QuoteModel
+
+
+class QuoteSampler:
+    """
+    명언 id 목록을 메모리(array)에 들고 있다가 무작위로 하나를 뽑습니다.
+    - 추첨: COUNT/OFFSET 없이 id를 고르고 PK 조회 1회
+    - 갱신: refresh_interval 마다 COUNT 한 번으로 다른 프로세스의 변경을 감지해 다시 적재
+    """
+
+    def __init__(self, refresh_interval: float = 30.0):
+        self.refresh_interval = refresh_interval
+        self._ids = array("q")
+        self._loaded = False
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    async def load(self) -> int:
+        """
+        DB의 명언 id 전체를 다시 적재하고 개수를 반환합니다.
+        """
+        async with self._lock:
+            ids = await QuoteModel.all().order_by("id").values_list("id", flat=True)
+            self._ids = array("q", ids)
+            self._loaded = True
+            self._checked_at = time.monotonic()
+            return len(self._ids)
+
+    def add(self, *quote_ids: int) -> None:
+        """
+        이 프로세스에서 새로 저장한 명언 id를 바로 반영합니다.
+        - 호출한 쪽은 INSERT가 돌려준 새 id만 넘기므로 이번 호출 안에서만
+          중복을 거릅니다. (id 전체를 set으로 한 벌 더 들고 있지 않습니다)
+        - 이미 있던 id가 들어와도 개수가 DB와 달라져 다음 refresh에서
+          다시 적재됩니다.
+        """
+        self._ids.extend(dict.fromkeys(quote_ids))
+
+    def invalidate(self) -> None:
+        """
+        다음 추첨 때 DB와 개수를 다시 비교하도록 표시합니다.
+        """
+        self._checked_at = 0.0
+
+    async def refresh(self) -> None:
+        """
+        다른 프로세스가 명언을 추가/삭제했는지 COUNT로 확인하고, 다르면 다시 적재합니다.
+        """
+        if not self._loaded:
+            await self.load()
+            return
+
+        total = await QuoteModel.all().count()
+        self._checked_at = time.monotonic()
+        if total != len(self._ids):
+            await self.load()
+
+    async def get_random(self) -> Optional[QuoteModel]:
+        """
+        무작위 명언 1개를 반환합니다. 명언이 없으면 None.
+        """
+        if time.monotonic() - self._checked_at >= self.refresh_interval:
+            await self.refresh()
+
+        # 삭제된 id를 뽑은 경우 한 번 다시 적재 후 재시도
+        for _ in range(2):
+            if not self._ids:
+                return None
+
+            quote = await QuoteModel.get_or_none(id=random.choice(self._ids))
+            if quote is not None:
+                return quote
+
+            await self.load()
+
+        return None
+
+
+quote_sampler = QuoteSampler(refresh_interval=settings.QUOTE_SAMPLER_REFRESH_SECONDS)
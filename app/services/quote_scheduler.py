@@ -0,0 +1,106 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from app.core.config import settings
+from app.scraping.quote_scraper import crawl_quotes, get_parse_executor
+from app.services.quote_service import service_save_bulk_quotes
+
+
+class QuoteRefreshScheduler:
+    """
+    명언 수집을 서버 시작과 분리해 백그라운드에서 주기적으로 실행합니다.
+    - start(): 태스크만 만들고 바로 반환 (서버는 곧바로 요청을 받음)
+    - stop(): 실행 중인 수집을 취소하고 종료를 기다림
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self.runs = 0
+        self.last_started_at: Optional[datetime] = None
+        self.last_finished_at: Optional[datetime] = None
+        self.last_duration_seconds: Optional[float] = None
+        self.last_inserted: Optional[int] = None
+        self.last_error: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._loop(), name="quote-refresh")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            await self.run_once()
+            await asyncio.sleep(self.interval)
+
+    async def run_once(self) -> int:
+        """
+        명언을 한 번 수집해 저장하고 새로 저장된 개수를 반환합니다.
+        실패해도 예외를 올리지 않고 last_error에 기록합니다.
+        """
+        self.runs += 1
+        self.last_started_at = datetime.now(timezone.utc)
+        started = time.perf_counter()
+        inserted = 0
+        try:
+            batch: List[dict] = []
+            async for quote in crawl_quotes(
+                start_page=1,
+                end_page=settings.QUOTE_SCRAPE_PAGES,
+                concurrency=settings.QUOTE_SCRAPE_CONCURRENCY,
+                requests_per_second=settings.QUOTE_SCRAPE_REQUESTS_PER_SECOND,
+                parse_executor=(
+                    get_parse_executor(settings.QUOTE_PARSE_WORKERS)
+                    if settings.QUOTE_PARSE_WORKERS > 0
+                    else None
+                ),
+            ):
+                batch.append(quote)
+                if len(batch) >= settings.QUOTE_IMPORT_BATCH_SIZE:
+                    inserted += await service_save_bulk_quotes(batch)
+                    batch = []
+            if batch:
+                inserted += await service_save_bulk_quotes(batch)
+            self.last_error = None
+            print(f"명언 수집 완료: {inserted}개의 새로운 명언을 저장했습니다.")
+        except Exception as e:
+            self.last_error = str(e)
+            print(f"명언 수집 실패: {e}")
+        finally:
+            self.last_finished_at = datetime.now(timezone.utc)
+            self.last_duration_seconds = time.perf_counter() - started
+            self.last_inserted = inserted
+
+        return inserted
+
+    def stats(self) -> dict:
+        return {
+            "running": self.running,
+            "interval_seconds": self.interval,
+            "runs": self.runs,
+            "last_started_at": self.last_started_at,
+            "last_finished_at": self.last_finished_at,
+            "last_duration_seconds": self.last_duration_seconds,
+            "last_inserted": self.last_inserted,
+            "last_error": self.last_error,
+        }
+
+
+quote_refresh_scheduler = QuoteRefreshScheduler(
+    interval=settings.QUOTE_REFRESH_INTERVAL_SECONDS
+)
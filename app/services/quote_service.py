@@ -1,49 +1,88 @@
 from typing import List, Optional
-import random
-from app.models.quote import QuoteModel  # 명언 모델 임포트
+
+from tortoise.exceptions import IntegrityError
+
+from app.core.config import settings
+from app.models.quote import (  # 명언 모델 임포트
+    AUTHOR_MAX_LENGTH,
+    BULK_INSERT_MAX_ROWS,
+    QuoteModel,
+    normalize_quote_content,
+    quote_content_hash,
+)
+from app.services.quote_sampler import quote_sampler
 
 
 async def service_create_quote(quote_data: dict) -> tuple[QuoteModel, bool]:
     """
     명언을 생성합니다.
-    동일한 내용(content)이 이미 존재하면 생성하지 않고 기존 객체를 반환합니다.
+    동일한 내용(content, 공백 정규화 기준)이 이미 존재하면
+    생성하지 않고 기존 객체를 반환합니다.
     반환값: (Quote 객체, 신규 생성 여부)
     """
     content = quote_data.get("content")
     author = quote_data.get("author")
+    content_hash = quote_content_hash(content)
 
-    # 1. 중복 체크 (내용 기준)
-    existing_quote = await QuoteModel.filter(content=content).first()
+    # 1. 중복 체크 (내용 해시 기준, unique 인덱스 사용)
+    existing_quote = await QuoteModel.filter(content_hash=content_hash).first()
     if existing_quote:
         return existing_quote, False
 
     # 2. 신규 저장
-    new_quote = await QuoteModel.create(
-        content=content, author=author if author else "작자 미상"
-    )
+    try:
+        new_quote = await QuoteModel.create(
+            content=content,
+            author=author if author else "작자 미상",
+            content_hash=content_hash,
+        )
+    except IntegrityError:
+        # 확인과 저장 사이에 같은 명언이 먼저 저장됨 (content_hash unique 위반)
+        return await QuoteModel.get(content_hash=content_hash), False
+    quote_sampler.add(new_quote.id)
     return new_quote, True
 
 
 async def service_get_random_quote() -> Optional[QuoteModel]:
     """
     DB에 저장된 명언 중 하나를 무작위로 가져옵니다.
+    메모리의 id 목록에서 고른 뒤 PK 조회 1회만 수행합니다.
     """
-    count = await QuoteModel.all().count()
-    if count == 0:
-        return None
+    return await quote_sampler.get_random()
 
-    random_index = random.randint(0, count - 1)
-    return await QuoteModel.all().offset(random_index).first()
 
-
-async def service_save_bulk_quotes(quotes: List[dict]) -> int:
+async def service_save_bulk_quotes(
+    quotes: List[dict], batch_size: Optional[int] = None
+) -> int:
     """
     스크레이퍼 등에서 넘어온 대량의 명언 리스트를 저장합니다.
+    - 내용을 정규화하고 해시로 중복을 제거한 뒤
+    - batch_size개씩 INSERT ... ON CONFLICT DO NOTHING 한 번으로 저장합니다.
+      (파라미터 상한 때문에 BULK_INSERT_MAX_ROWS개를 넘지 않습니다)
+    - author도 공백을 정규화하고 AUTHOR_MAX_LENGTH자로 자릅니다.
     성공적으로 저장된(신규) 개수를 반환합니다.
     """
-    saved_count = 0
+    batch_size = min(
+        batch_size or settings.QUOTE_IMPORT_BATCH_SIZE, BULK_INSERT_MAX_ROWS
+    )
+
+    rows: dict[str, tuple[str, str, str]] = {}
     for q in quotes:
-        _, created = await service_create_quote(q)
-        if created:
-            saved_count += 1
+        content = normalize_quote_content(q.get("content") or "")
+        if not content:
+            continue
+        content_hash = quote_content_hash(content)
+        if content_hash not in rows:
+            author = normalize_quote_content(q.get("author") or "")
+            author = author[:AUTHOR_MAX_LENGTH] or "작자 미상"
+            rows[content_hash] = (content, author, content_hash)
+
+    unique_rows = list(rows.values())
+    saved_count = 0
+    for start in range(0, len(unique_rows), batch_size):
+        inserted_ids = await QuoteModel.bulk_insert_ignore_duplicates(
+            unique_rows[start : start + batch_size]
+        )
+        quote_sampler.add(*inserted_ids)
+        saved_count += len(inserted_ids)
     return saved_count
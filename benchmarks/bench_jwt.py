@@ -0,0 +1,59 @@
+"""
+decode_token 캐시 효과 측정용 마이크로 벤치마크
+
+    uv run python -m benchmarks.bench_jwt
+
+같은 토큰을 반복해서 검증할 때(브라우저 세션) 요청 1회당 CPU 시간을 비교합니다.
+"""
+
+import os
+import time
+
+os.environ.setdefault("POSTGRES_USER", "bench")
+os.environ.setdefault("POSTGRES_PASSWORD", "bench")
+os.environ.setdefault("POSTGRES_HOST", "localhost")
+os.environ.setdefault("POSTGRES_PORT", "5432")
+os.environ.setdefault("POSTGRES_DB", "bench")
+os.environ.setdefault("JWT_SECRET_KEY", "bench-secret")
+
+from jose import jwt  # noqa: E402
+
+from app.core.jwt import (  # noqa: E402
+    JWT_ALGORITHM,
+    JWT_SECRET_KEY,
+    create_access_token,
+    decode_token,
+    token_cache,
+)
+
+ROUNDS = 20000
+
+
+def _per_call_us(fn, token: str, rounds: int) -> float:
+    start = time.process_time()
+    for _ in range(rounds):
+        fn(token)
+    return (time.process_time() - start) / rounds * 1_000_000
+
+
+def _uncached(token: str) -> dict:
+    return jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
+
+
+def main() -> None:
+    token = create_access_token(subject="1")
+    token_cache.clear()
+
+    uncached = _per_call_us(_uncached, token, ROUNDS)
+    cached = _per_call_us(decode_token, token, ROUNDS)
+
+    print(f"rounds            : {ROUNDS}")
+    print(f"jwt.decode        : {uncached:8.2f} us/request")
+    print(f"decode_token(캐시) : {cached:8.2f} us/request")
+    print(
+        f"절약              : {uncached - cached:8.2f} us/request ({uncached / cached:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
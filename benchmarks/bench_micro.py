@@ -0,0 +1,329 @@
+"""
+CPU 위주 핫 함수 마이크로 벤치마크 모음
+
+    uv run python -m benchmarks.bench_micro                      # 실행 + 결과 출력
+    uv run python -m benchmarks.bench_micro --save               # 기준선으로 저장
+    uv run python -m benchmarks.bench_micro --compare            # 기준선과 비교
+    uv run python -m benchmarks.bench_micro -k jwt -k pydantic   # 일부만
+
+고정된 입력(합성 HTML 페이지, 토큰 묶음, 일기 목록)으로 함수 1회 호출당
+시간(us)을 잽니다.
+- 각 케이스는 timeit으로 0.2초 이상 걸리는 반복 횟수를 정한 뒤 --repeat 번 재고
+  가장 빠른 값(min)을 씁니다. (다른 프로세스의 간섭을 덜 받는 값)
+- --compare 는 기준선보다 --threshold 이상 느려진 케이스가 있으면 종료 코드 1
+- 같은 머신 / 같은 설정(BCRYPT_ROUNDS 등)에서 잰 결과끼리만 비교하세요.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable
+
+os.environ.setdefault("POSTGRES_USER", "bench")
+os.environ.setdefault("POSTGRES_PASSWORD", "bench")
+os.environ.setdefault("POSTGRES_HOST", "localhost")
+os.environ.setdefault("POSTGRES_PORT", "5432")
+os.environ.setdefault("POSTGRES_DB", "bench")
+os.environ.setdefault("JWT_SECRET_KEY", "bench-secret")
+
+from pydantic import TypeAdapter  # noqa: E402
+from tortoise import Tortoise  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.core.jwt import create_access_token, decode_token, token_cache  # noqa: E402
+from app.core.responses import FastJSONResponse, rows_to_dicts  # noqa: E402
+from app.core.security import hash_password, verify_password  # noqa: E402
+from app.db.database import MODELS  # noqa: E402
+from app.models.diary import DiaryModel  # noqa: E402
+from app.models.quote import QuoteModel  # noqa: E402
+from app.schemas.diary import DiaryPageResponse, DiaryResponse  # noqa: E402
+from app.schemas.quote import QuoteResponse  # noqa: E402
+from app.scraping.quote_scraper import (  # noqa: E402
+    _clean_text,
+    _parse_quotes,
+    _split_content_author,
+)
+
+BASELINE = Path(__file__).parent / "results" / "micro-baseline.json"
+
+# ---- 고정 입력 ----
+
+_NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def quote_page_html(rows: int = 20) -> str:
+    """
+    명언 목록 페이지와 같은 구조의 HTML (제목 행 + 내용 행)
+    """
+    body = "".join(
+        f"""
+        <tr class="{"even" if i % 2 == 0 else "odd"}">
+          <td class="td_num">{i}</td>
+          <td class="td_subject"><div class="bo_tit"><a href="#">
+            오늘의   명언 {i}번째 </a></div></td>
+          <td class="td_name">관리자</td>
+        </tr>
+        <tr><td colspan="3">
+            삶이   있는 한   희망은 있다.
+            포기하지 않는 사람에게   {i}번째   기회는 반드시 온다 - 작가{i % 7}
+        </td></tr>
+        """
+        for i in range(rows)
+    )
+    return (
+        "<html><head><title>명언</title></head><body><div id='wrap'>"
+        f"<table><thead><tr><th>번호</th></tr></thead><tbody>{body}</tbody></table>"
+        "</div></body></html>"
+    )
+
+
+DETAIL_TEXTS = (
+    "  삶이 있는 한   희망은 있다.\n\n 포기하지 않는 사람에게 기회는 온다 - 키케로 ",
+    "행복은 습관이다. 그것을 몸에 지녀라 — 허버드",
+    "작가 구분자가 없는 긴 문장입니다 " * 4,
+    "천 리 길도 한 걸음부터\n- 속담",
+)
+
+
+def diary_models(count: int) -> list[DiaryModel]:
+    # DB에서 읽어 온 것과 같은 경로(_init_from_db)로 만듭니다.
+    return [
+        DiaryModel._init_from_db(
+            id=i,
+            user_id=1,
+            title=f"{i}번째 일기",
+            content="오늘은 산책을 하고 커피를 마셨다. " * 20,
+            created_at=_NOW - timedelta(minutes=i),
+            updated_at=_NOW - timedelta(minutes=i),
+        )
+        for i in range(count)
+    ]
+
+
+def quote_models(count: int) -> list[QuoteModel]:
+    return [
+        QuoteModel._init_from_db(
+            id=i,
+            content=f"{i}번째 명언 내용입니다. 포기하지 않는 사람에게 기회는 온다.",
+            author=f"작가{i % 7}",
+            content_hash=f"{i:064x}",
+            bookmark_count=i % 13,
+            created_at=_NOW,
+        )
+        for i in range(count)
+    ]
+
+
+# ---- 케이스: 이름 -> (준비 함수 -> 측정할 함수) ----
+
+CASES: dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def case(name: str):
+    def register(setup: Callable[[], Callable[[], object]]):
+        CASES[name] = setup
+        return setup
+
+    return register
+
+
+@case("scraper._clean_text")
+def _bench_clean_text():
+    text = DETAIL_TEXTS[0] * 5
+    return lambda: _clean_text(text)
+
+
+@case("scraper._split_content_author")
+def _bench_split_content_author():
+    def run():
+        for text in DETAIL_TEXTS:
+            _split_content_author(text)
+
+    return run
+
+
+@case("scraper._parse_quotes(20 rows, html.parser)")
+def _bench_parse_quotes():
+    html = quote_page_html(20)
+    return lambda: _parse_quotes(html, parser="html.parser")
+
+
+@case("jwt.create_access_token")
+def _bench_create_token():
+    return lambda: create_access_token(subject="12345")
+
+
+@case("jwt.decode_token(miss, 100 tokens)")
+def _bench_decode_miss():
+    tokens = [create_access_token(subject=str(i)) for i in range(100)]
+
+    def run():
+        token_cache.clear()
+        for token in tokens:
+            decode_token(token)
+
+    return run
+
+
+@case("jwt.decode_token(hit, 100 tokens)")
+def _bench_decode_hit():
+    tokens = [create_access_token(subject=str(i)) for i in range(100)]
+    for token in tokens:
+        decode_token(token)
+
+    def run():
+        for token in tokens:
+            decode_token(token)
+
+    return run
+
+
+@case(f"security.hash_password(rounds={settings.BCRYPT_ROUNDS})")
+def _bench_hash_password():
+    return lambda: hash_password("correct horse battery")
+
+
+@case(f"security.verify_password(rounds={settings.BCRYPT_ROUNDS})")
+def _bench_verify_password():
+    password_hash = hash_password("correct horse battery")
+    return lambda: verify_password("correct horse battery", password_hash)
+
+
+@case("pydantic.DiaryPageResponse(100 ORM rows)")
+def _bench_diary_page():
+    # FastAPI response_model 직렬화와 같은 방식 (from_attributes 검증 후 JSON bytes)
+    adapter = TypeAdapter(DiaryPageResponse)
+    page = {"items": diary_models(100), "next_cursor": None}
+
+    def run():
+        adapter.dump_json(adapter.validate_python(page, from_attributes=True))
+
+    return run
+
+
+@case("fast_json.DiaryPageResponse(100 ORM rows)")
+def _bench_diary_page_fast():
+    # FAST_JSON_RESPONSES 경로 (검증 없이 필드만 골라 orjson)
+    diaries = diary_models(100)
+
+    def run():
+        FastJSONResponse(
+            {"items": rows_to_dicts(diaries, DiaryResponse), "next_cursor": None}
+        )
+
+    return run
+
+
+@case("pydantic.QuoteResponse(100 ORM rows)")
+def _bench_quote_response():
+    quotes = quote_models(100)
+
+    def run():
+        for quote in quotes:
+            QuoteResponse.model_validate(quote).model_dump(mode="json")
+
+    return run
+
+
+# ---- 측정 / 비교 ----
+
+
+def measure(fn: Callable[[], object], repeat: int) -> dict:
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    per_call = [t / number * 1_000_000 for t in timer.repeat(repeat, number)]
+    return {
+        "us_per_call": round(min(per_call), 3),
+        "median_us": round(statistics.median(per_call), 3),
+        "number": number,
+    }
+
+
+def _init_models() -> None:
+    # ORM 인스턴스를 만들기 위한 초기화만 합니다. (쿼리 없음)
+    asyncio.run(
+        Tortoise.init(
+            db_url="sqlite://:memory:",
+            modules={"models": [m for m in MODELS if m != "aerich.models"]},
+        )
+    )
+
+
+def run(patterns: list[str], repeat: int) -> dict:
+    _init_models()
+    results = {}
+    for name, setup in CASES.items():
+        if patterns and not any(p in name for p in patterns):
+            continue
+        results[name] = measure(setup(), repeat)
+        print(f"{name:<48}{results[name]['us_per_call']:>14,.2f} us")
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> int:
+    """
+    기준선 대비 변화율을 출력하고 threshold 이상 느려진 케이스 수를 반환합니다.
+    """
+    slower = 0
+    print(f"{'case':<48}{'baseline':>12}{'now':>12}{'change':>10}")
+    for name, now in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            print(f"{name:<48}{'-':>12}{now['us_per_call']:>12,.2f}")
+            continue
+        change = now["us_per_call"] / base["us_per_call"] - 1
+        flag = ""
+        if change >= threshold:
+            slower += 1
+            flag = "  <- 느려짐"
+        print(
+            f"{name:<48}{base['us_per_call']:>12,.2f}{now['us_per_call']:>12,.2f}"
+            f"{change:>+10.1%}{flag}"
+        )
+    return slower
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="CPU 핫 함수 마이크로 벤치마크")
+    parser.add_argument(
+        "-k", dest="patterns", action="append", default=[], help="이름 일부로 선택"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save", action="store_true", help="결과를 기준선으로 저장")
+    parser.add_argument("--compare", action="store_true", help="기준선과 비교")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="느려짐 허용 비율 (비교 시)"
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    current = run(args.patterns, args.repeat)
+
+    if args.save:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(current, ensure_ascii=False, indent=2))
+        print(f"saved: {args.baseline}")
+
+    if args.compare:
+        baseline = json.loads(args.baseline.read_text())
+        print()
+        sys.exit(1 if compare(baseline, current, args.threshold) else 0)
+
+
+if __name__ == "__main__":
+    main()
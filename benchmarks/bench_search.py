@@ -0,0 +1,94 @@
+"""
+일기 검색(/v1/diary/search) 쿼리 지연 측정용 벤치마크
+
+    uv run python -m benchmarks.bench_search
+
+POSTGRES_* 환경변수의 DB에 벤치마크 사용자와 합성 한글 일기(1천/1만/10만 건)를 넣고
+검색어별 DiaryModel.search_by_user 평균 지연을 출력합니다.
+- 흔한 검색어: 29단어 어휘에서 뽑은 본문이라 대부분의 일기와 일치합니다.
+  최근 DIARY_SEARCH_MAX_CANDIDATES개에서 멈추므로 일기 수가 늘어도 거의 일정해야 합니다.
+- 드문 검색어: 일기의 1% / 0.1%에만 들어 있습니다. trigram 인덱스로 일치하는
+  일기만 읽으므로 일치 수에 비례합니다. (전체 일기 수에는 비례하지 않음)
+- 마이그레이션(idx_diaries_search_trgm)이 적용된 DB에서 실행해야 인덱스 효과가 보입니다.
+- 실행 후 벤치마크 사용자와 일기는 삭제됩니다.
+"""
+
+import asyncio
+import os
+import random
+import time
+
+os.environ.setdefault("POSTGRES_USER", "bench")
+os.environ.setdefault("POSTGRES_PASSWORD", "bench")
+os.environ.setdefault("POSTGRES_HOST", "localhost")
+os.environ.setdefault("POSTGRES_PORT", "5432")
+os.environ.setdefault("POSTGRES_DB", "bench")
+os.environ.setdefault("JWT_SECRET_KEY", "bench-secret")
+
+from tortoise import Tortoise  # noqa: E402
+
+from app.db.database import TORTOISE_CONFIG  # noqa: E402
+from app.models.diary import DiaryModel  # noqa: E402
+from app.models.user import UserModel  # noqa: E402
+
+SIZES = (1_000, 10_000, 100_000)
+COMMON_QUERIES = ("산책", "커피", "비 오는 날", "회의")
+# (검색어, 일기에 들어갈 확률)
+RARE_TERMS = (("제주도", 0.01), ("오로라", 0.001))
+ROUNDS = 20
+BATCH = 1_000
+
+WORDS = (
+    "오늘 아침 산책 커피 회의 친구 저녁 비 오는 날 바람 책 영화 운동 점심 "
+    "가족 여행 공원 카페 음악 일기 하늘 바다 산 기차 버스 퇴근 출근 주말"
+).split()
+
+
+def _sentence(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(20, 60)))
+
+
+def _content(rng: random.Random) -> str:
+    rare = [term for term, rate in RARE_TERMS if rng.random() < rate]
+    return " ".join([_sentence(rng), *rare])
+
+
+async def _seed(user: UserModel, count: int, rng: random.Random) -> None:
+    for start in range(0, count, BATCH):
+        await DiaryModel.bulk_create(
+            [
+                DiaryModel(user=user, title=_sentence(rng)[:50], content=_content(rng))
+                for _ in range(min(BATCH, count - start))
+            ]
+        )
+
+
+async def main() -> None:
+    await Tortoise.init(config=TORTOISE_CONFIG)
+    rng = random.Random(42)
+    user = await UserModel.create(
+        username=f"bench-search-{int(time.time())}",
+        email=f"bench-search-{int(time.time())}@example.com",
+        password_hash="-",
+    )
+    try:
+        seeded = 0
+        for size in SIZES:
+            await _seed(user, size - seeded, rng)
+            seeded = size
+            print(f"[{size:>7,} diaries]")
+            for query in (*COMMON_QUERIES, *(term for term, _ in RARE_TERMS)):
+                await DiaryModel.search_by_user(user.user_id, query, limit=20)
+                start = time.perf_counter()
+                for _ in range(ROUNDS):
+                    await DiaryModel.search_by_user(user.user_id, query, limit=20)
+                elapsed = (time.perf_counter() - start) / ROUNDS * 1000
+                print(f"  {query!r:<12} {elapsed:8.2f} ms/query")
+    finally:
+        await DiaryModel.filter(user_id=user.user_id).delete()
+        await user.delete()
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
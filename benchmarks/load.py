@@ -0,0 +1,406 @@
+"""
+부하 테스트 드라이버 (실제 요청 혼합을 재생)
+
+    uv run python -m benchmarks.seed --reset                   # 1) 합성 데이터
+    uv run uvicorn app.main:app --workers 4                    # 2) 다른 터미널에서 서버
+    uv run python -m benchmarks.load --users 50 --duration 60  # 3) 부하
+
+가상 사용자(--users)마다 seed로 만든 계정에 로그인한 뒤 MIX 비율대로 요청을 보내고,
+엔드포인트별 처리량과 p50 / p95 / p99 지연을 출력하고 JSON으로 저장합니다.
+- 처음 --warmup 초 동안의 요청은 집계하지 않습니다.
+- 두 결과 비교: uv run python -m benchmarks.load --compare 이전.json 새.json
+  (p95가 --threshold 이상 느려진 엔드포인트가 있으면 종료 코드 1)
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import subprocess
+import sys
+import time
+import uuid
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+from benchmarks.seed import DEFAULT_PASSWORD, user_email
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+class Recorder:
+    """
+    엔드포인트 이름별 지연(ms)과 상태 코드를 모읍니다.
+    - recording이 False인 동안(워밍업)에는 버립니다.
+    """
+
+    def __init__(self):
+        self.recording = False
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.statuses: dict[str, Counter] = defaultdict(Counter)
+        self.errors: Counter = Counter()
+
+    def add(self, name: str, elapsed_ms: float, status: int, ok: bool) -> None:
+        if not self.recording:
+            return
+        self.latencies[name].append(elapsed_ms)
+        self.statuses[name][str(status)] += 1
+        if not ok:
+            self.errors[name] += 1
+
+
+class VirtualUser:
+    def __init__(
+        self, client: httpx.AsyncClient, recorder: Recorder, prefix: str, seed: int
+    ):
+        self.client = client
+        self.prefix = prefix
+        self.recorder = recorder
+        self.rng = random.Random(seed)
+        self.headers: dict = {}
+        self.diary_ids: list[int] = []
+        self.bookmarked: set[int] = set()
+        self.quote_id: Optional[int] = None
+
+    async def request(
+        self,
+        name: str,
+        method: str,
+        url: str,
+        expected: tuple = (200,),
+        **kwargs,
+    ) -> Optional[httpx.Response]:
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(
+                method, url, headers=self.headers, **kwargs
+            )
+        except httpx.HTTPError:
+            # 연결 실패 / 타임아웃은 상태 코드 0으로 기록
+            self.recorder.add(name, (time.perf_counter() - started) * 1000, 0, False)
+            return None
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        ok = response.status_code in expected
+        self.recorder.add(name, elapsed_ms, response.status_code, ok)
+        return response if ok else None
+
+    async def login(self, email: str, password: str) -> bool:
+        response = await self.request(
+            "POST /auth/login",
+            "POST",
+            "/auth/login",
+            json={"email": email, "password": password},
+        )
+        if response is None:
+            return False
+        self.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        return True
+
+
+# ---- 요청 종류 (가상 사용자 1명이 한 번에 하는 일) ----
+
+
+async def op_register(vu: VirtualUser) -> None:
+    # seed --reset 이 같이 지우도록 같은 prefix를 씁니다.
+    name = f"{vu.prefix}-new-{uuid.uuid4().hex[:12]}"
+    email = f"{name}@example.com"
+    created = await vu.request(
+        "POST /auth/register",
+        "POST",
+        "/auth/register",
+        expected=(201,),
+        json={"username": name, "email": email, "password": DEFAULT_PASSWORD},
+    )
+    if created is not None:
+        # 새 계정으로 로그인만 확인하고 원래 계정 토큰은 유지합니다.
+        headers = vu.headers
+        await vu.login(email, DEFAULT_PASSWORD)
+        vu.headers = headers
+
+
+async def op_me(vu: VirtualUser) -> None:
+    await vu.request("GET /auth/me", "GET", "/auth/me")
+
+
+async def op_diary_list(vu: VirtualUser) -> None:
+    response = await vu.request(
+        "GET /v1/diary/", "GET", "/v1/diary/", params={"limit": 20}
+    )
+    if response is not None and not vu.diary_ids:
+        vu.diary_ids = [d["id"] for d in response.json()["items"]]
+
+
+async def op_diary_create(vu: VirtualUser) -> None:
+    response = await vu.request(
+        "POST /v1/diary/",
+        "POST",
+        "/v1/diary/",
+        expected=(201,),
+        json={"title": "부하 테스트", "content": "오늘 " * vu.rng.randint(10, 200)},
+    )
+    if response is not None:
+        vu.diary_ids.append(response.json()["id"])
+
+
+async def op_diary_read(vu: VirtualUser) -> None:
+    if vu.diary_ids:
+        diary_id = vu.rng.choice(vu.diary_ids)
+        await vu.request("GET /v1/diary/{diary_id}", "GET", f"/v1/diary/{diary_id}")
+
+
+async def op_diary_update(vu: VirtualUser) -> None:
+    if vu.diary_ids:
+        diary_id = vu.rng.choice(vu.diary_ids)
+        await vu.request(
+            "PATCH /v1/diary/{diary_id}",
+            "PATCH",
+            f"/v1/diary/{diary_id}",
+            json={"title": f"수정 {vu.rng.randint(0, 9999)}"},
+        )
+
+
+async def op_diary_delete(vu: VirtualUser) -> None:
+    if len(vu.diary_ids) > 1:
+        diary_id = vu.diary_ids.pop(vu.rng.randrange(len(vu.diary_ids)))
+        await vu.request(
+            "DELETE /v1/diary/{diary_id}", "DELETE", f"/v1/diary/{diary_id}"
+        )
+
+
+async def op_quote_random(vu: VirtualUser) -> None:
+    response = await vu.request("GET /quote/random", "GET", "/quote/random")
+    if response is not None:
+        vu.quote_id = response.json()["id"]
+
+
+async def op_bookmark_add(vu: VirtualUser) -> None:
+    if vu.quote_id is not None:
+        await vu.request(
+            "POST /quote/{quote_id}/bookmark",
+            "POST",
+            f"/quote/{vu.quote_id}/bookmark",
+            expected=(200, 201),
+        )
+        vu.bookmarked.add(vu.quote_id)
+
+
+async def op_bookmark_list(vu: VirtualUser) -> None:
+    await vu.request("GET /quote/bookmark", "GET", "/quote/bookmark")
+
+
+async def op_bookmark_delete(vu: VirtualUser) -> None:
+    if vu.bookmarked:
+        quote_id = vu.bookmarked.pop()
+        await vu.request(
+            "DELETE /quote/{quote_id}/bookmark",
+            "DELETE",
+            f"/quote/{quote_id}/bookmark",
+            expected=(200, 404),
+        )
+
+
+async def op_question(vu: VirtualUser) -> None:
+    # 같은 날 다시 호출하면 같은 질문을 200으로 돌려줍니다. (400은 오류로 셉니다)
+    await vu.request(
+        "GET /questions/random", "GET", "/questions/random", expected=(200,)
+    )
+
+
+# (요청 종류, 가중치) - 읽기 위주의 실제 사용 비율을 흉내 냅니다.
+MIX = (
+    (op_me, 15),
+    (op_diary_list, 15),
+    (op_diary_read, 12),
+    (op_diary_create, 8),
+    (op_diary_update, 5),
+    (op_diary_delete, 2),
+    (op_quote_random, 15),
+    (op_bookmark_list, 8),
+    (op_bookmark_add, 6),
+    (op_bookmark_delete, 3),
+    (op_question, 5),
+    (op_register, 1),
+)
+
+
+async def _virtual_user(vu: VirtualUser, index: int, args, deadline: float) -> None:
+    if not await vu.login(user_email(args.prefix, index), args.password):
+        return
+    ops = [op for op, _ in MIX]
+    weights = [weight for _, weight in MIX]
+    while time.monotonic() < deadline:
+        await vu.rng.choices(ops, weights=weights)[0](vu)
+        if args.think_time:
+            await asyncio.sleep(vu.rng.expovariate(1 / args.think_time))
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    # nearest-rank
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(0, math.ceil(q / 100 * len(sorted_values)) - 1)]
+
+
+def summarize(recorder: Recorder, seconds: float) -> dict:
+    endpoints = {}
+    for name in sorted(recorder.latencies):
+        values = sorted(recorder.latencies[name])
+        endpoints[name] = {
+            "count": len(values),
+            "errors": recorder.errors[name],
+            "rps": round(len(values) / seconds, 2),
+            "mean_ms": round(sum(values) / len(values), 2),
+            "p50_ms": round(percentile(values, 50), 2),
+            "p95_ms": round(percentile(values, 95), 2),
+            "p99_ms": round(percentile(values, 99), 2),
+            "max_ms": round(values[-1], 2),
+            "statuses": dict(recorder.statuses[name]),
+        }
+    everything = sorted(v for values in recorder.latencies.values() for v in values)
+    total = {
+        "count": len(everything),
+        "errors": sum(recorder.errors.values()),
+        "rps": round(len(everything) / seconds, 2),
+        "p50_ms": round(percentile(everything, 50), 2),
+        "p95_ms": round(percentile(everything, 95), 2),
+        "p99_ms": round(percentile(everything, 99), 2),
+    }
+    return {"total": total, "endpoints": endpoints}
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args: argparse.Namespace) -> dict:
+    recorder = Recorder()
+    limits = httpx.Limits(
+        max_connections=args.users, max_keepalive_connections=args.users
+    )
+    async with httpx.AsyncClient(
+        base_url=args.base_url, limits=limits, timeout=args.timeout
+    ) as client:
+        started_at = datetime.now(timezone.utc)
+        deadline = time.monotonic() + args.warmup + args.duration
+        users = [
+            VirtualUser(client, recorder, args.prefix, args.seed + i)
+            for i in range(args.users)
+        ]
+        tasks = [
+            asyncio.create_task(_virtual_user(vu, i, args, deadline))
+            for i, vu in enumerate(users)
+        ]
+
+        await asyncio.sleep(args.warmup)
+        recorder.recording = True
+        measure_started = time.monotonic()
+        await asyncio.gather(*tasks)
+        seconds = time.monotonic() - measure_started
+
+    return {
+        "started_at": started_at.isoformat(),
+        "git_commit": _git_commit(),
+        "base_url": args.base_url,
+        "users": args.users,
+        "duration_seconds": round(seconds, 2),
+        "warmup_seconds": args.warmup,
+        "think_time_seconds": args.think_time,
+        **summarize(recorder, seconds),
+    }
+
+
+def print_report(report: dict) -> None:
+    print(
+        f"{'endpoint':<36}{'count':>8}{'err':>6}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}"
+    )
+    rows = [*report["endpoints"].items(), ("TOTAL", report["total"])]
+    for name, s in rows:
+        print(
+            f"{name:<36}{s['count']:>8}{s['errors']:>6}{s['rps']:>9.1f}"
+            f"{s['p50_ms']:>9.1f}{s['p95_ms']:>9.1f}{s['p99_ms']:>9.1f}"
+        )
+
+
+def compare(before_path: str, after_path: str, threshold: float) -> int:
+    """
+    두 결과 JSON의 엔드포인트별 p50 / p95 / 처리량을 비교합니다.
+    p95가 threshold(비율) 이상 늘어난 엔드포인트 수를 반환합니다.
+    """
+    before = json.loads(Path(before_path).read_text())
+    after = json.loads(Path(after_path).read_text())
+    print(f"{before.get('git_commit')} -> {after.get('git_commit')}")
+    print(f"{'endpoint':<36}{'p50':>18}{'p95':>18}{'rps':>16}")
+
+    regressions = 0
+    for name, new in after["endpoints"].items():
+        old = before["endpoints"].get(name)
+        if old is None:
+            continue
+        change = (new["p95_ms"] - old["p95_ms"]) / old["p95_ms"] if old["p95_ms"] else 0
+        flag = ""
+        if change >= threshold:
+            regressions += 1
+            flag = "  <- 느려짐"
+        print(
+            f"{name:<36}"
+            f"{old['p50_ms']:>8.1f} → {new['p50_ms']:<7.1f}"
+            f"{old['p95_ms']:>8.1f} → {new['p95_ms']:<7.1f}"
+            f"{old['rps']:>7.1f} → {new['rps']:<6.1f}{flag}"
+        )
+    return regressions
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="부하 테스트 드라이버")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--users", type=int, default=20, help="동시 가상 사용자 수")
+    parser.add_argument("--duration", type=float, default=30.0, help="측정 시간(초)")
+    parser.add_argument("--warmup", type=float, default=5.0, help="워밍업 시간(초)")
+    parser.add_argument(
+        "--think-time", type=float, default=0.0, help="요청 사이 평균 대기(초)"
+    )
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--prefix", default="load", help="benchmarks.seed 의 prefix")
+    parser.add_argument("--password", default=DEFAULT_PASSWORD)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmarks/results/)")
+    parser.add_argument(
+        "--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="결과 두 개 비교"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="p95 증가 허용 비율 (비교 시)"
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.compare:
+        sys.exit(1 if compare(*args.compare, args.threshold) else 0)
+
+    report = asyncio.run(run(args))
+    print_report(report)
+
+    output = Path(
+        args.output or RESULTS_DIR / f"load-{datetime.now():%Y%m%d-%H%M%S}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2))
+    print(f"saved: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+부하 테스트(benchmarks.load)용 합성 데이터 생성
+
+    uv run python -m benchmarks.seed --users 200 --diaries 50 --quotes 2000 \
+        --questions 300 --bookmarks 20
+
+POSTGRES_* 환경변수의 DB에 사용자 / 일기 / 명언 / 질문 / 북마크를
+bulk_create로 넣습니다.
+- 사용자 이메일은 {prefix}-{번호}@example.com, 비밀번호는 모두 --password 입니다.
+  (benchmarks.load 가 같은 규칙으로 로그인합니다)
+- --seed 가 같으면 같은 데이터가 만들어집니다.
+- --reset 은 같은 prefix로 만든 이전 데이터(부하 중 가입한 계정 포함)를 먼저 지웁니다.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault("POSTGRES_USER", "bench")
+os.environ.setdefault("POSTGRES_PASSWORD", "bench")
+os.environ.setdefault("POSTGRES_HOST", "localhost")
+os.environ.setdefault("POSTGRES_PORT", "5432")
+os.environ.setdefault("POSTGRES_DB", "bench")
+os.environ.setdefault("JWT_SECRET_KEY", "bench-secret")
+
+from tortoise import Tortoise  # noqa: E402
+
+from app.core.security import hash_password  # noqa: E402
+from app.db.database import TORTOISE_CONFIG  # noqa: E402
+from app.models.bookmark import BookmarkModel  # noqa: E402
+from app.models.diary import DiaryModel  # noqa: E402
+from app.models.question import QuestionModel  # noqa: E402
+from app.models.quote import QuoteModel, quote_content_hash  # noqa: E402
+from app.models.user import UserModel  # noqa: E402
+
+DEFAULT_PASSWORD = "loadtest-password"
+BATCH = 1_000
+
+WORDS = (
+    "오늘 아침 산책 커피 회의 친구 저녁 비 오는 날 바람 책 영화 운동 점심 "
+    "가족 여행 공원 카페 음악 일기 하늘 바다 산 기차 버스 퇴근 출근 주말"
+).split()
+
+
+def user_email(prefix: str, index: int) -> str:
+    return f"{prefix}-{index}@example.com"
+
+
+def _sentence(rng: random.Random, low: int, high: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(low, high)))
+
+
+async def _bulk_create(model, objects: list) -> None:
+    for start in range(0, len(objects), BATCH):
+        await model.bulk_create(objects[start : start + BATCH])
+
+
+async def reset(prefix: str) -> None:
+    """
+    같은 prefix로 만든 사용자(일기, 북마크는 CASCADE) / 명언 / 질문을 지웁니다.
+    """
+    await UserModel.filter(email__startswith=f"{prefix}-").delete()
+    await QuoteModel.filter(author=prefix).delete()
+    await QuestionModel.filter(question_text__startswith=f"[{prefix}]").delete()
+
+
+async def seed(args: argparse.Namespace) -> dict:
+    rng = random.Random(args.seed)
+    now = datetime.now(timezone.utc)
+    # bcrypt는 느리므로 해시는 한 번만 만들어 모든 사용자가 같이 씁니다.
+    password_hash = hash_password(args.password)
+    emails = [user_email(args.prefix, i) for i in range(args.users)]
+
+    await _bulk_create(
+        UserModel,
+        [
+            UserModel(
+                username=f"{args.prefix}-{i}",
+                email=emails[i],
+                password_hash=password_hash,
+                is_active=True,
+            )
+            for i in range(args.users)
+        ],
+    )
+    user_ids = []
+    for start in range(0, len(emails), BATCH):
+        user_ids += await UserModel.filter(
+            email__in=emails[start : start + BATCH]
+        ).values_list("user_id", flat=True)
+
+    # 최근 1년 사이에 고르게 흩어진 작성 시각
+    diaries = [
+        DiaryModel(
+            user_id=user_id,
+            title=_sentence(rng, 2, 6)[:50],
+            content=_sentence(rng, 20, 120),
+            created_at=now - timedelta(seconds=rng.randint(0, 365 * 24 * 60 * 60)),
+        )
+        for user_id in user_ids
+        for _ in range(args.diaries)
+    ]
+    await _bulk_create(DiaryModel, diaries)
+
+    contents = [f"{_sentence(rng, 5, 15)} #{i}" for i in range(args.quotes)]
+    await _bulk_create(
+        QuoteModel,
+        [
+            QuoteModel(
+                content=c, author=args.prefix, content_hash=quote_content_hash(c)
+            )
+            for c in contents
+        ],
+    )
+    quote_ids = await QuoteModel.filter(author=args.prefix).values_list("id", flat=True)
+
+    await _bulk_create(
+        QuestionModel,
+        [
+            QuestionModel(question_text=f"[{args.prefix}] {_sentence(rng, 4, 10)}?")
+            for _ in range(args.questions)
+        ],
+    )
+
+    # 인기 명언이 생기도록 앞쪽 명언에 북마크가 몰리게 뽑습니다.
+    weights = [1 / (rank + 1) for rank in range(len(quote_ids))]
+    bookmarks = []
+    for user_id in user_ids:
+        picked = set()
+        while quote_ids and len(picked) < min(args.bookmarks, len(quote_ids)):
+            picked.update(rng.choices(quote_ids, weights=weights, k=args.bookmarks))
+        bookmarks.extend(
+            BookmarkModel(user_id=user_id, quote_id=quote_id)
+            for quote_id in list(picked)[: args.bookmarks]
+        )
+    await _bulk_create(BookmarkModel, bookmarks)
+    await QuoteModel.reconcile_bookmark_counts()
+
+    return {
+        "users": len(user_ids),
+        "diaries": len(diaries),
+        "quotes": len(quote_ids),
+        "questions": args.questions,
+        "bookmarks": len(bookmarks),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="부하 테스트용 합성 데이터 생성")
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--diaries", type=int, default=50, help="사용자당 일기 수")
+    parser.add_argument("--quotes", type=int, default=1_000)
+    parser.add_argument("--questions", type=int, default=200)
+    parser.add_argument("--bookmarks", type=int, default=10, help="사용자당 북마크 수")
+    parser.add_argument("--prefix", default="load")
+    parser.add_argument("--password", default=DEFAULT_PASSWORD)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--reset", action="store_true", help="이전 데이터 먼저 삭제")
+    return parser.parse_args()
+
+
+async def main() -> None:
+    args = parse_args()
+    await Tortoise.init(config=TORTOISE_CONFIG)
+    try:
+        if args.reset:
+            await reset(args.prefix)
+        started = time.perf_counter()
+        counts = await seed(args)
+        elapsed = time.perf_counter() - started
+        for name, count in counts.items():
+            print(f"{name:<10} {count:>10,}")
+        print(f"{elapsed:.1f}s")
+    finally:
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "users" (
+            "user_id" SERIAL NOT NULL PRIMARY KEY,
+            "username" VARCHAR(50) NOT NULL UNIQUE,
+            "password_hash" VARCHAR(255) NOT NULL,
+            "email" VARCHAR(255) NOT NULL UNIQUE,
+            "is_active" BOOL NOT NULL  DEFAULT True,
+            "created_at" TIMESTAMPTZ NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+            "updated_at" TIMESTAMPTZ NOT NULL  DEFAULT CURRENT_TIMESTAMP
+        );
+        COMMENT ON COLUMN "users"."username" IS 'User''s username';
+        COMMENT ON COLUMN "users"."password_hash" IS 'User''s password';
+        COMMENT ON COLUMN "users"."email" IS 'User''s email address';
+        COMMENT ON COLUMN "users"."is_active" IS 'User''s active status';
+        CREATE TABLE IF NOT EXISTS "diaries" (
+            "id" BIGSERIAL NOT NULL PRIMARY KEY,
+            "created_at" TIMESTAMPTZ NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+            "title" VARCHAR(255) NOT NULL,
+            "content" TEXT NOT NULL,
+            "updated_at" TIMESTAMPTZ NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+            "user_id" INT NOT NULL REFERENCES "users" ("user_id") ON DELETE CASCADE
+        );
+        COMMENT ON COLUMN "diaries"."title" IS '일기 제목';
+        COMMENT ON COLUMN "diaries"."content" IS '일기 내용';
+        CREATE TABLE IF NOT EXISTS "quotes" (
+            "id" BIGSERIAL NOT NULL PRIMARY KEY,
+            "created_at" TIMESTAMPTZ NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+            "content" TEXT NOT NULL,
+            "author" VARCHAR(100)
+        );
+        COMMENT ON COLUMN "quotes"."content" IS '명언 내용';
+        COMMENT ON COLUMN "quotes"."author" IS '작성자';
+        COMMENT ON TABLE "quotes" IS '명언(Quote) 모델';
+        CREATE TABLE IF NOT EXISTS "questions" (
+            "id" BIGSERIAL NOT NULL PRIMARY KEY,
+            "created_at" TIMESTAMPTZ NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+            "question_text" TEXT NOT NULL
+        );
+        COMMENT ON COLUMN "questions"."question_text" IS '스크래핑 질문';
+        COMMENT ON TABLE "questions" IS 'questions 테이블에 대응되는 tortoise ORM 모델';
+        CREATE TABLE IF NOT EXISTS "bookmarks" (
+            "id" BIGSERIAL NOT NULL PRIMARY KEY,
+            "created_at" TIMESTAMPTZ NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+            "quote_id" BIGINT NOT NULL REFERENCES "quotes" ("id") ON DELETE CASCADE,
+            "user_id" INT NOT NULL REFERENCES "users" ("user_id") ON DELETE CASCADE,
+            CONSTRAINT "uid_bookmarks_user_id_176fbb" UNIQUE ("user_id", "quote_id")
+        );
+        CREATE TABLE IF NOT EXISTS "user_questions" (
+            "id" BIGSERIAL NOT NULL PRIMARY KEY,
+            "created_at" TIMESTAMPTZ NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+            "questions_id" BIGINT NOT NULL,
+            "user_id" INT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS "question_decks" (
+            "id" BIGSERIAL NOT NULL PRIMARY KEY,
+            "created_at" TIMESTAMPTZ NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+            "deck" BYTEA NOT NULL,
+            "size" INT NOT NULL,
+            "position" INT NOT NULL  DEFAULT 0,
+            "user_id" INT NOT NULL UNIQUE REFERENCES "users" ("user_id") ON DELETE CASCADE
+        );
+        COMMENT ON COLUMN "question_decks"."deck" IS '섞인 질문 id 목록 (int64 packed)';
+        COMMENT ON COLUMN "question_decks"."size" IS '덱에 들어있는 질문 수';
+        COMMENT ON COLUMN "question_decks"."position" IS '다음에 뽑을 위치';
+        COMMENT ON TABLE "question_decks" IS '유저별로 섞어 둔 질문 덱';
+        CREATE TABLE IF NOT EXISTS "aerich" (
+            "id" SERIAL NOT NULL PRIMARY KEY,
+            "version" VARCHAR(255) NOT NULL,
+            "app" VARCHAR(100) NOT NULL,
+            "content" JSONB NOT NULL
+        );"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        """
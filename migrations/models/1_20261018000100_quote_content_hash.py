@@ -0,0 +1,26 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "quotes" ADD COLUMN IF NOT EXISTS "content_hash" VARCHAR(64) UNIQUE;
+        COMMENT ON COLUMN "quotes"."content_hash" IS '정규화한 명언 내용의 sha256 (중복 방지)';
+        UPDATE "quotes" SET "content_hash" = h."hash"
+        FROM (
+            SELECT DISTINCT ON ("hash") "id", "hash"
+            FROM (
+                SELECT "id", encode(sha256(convert_to(
+                    btrim(regexp_replace("content", '\\s+', ' ', 'g')), 'UTF8'
+                )), 'hex') AS "hash"
+                FROM "quotes"
+                WHERE "content_hash" IS NULL
+            ) s
+            ORDER BY "hash", "id"
+        ) h
+        WHERE "quotes"."id" = h."id"
+          AND NOT EXISTS (SELECT 1 FROM "quotes" e WHERE e."content_hash" = h."hash");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "quotes" DROP COLUMN IF EXISTS "content_hash";"""
@@ -0,0 +1,16 @@
+from tortoise import BaseDBAsyncClient
+
+# 한글 trigram 인덱싱은 DB의 LC_CTYPE이 UTF-8 계열(C.UTF-8, ko_KR.UTF-8)이어야 합니다.
+# LC_CTYPE=C 이면 pg_trgm이 한글을 단어 문자로 보지 않아 인덱스를 타지 못합니다.
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        CREATE EXTENSION IF NOT EXISTS btree_gin;
+        CREATE INDEX IF NOT EXISTS "idx_diaries_search_trgm" ON "diaries" USING GIN ("user_id", ("title" || ' ' || "content") gin_trgm_ops);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_diaries_search_trgm";"""
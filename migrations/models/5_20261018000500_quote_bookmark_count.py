@@ -0,0 +1,17 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "quotes" ADD COLUMN IF NOT EXISTS "bookmark_count" INT NOT NULL DEFAULT 0;
+        COMMENT ON COLUMN "quotes"."bookmark_count" IS '북마크 수 (북마크 추가/해제와 같은 트랜잭션에서 증감)';
+        UPDATE "quotes" SET "bookmark_count" = "counted"."cnt"
+        FROM (SELECT "quote_id", COUNT(*) AS "cnt" FROM "bookmarks" GROUP BY "quote_id") AS "counted"
+        WHERE "quotes"."id" = "counted"."quote_id";
+        CREATE INDEX IF NOT EXISTS "idx_quotes_bookmar_cb84e3" ON "quotes" ("bookmark_count", "id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_quotes_bookmar_cb84e3";
+        ALTER TABLE "quotes" DROP COLUMN IF EXISTS "bookmark_count";"""
@@ -0,0 +1,20 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "user_versions" (
+            "id" BIGSERIAL NOT NULL PRIMARY KEY,
+            "created_at" TIMESTAMPTZ NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+            "diary_version" BIGINT NOT NULL  DEFAULT 0,
+            "bookmark_version" BIGINT NOT NULL  DEFAULT 0,
+            "user_id" INT NOT NULL UNIQUE REFERENCES "users" ("user_id") ON DELETE CASCADE
+        );
+        COMMENT ON COLUMN "user_versions"."diary_version" IS '일기 변경 횟수';
+        COMMENT ON COLUMN "user_versions"."bookmark_version" IS '북마크 변경 횟수';
+        COMMENT ON TABLE "user_versions" IS '유저별 리소스 버전 (ETag / If-None-Match 용)';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "user_versions";"""
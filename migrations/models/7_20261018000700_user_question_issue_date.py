@@ -0,0 +1,34 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "users" ADD COLUMN IF NOT EXISTS "timezone" VARCHAR(64) NOT NULL DEFAULT 'Asia/Seoul';
+        COMMENT ON COLUMN "users"."timezone" IS '유저 시간대 (IANA 이름, 하루 경계 계산용)';
+        ALTER TABLE "user_questions" ADD COLUMN IF NOT EXISTS "issue_date" DATE;
+        COMMENT ON COLUMN "user_questions"."issue_date" IS '질문을 받은 날짜 (유저 시간대 기준)';
+        UPDATE "user_questions" AS "uq" SET "issue_date" = ("uq"."created_at" AT TIME ZONE "u"."timezone")::date
+        FROM "users" AS "u"
+        WHERE "u"."user_id" = "uq"."user_id" AND "uq"."issue_date" IS NULL;
+        UPDATE "user_questions" SET "issue_date" = ("created_at" AT TIME ZONE 'Asia/Seoul')::date
+        WHERE "issue_date" IS NULL;
+        CREATE TABLE IF NOT EXISTS "user_questions_duplicates" (LIKE "user_questions" INCLUDING DEFAULTS);
+        COMMENT ON TABLE "user_questions_duplicates" IS '같은 날 두 번째 이후로 받은 질문 기록 (issue_date unique 전환 때 옮겨 둔 행)';
+        WITH "moved" AS (
+            DELETE FROM "user_questions" AS "a" USING "user_questions" AS "b"
+            WHERE "a"."user_id" = "b"."user_id" AND "a"."issue_date" = "b"."issue_date" AND "a"."id" > "b"."id"
+            RETURNING "a".*
+        )
+        INSERT INTO "user_questions_duplicates" SELECT * FROM "moved";
+        ALTER TABLE "user_questions" ALTER COLUMN "issue_date" SET NOT NULL;
+        CREATE UNIQUE INDEX IF NOT EXISTS "uidx_user_questions_user_issue" ON "user_questions" ("user_id", "issue_date") INCLUDE ("questions_id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "uidx_user_questions_user_issue";
+        INSERT INTO "user_questions" ("id", "created_at", "questions_id", "user_id", "issue_date")
+        SELECT "id", "created_at", "questions_id", "user_id", "issue_date" FROM "user_questions_duplicates";
+        DROP TABLE IF EXISTS "user_questions_duplicates";
+        ALTER TABLE "user_questions" DROP COLUMN IF EXISTS "issue_date";
+        ALTER TABLE "users" DROP COLUMN IF EXISTS "timezone";"""
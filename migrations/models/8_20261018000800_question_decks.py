@@ -0,0 +1,25 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    # 0_init 보다 먼저 만들어진 DB에는 question_decks가 없으므로 따로 만듭니다.
+    # (0_init 으로 새로 만든 DB에서는 아무 일도 하지 않습니다)
+    return """
+        CREATE TABLE IF NOT EXISTS "question_decks" (
+            "id" BIGSERIAL NOT NULL PRIMARY KEY,
+            "created_at" TIMESTAMPTZ NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+            "deck" BYTEA NOT NULL,
+            "size" INT NOT NULL,
+            "position" INT NOT NULL  DEFAULT 0,
+            "user_id" INT NOT NULL UNIQUE REFERENCES "users" ("user_id") ON DELETE CASCADE
+        );
+        COMMENT ON COLUMN "question_decks"."deck" IS '섞인 질문 id 목록 (int64 packed)';
+        COMMENT ON COLUMN "question_decks"."size" IS '덱에 들어있는 질문 수';
+        COMMENT ON COLUMN "question_decks"."position" IS '다음에 뽑을 위치';
+        COMMENT ON TABLE "question_decks" IS '유저별로 섞어 둔 질문 덱';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    # 0_init 에도 있는 테이블이므로 되돌릴 때 지우지 않습니다.
+    return """
+        SELECT 1;"""
@@ -0,0 +1,57 @@
+"""
+명언 / 질문 대량 적재 CLI
+
+    uv run python -m scripts.load_content quotes quotes.jsonl more.csv
+    uv run python -m scripts.load_content questions questions.csv
+
+POSTGRES_* 환경변수의 DB에 COPY + INSERT ... SELECT 로 적재합니다.
+(app.services.content_loader)
+- 명언: {"content": ..., "author": ...} (author가 없으면 "작자 미상")
+- 질문: {"question_text": ...}
+- 형식은 확장자로 정합니다. (.csv 는 CSV, 나머지는 JSONL)
+  --format 으로 지정할 수도 있습니다.
+- 이미 있는 명언 / 질문과 파일 안의 중복은 건너뜁니다.
+- 잘못된 레코드가 있으면 종료 코드 1 (나머지는 적재됩니다)
+"""
+
+import argparse
+import asyncio
+import time
+from pathlib import Path
+
+from tortoise import Tortoise
+
+from app.db.database import TORTOISE_CONFIG
+from app.services.content_loader import service_load_questions, service_load_quotes
+
+LOADERS = {"quotes": service_load_quotes, "questions": service_load_questions}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="명언 / 질문 대량 적재")
+    parser.add_argument("kind", choices=sorted(LOADERS))
+    parser.add_argument("paths", nargs="+", type=Path, help="JSONL / CSV 파일")
+    parser.add_argument("--format", dest="fmt", choices=("jsonl", "csv"))
+    return parser.parse_args()
+
+
+async def main() -> int:
+    args = parse_args()
+    await Tortoise.init(config=TORTOISE_CONFIG)
+    try:
+        started = time.perf_counter()
+        result = await LOADERS[args.kind](args.paths, args.fmt)
+        elapsed = time.perf_counter() - started
+    finally:
+        await Tortoise.close_connections()
+
+    for error in result.pop("errors"):
+        print(f"{error['line']}: {error['error']}")
+    for name, count in result.items():
+        print(f"{name:<10} {count:>10,}")
+    print(f"{elapsed:.1f}s")
+    return 1 if result["invalid"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
@@ -0,0 +1,161 @@
+import os
+from collections import Counter
+from contextlib import contextmanager
+
+import httpx
+import pytest
+
+# app.core.config 가 읽는 값 (테스트는 Postgres 대신 메모리 SQLite를 씁니다)
+for _key, _value in {
+    "POSTGRES_USER": "test",
+    "POSTGRES_PASSWORD": "test",
+    "POSTGRES_HOST": "localhost",
+    "POSTGRES_PORT": "5432",
+    "POSTGRES_DB": "test",
+    "JWT_SECRET_KEY": "test-secret",
+    "BCRYPT_ROUNDS": "4",
+    "QUOTE_REFRESH_ENABLED": "false",
+    "BOOKMARK_RECONCILE_ENABLED": "false",
+}.items():
+    os.environ.setdefault(_key, _value)
+
+from tortoise import Tortoise  # noqa: E402
+
+from app.core.jwt import token_cache  # noqa: E402
+from app.db.database import MODELS  # noqa: E402
+from app.db.query_stats import track_queries  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.question import QuestionModel  # noqa: E402
+from app.models.quote import QuoteModel, quote_content_hash  # noqa: E402
+from app.services.auth_service import user_cache  # noqa: E402
+from app.services.quote_popularity import popular_quotes  # noqa: E402
+from app.services.quote_sampler import quote_sampler  # noqa: E402
+
+# 쿼리 횟수도 운영(app.db.pool)과 같은 QueryTimingMixin으로 셉니다.
+TEST_TORTOISE_CONFIG = {
+    "connections": {
+        "default": {
+            "engine": "app.db.sqlite",
+            "credentials": {"file_path": ":memory:"},
+        }
+    },
+    "apps": {
+        "models": {
+            "models": [m for m in MODELS if m != "aerich.models"],
+            "default_connection": "default",
+        }
+    },
+}
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def db():
+    await Tortoise.init(config=TEST_TORTOISE_CONFIG)
+    await Tortoise.generate_schemas()
+
+    # 프로세스 전역 캐시는 테스트마다 비웁니다.
+    user_cache.clear()
+    token_cache.clear()
+    popular_quotes.invalidate()
+    await quote_sampler.load()
+
+    yield
+
+    await Tortoise.close_connections()
+
+
+@pytest.fixture
+async def client(db):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+async def register_and_login(
+    client: httpx.AsyncClient, email: str = "tester@example.com"
+) -> dict:
+    """
+    회원가입 후 로그인해서 Authorization 헤더를 반환합니다.
+    """
+    password = "password1234"
+    response = await client.post(
+        "/auth/register",
+        json={"username": email.split("@")[0], "email": email, "password": password},
+    )
+    assert response.status_code == 201, response.text
+    response = await client.post(
+        "/auth/login", json={"email": email, "password": password}
+    )
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture
+async def auth_headers(client) -> dict:
+    return await register_and_login(client)
+
+
+@pytest.fixture
+async def quotes(db) -> list[QuoteModel]:
+    contents = [f"{i}번째 테스트 명언" for i in range(3)]
+    await QuoteModel.bulk_create(
+        [
+            QuoteModel(content=c, author="작가", content_hash=quote_content_hash(c))
+            for c in contents
+        ]
+    )
+    await quote_sampler.load()
+    return await QuoteModel.all().order_by("id")
+
+
+@pytest.fixture
+async def questions(db) -> list[QuestionModel]:
+    await QuestionModel.bulk_create(
+        [QuestionModel(question_text=f"{i}번째 질문") for i in range(3)]
+    )
+    return await QuestionModel.all().order_by("id")
+
+
+def _format_statements(statements) -> str:
+    lines = []
+    for i, (sql, site) in enumerate(statements, 1):
+        lines.append(f"  {i}. {sql}")
+        lines.extend(f"       at {frame}" for frame in site)
+    return "\n".join(lines)
+
+
+@pytest.fixture
+def query_budget():
+    """
+    with query_budget(n): 블록 안의 요청이 쓴 쿼리 수가 n을 넘거나
+    같은 SQL 문이 max_repeats 번보다 많이 실행되면(N+1) 실패시킵니다.
+    - 실패 메시지에 SQL 문과 app/ 안의 호출 위치를 함께 보여줍니다.
+    - 사용자 캐시를 비우고 시작하므로 인증 조회 1회가 항상 포함됩니다.
+    """
+
+    @contextmanager
+    def budget(max_queries: int, max_repeats: int = 1):
+        user_cache.clear()
+        with track_queries(capture=True) as stats:
+            yield stats
+
+        problems = []
+        if stats.count > max_queries:
+            problems.append(f"쿼리 {stats.count}회 (예산 {max_queries}회)")
+        for sql, count in Counter(sql for sql, _ in stats.statements).items():
+            if count > max_repeats:
+                problems.append(f"같은 쿼리 {count}회 반복 (N+1?): {sql}")
+        if problems:
+            pytest.fail(
+                "\n".join(problems)
+                + "\n실행된 쿼리:\n"
+                + _format_statements(stats.statements),
+                pytrace=False,
+            )
+
+    return budget
@@ -0,0 +1,199 @@
+import pytest
+
+from app.api.v1 import auth
+from app.core.config import settings
+from app.core.security import hash_password_async
+from app.db.pool import PoolExhausted
+from app.models.user import UserModel
+from app.schemas.user import UserResponse
+from tests.conftest import register_and_login
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_register_checks_email_then_inserts(client, query_budget):
+    with query_budget(2):
+        response = await client.post(
+            "/auth/register",
+            json={
+                "username": "newbie",
+                "email": "newbie@example.com",
+                "password": "password1234",
+            },
+        )
+
+    assert response.status_code == 201
+    assert response.json()["email"] == "newbie@example.com"
+
+
+async def test_register_rejects_duplicate_email(client, auth_headers, query_budget):
+    with query_budget(1):
+        response = await client.post(
+            "/auth/register",
+            json={
+                "username": "again",
+                "email": "tester@example.com",
+                "password": "password1234",
+            },
+        )
+
+    assert response.status_code == 409
+
+
+async def test_login_reads_user_once(client, auth_headers, query_budget):
+    with query_budget(1):
+        response = await client.post(
+            "/auth/login",
+            json={"email": "tester@example.com", "password": "password1234"},
+        )
+
+    assert response.status_code == 200
+    assert response.json()["token_type"] == "bearer"
+
+
+async def test_me_and_not_modified(client, auth_headers, query_budget):
+    with query_budget(1):
+        response = await client.get("/auth/me", headers=auth_headers)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    # 304도 인증 조회 1회뿐입니다.
+    with query_budget(1):
+        response = await client.get(
+            "/auth/me", headers={**auth_headers, "If-None-Match": etag}
+        )
+    assert response.status_code == 304
+
+
+async def test_me_fast_json_matches_response_model(client, auth_headers, monkeypatch):
+    expected = await client.get("/auth/me", headers=auth_headers)
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+    fast = await client.get("/auth/me", headers=auth_headers)
+
+    assert fast.json() == expected.json()
+    assert set(expected.json()) == set(UserResponse.model_fields)
+    assert fast.headers["ETag"] == expected.headers["ETag"]
+
+
+async def test_update_me(client, auth_headers, query_budget):
+    # 인증 + 이메일 중복 확인 + 행 다시 읽기 + 바뀐 컬럼만 UPDATE
+    # (캐시를 비우고 시작하므로 인증 조회와 다시 읽기가 같은 SQL)
+    with query_budget(4, max_repeats=2):
+        response = await client.patch(
+            "/auth/me",
+            headers=auth_headers,
+            json={"username": "renamed", "email": "renamed@example.com"},
+        )
+
+    assert response.status_code == 200
+    assert response.json()["username"] == "renamed"
+
+
+async def test_update_me_keeps_columns_changed_elsewhere(client, auth_headers):
+    await client.get("/auth/me", headers=auth_headers)  # 캐시에 스냅샷을 올려 둡니다.
+    # 다른 워커가 비밀번호를 바꾼 상황 (이 워커의 캐시는 그대로)
+    user = await UserModel.get(email="tester@example.com")
+    user.password_hash = await hash_password_async("password5678")
+    await user.save(update_fields=["password_hash"])
+
+    response = await client.patch(
+        "/auth/me", headers=auth_headers, json={"username": "renamed"}
+    )
+    assert response.status_code == 200
+
+    response = await client.post(
+        "/auth/login",
+        json={"email": "tester@example.com", "password": "password5678"},
+    )
+    assert response.status_code == 200
+
+
+async def test_update_timezone(client, auth_headers):
+    response = await client.patch(
+        "/auth/me", headers=auth_headers, json={"timezone": "America/New_York"}
+    )
+    assert response.status_code == 200
+    assert response.json()["timezone"] == "America/New_York"
+
+    response = await client.patch(
+        "/auth/me", headers=auth_headers, json={"timezone": "Mars/Olympus"}
+    )
+    assert response.status_code == 422
+
+
+async def test_change_password(client, auth_headers, query_budget):
+    # 인증 + 행 다시 읽기 + UPDATE
+    with query_budget(3, max_repeats=2):
+        response = await client.patch(
+            "/auth/me/password",
+            headers=auth_headers,
+            json={"current_password": "password1234", "new_password": "password5678"},
+        )
+    assert response.status_code == 204
+
+    response = await client.post(
+        "/auth/login",
+        json={"email": "tester@example.com", "password": "password5678"},
+    )
+    assert response.status_code == 200
+
+
+async def test_change_password_revokes_old_tokens(client, auth_headers):
+    response = await client.patch(
+        "/auth/me/password",
+        headers=auth_headers,
+        json={"current_password": "password1234", "new_password": "password5678"},
+    )
+    assert response.status_code == 204
+
+    response = await client.get("/auth/me", headers=auth_headers)
+    assert response.status_code == 401
+
+    response = await client.post(
+        "/auth/login",
+        json={"email": "tester@example.com", "password": "password5678"},
+    )
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    response = await client.get("/auth/me", headers=headers)
+    assert response.status_code == 200
+
+
+async def test_password_changed_by_another_worker(client, auth_headers):
+    await client.get("/auth/me", headers=auth_headers)  # 캐시에 스냅샷을 올려 둡니다.
+    # 다른 워커가 비밀번호를 바꾼 상황 (이 워커의 캐시는 그대로)
+    user = await UserModel.get(email="tester@example.com")
+    user.password_hash = await hash_password_async("password5678")
+    await user.save(update_fields=["password_hash"])
+    response = await client.post(
+        "/auth/login",
+        json={"email": "tester@example.com", "password": "password5678"},
+    )
+    new_headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    # 새 토큰은 오래된 스냅샷 대신 DB를 다시 읽어 통과하고, 이후 이전 토큰은 거부됩니다.
+    response = await client.get("/auth/me", headers=new_headers)
+    assert response.status_code == 200
+    response = await client.get("/auth/me", headers=auth_headers)
+    assert response.status_code == 401
+
+
+async def test_extract_id_does_not_touch_db(client, query_budget):
+    headers = await register_and_login(client)
+    token = headers["Authorization"].split()[1]
+
+    with query_budget(0):
+        response = await client.post("/auth/extract-id", json={"token": token})
+
+    assert response.status_code == 200
+    assert response.json()["user_id"] == 1
+
+
+async def test_pool_exhausted_is_503(client, auth_headers, monkeypatch):
+    async def exhausted(user_id):
+        raise PoolExhausted("timeout")
+
+    monkeypatch.setattr(auth, "service_get_user", exhausted)
+    response = await client.get("/auth/me", headers=auth_headers)
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
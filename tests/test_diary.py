@@ -0,0 +1,309 @@
+import base64
+import json
+
+import pytest
+
+from app.core.config import settings
+
+pytestmark = pytest.mark.anyio
+
+
+async def _create(client, headers, title="제목", content="내용") -> dict:
+    response = await client.post(
+        "/v1/diary/", headers=headers, json={"title": title, "content": content}
+    )
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+async def test_create_diary(client, auth_headers, query_budget):
+    # 인증 + INSERT + 일기 버전 증가 (작성자를 다시 조회하지 않음)
+    with query_budget(3):
+        diary = await _create(client, auth_headers)
+
+    assert diary["user_id"] == 1
+    assert diary["title"] == "제목"
+
+
+async def test_create_diary_by_token_str(client, auth_headers, query_budget):
+    token = auth_headers["Authorization"].split()[1]
+
+    with query_budget(2):
+        response = await client.post(
+            "/v1/diary/str",
+            params={"token": token},
+            json={"title": "제목", "content": "내용"},
+        )
+
+    assert response.status_code == 201
+    assert response.json()["user_id"] == 1
+
+
+async def test_read_diaries_page_and_not_modified(client, auth_headers, query_budget):
+    for i in range(3):
+        await _create(client, auth_headers, title=f"{i}번째")
+
+    # 인증 + 버전 + 목록 1페이지 (일기 수와 관계없이 같음)
+    with query_budget(3):
+        response = await client.get(
+            "/v1/diary/", headers=auth_headers, params={"limit": 2}
+        )
+    assert response.status_code == 200
+    page = response.json()
+    assert [d["title"] for d in page["items"]] == ["2번째", "1번째"]
+    assert page["next_cursor"]
+
+    with query_budget(2):
+        response = await client.get(
+            "/v1/diary/",
+            headers={**auth_headers, "If-None-Match": response.headers["ETag"]},
+            params={"limit": 2},
+        )
+    assert response.status_code == 304
+
+
+async def test_read_diaries_by_token_str(client, auth_headers, query_budget):
+    await _create(client, auth_headers)
+    token = auth_headers["Authorization"].split()[1]
+
+    with query_budget(2):
+        response = await client.get("/v1/diary/str", params={"token": token})
+
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 1
+
+
+async def test_search_diaries(client, auth_headers, query_budget):
+    await _create(client, auth_headers, title="바다", content="여름 바다에 갔다")
+    await _create(client, auth_headers, title="산", content="가을 산에 갔다")
+
+    with query_budget(2):
+        response = await client.get(
+            "/v1/diary/search", headers=auth_headers, params={"q": "바다"}
+        )
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert len(items) == 1
+    assert "<mark>바다</mark>" in items[0]["snippet"]
+
+
+async def test_search_reports_truncated_candidates(client, auth_headers, monkeypatch):
+    for i in range(3):
+        await _create(client, auth_headers, title=f"{i}번째 바다")
+    monkeypatch.setattr(settings, "DIARY_SEARCH_MAX_CANDIDATES", 2)
+
+    response = await client.get(
+        "/v1/diary/search", headers=auth_headers, params={"q": "바다"}
+    )
+
+    # 상한보다 오래된 "0번째 바다"는 빠지고, 빠졌다는 사실을 알려줍니다.
+    body = response.json()
+    assert sorted(item["title"] for item in body["items"]) == [
+        "1번째 바다",
+        "2번째 바다",
+    ]
+    assert body["truncated"] is True
+
+    monkeypatch.setattr(settings, "DIARY_SEARCH_MAX_CANDIDATES", 3)
+    response = await client.get(
+        "/v1/diary/search", headers=auth_headers, params={"q": "바다"}
+    )
+    assert len(response.json()["items"]) == 3
+    assert response.json()["truncated"] is False
+
+
+async def test_search_without_match_is_not_truncated(client, auth_headers):
+    await _create(client, auth_headers, title="산")
+
+    response = await client.get(
+        "/v1/diary/search", headers=auth_headers, params={"q": "바다"}
+    )
+
+    assert response.json() == {"items": [], "next_cursor": None, "truncated": False}
+
+
+@pytest.mark.parametrize(
+    "parts",
+    [
+        ["2026-01-01T00:00:00+00:00", 1, "x"],
+        ["2026-01-01T00:00:00+00:00", 1, "NaN"],
+        ["2026-01-01T00:00:00+00:00", 1, 0.5],
+        ["2026-01-01T00:00:00+00:00", 1],
+    ],
+)
+async def test_search_rejects_tampered_cursor(client, auth_headers, parts):
+    raw = json.dumps(parts).encode("utf-8")
+    cursor = base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    response = await client.get(
+        "/v1/diary/search", headers=auth_headers, params={"q": "바다", "cursor": cursor}
+    )
+
+    assert response.status_code == 400
+
+
+async def test_import_diaries(client, auth_headers, query_budget):
+    body = "\n".join(
+        f'{{"title": "{i}번째", "content": "가져온 일기"}}' for i in range(5)
+    )
+
+    # 인증 + 묶음 INSERT + 일기 버전 증가
+    with query_budget(3):
+        response = await client.post(
+            "/v1/diary/import",
+            headers={**auth_headers, "Content-Type": "application/x-ndjson"},
+            content=body.encode(),
+        )
+
+    assert response.status_code == 200, response.text
+    assert response.json()["inserted"] == 5
+
+
+async def test_import_reports_non_utf8_line(client, auth_headers):
+    body = (
+        '{"title": "첫째"}\n'.encode()
+        + b'{"title": "\xff\xfe"}\n'
+        + '{"title": "셋째"}'.encode()
+    )
+
+    response = await client.post(
+        "/v1/diary/import",
+        headers={**auth_headers, "Content-Type": "application/x-ndjson"},
+        content=body,
+    )
+
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert (result["inserted"], result["failed"]) == (2, 1)
+    assert result["errors"][0]["line"] == 2
+
+
+async def test_import_csv(client, auth_headers):
+    body = (
+        "\ufefftitle,content,created_at\r\n"
+        '"여러 줄","첫 줄\r\n둘째 줄",2025-01-01T09:00:00+09:00\r\n'
+        ",제목 없음,\r\n"
+        "\r\n"
+        '"쉼표, 있는 제목",내용,\r\n'
+    ).encode()
+
+    response = await client.post(
+        "/v1/diary/import",
+        headers=auth_headers,
+        params={"format": "csv"},
+        content=body,
+    )
+
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert (result["inserted"], result["failed"]) == (2, 1)
+    assert result["errors"][0]["line"] == 4
+
+    page = (await client.get("/v1/diary/", headers=auth_headers)).json()
+    by_title = {d["title"]: d for d in page["items"]}
+    assert by_title["여러 줄"]["content"] == "첫 줄\n둘째 줄"
+    assert by_title["여러 줄"]["created_at"].startswith("2025-01-01T00:00:00")
+    assert "쉼표, 있는 제목" in by_title
+
+
+async def test_import_line_limit_counts_bytes(client, auth_headers, monkeypatch):
+    # 23글자지만 UTF-8로는 43바이트인 줄
+    line = '{"title": "' + "가" * 10 + '"}'
+    monkeypatch.setattr(settings, "DIARY_IMPORT_MAX_LINE_BYTES", 30)
+
+    response = await client.post(
+        "/v1/diary/import",
+        headers={**auth_headers, "Content-Type": "application/x-ndjson"},
+        content=("\ufeff" + line).encode(),
+    )
+
+    assert response.status_code == 413
+
+
+async def test_export_diaries(client, auth_headers, query_budget):
+    for i in range(3):
+        await _create(client, auth_headers, title=f"{i}번째")
+
+    with query_budget(2):
+        response = await client.get("/v1/diary/export", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert len(response.text.splitlines()) == 3
+
+
+async def test_read_diary(client, auth_headers, query_budget):
+    diary = await _create(client, auth_headers)
+
+    with query_budget(1):
+        response = await client.get(f"/v1/diary/{diary['id']}")
+
+    assert response.status_code == 200
+    assert response.headers["ETag"]
+
+
+async def test_update_diary(client, auth_headers, query_budget):
+    diary = await _create(client, auth_headers)
+
+    # 인증 + UPDATE ... RETURNING + 일기 버전 증가
+    with query_budget(3):
+        response = await client.put(
+            f"/v1/diary/{diary['id']}",
+            headers=auth_headers,
+            json={"title": "새 제목", "content": "새 내용"},
+        )
+
+    assert response.status_code == 200
+    assert response.json()["title"] == "새 제목"
+
+
+async def test_patch_diary_with_stale_etag(client, auth_headers, query_budget):
+    diary = await _create(client, auth_headers)
+    response = await client.get(f"/v1/diary/{diary['id']}")
+    etag = response.headers["ETag"]
+    await client.patch(
+        f"/v1/diary/{diary['id']}", headers=auth_headers, json={"title": "먼저"}
+    )
+
+    # 인증 + 조건부 UPDATE(0행) + 원인 구분 조회
+    with query_budget(3):
+        response = await client.patch(
+            f"/v1/diary/{diary['id']}",
+            headers={**auth_headers, "If-Match": etag},
+            json={"title": "나중"},
+        )
+
+    assert response.status_code == 412
+
+
+async def test_delete_diary(client, auth_headers, query_budget):
+    diary = await _create(client, auth_headers)
+
+    with query_budget(3):
+        response = await client.delete(f"/v1/diary/{diary['id']}", headers=auth_headers)
+
+    assert response.status_code == 200
+    response = await client.get(f"/v1/diary/{diary['id']}")
+    assert response.status_code == 404
+
+
+async def test_fast_json_matches_response_model(client, auth_headers, monkeypatch):
+    for i in range(3):
+        await _create(client, auth_headers, title=f"바다 {i}", content="여름 바다")
+    requests = [("/v1/diary/", {"limit": 2}), ("/v1/diary/search", {"q": "바다"})]
+
+    expected = [
+        await client.get(url, headers=auth_headers, params=params)
+        for url, params in requests
+    ]
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+    fast = [
+        await client.get(url, headers=auth_headers, params=params)
+        for url, params in requests
+    ]
+
+    for slow, quick in zip(expected, fast):
+        assert quick.status_code == 200
+        assert quick.json() == slow.json()
+        assert quick.headers["content-type"] == "application/json"
+        assert quick.headers.get("ETag") == slow.headers.get("ETag")
@@ -0,0 +1,131 @@
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app.models.question import QuestionModel
+from app.models.user import UserModel
+from app.models.user_question import UserQuestionModel
+from app.services.content_loader import service_load_questions
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_first_question_builds_deck(
+    client, auth_headers, questions, query_budget
+):
+    # 인증 + 시간대 + 오늘 기록 조회 + 덱 꺼내기(없음) + 질문 id 목록
+    # + 덱 만들기(UPDATE, INSERT) + 질문 조회 + 오늘 기록 INSERT
+    with query_budget(9):
+        response = await client.get("/questions/random", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json()["question_id"] in {q.id for q in questions}
+
+
+async def test_same_day_returns_same_question(
+    client, auth_headers, questions, query_budget
+):
+    first = await client.get("/questions/random", headers=auth_headers)
+
+    # 인증 + 시간대 + (user_id, issue_date) JOIN 조회
+    with query_budget(3):
+        again = await client.get("/questions/random", headers=auth_headers)
+
+    assert again.status_code == 200
+    assert again.json() == first.json()
+    assert await UserQuestionModel.all().count() == 1
+
+
+async def test_next_day_pops_from_deck(client, auth_headers, questions, query_budget):
+    first = await client.get("/questions/random", headers=auth_headers)
+    record = await UserQuestionModel.get(user_id=1)
+    record.issue_date = record.issue_date - timedelta(days=1)
+    await record.save()
+
+    # 덱이 있으면 질문 수와 관계없이 같은 횟수
+    with query_budget(6):
+        response = await client.get("/questions/random", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json()["question_id"] != first.json()["question_id"]
+
+
+async def test_deck_with_deleted_questions_reshuffles(client, auth_headers, questions):
+    await QuestionModel.bulk_create(
+        [QuestionModel(question_text=f"추가 질문 {i}") for i in range(10)]
+    )
+    first = await client.get("/questions/random", headers=auth_headers)
+    issued_id = first.json()["question_id"]
+    record = await UserQuestionModel.get(user_id=1)
+    record.issue_date = record.issue_date - timedelta(days=1)
+    await record.save()
+
+    # 덱에 남은 질문이 모두 삭제됨
+    await QuestionModel.exclude(id=issued_id).delete()
+
+    response = await client.get("/questions/random", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["question_id"] == issued_id
+
+
+async def test_issue_date_follows_user_timezone(client, auth_headers, questions):
+    for tz in ("Pacific/Kiritimati", "Pacific/Pago_Pago"):  # UTC+14 / UTC-11
+        response = await client.patch(
+            "/auth/me", headers=auth_headers, json={"timezone": tz}
+        )
+        assert response.status_code == 200
+
+        response = await client.get("/questions/random", headers=auth_headers)
+        assert response.json()["issue_date"] == str(datetime.now(ZoneInfo(tz)).date())
+
+
+async def test_timezone_changed_by_another_worker(client, auth_headers, questions):
+    await client.get("/auth/me", headers=auth_headers)  # 캐시에 스냅샷을 올려 둡니다.
+    # 다른 워커가 시간대를 바꾼 상황 (이 워커의 캐시는 그대로)
+    tz = "Pacific/Kiritimati"
+    await UserModel.filter(email="tester@example.com").update(timezone=tz)
+
+    response = await client.get("/questions/random", headers=auth_headers)
+    assert response.json()["issue_date"] == str(datetime.now(ZoneInfo(tz)).date())
+
+
+async def test_concurrent_issue_falls_back_to_existing(
+    client, auth_headers, questions, monkeypatch
+):
+    first = await client.get("/questions/random", headers=auth_headers)
+
+    # 다른 요청이 조회와 INSERT 사이에 먼저 기록한 상황
+    lookup = UserQuestionModel.get_issued_question
+    calls = []
+
+    async def miss_once(user_id, issue_date):
+        calls.append(issue_date)
+        if len(calls) == 1:
+            return None
+        return await lookup(user_id, issue_date)
+
+    monkeypatch.setattr(UserQuestionModel, "get_issued_question", miss_once)
+    response = await client.get("/questions/random", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json() == first.json()
+    assert len(calls) == 2
+    assert await UserQuestionModel.all().count() == 1
+
+
+async def test_copy_loader_adds_new_questions(db, questions, tmp_path):
+    source = tmp_path / "questions.csv"
+    source.write_text(
+        f"question_text\n{questions[0].question_text}\n"
+        "오늘   가장 고마웠던 사람은?\n오늘 가장 고마웠던 사람은?\n,\n",
+        encoding="utf-8",
+    )
+
+    result = await service_load_questions([source])
+
+    assert result["inserted"] == 1
+    assert (result["existing"], result["duplicates"], result["invalid"]) == (1, 1, 1)
+    assert await QuestionModel.filter(
+        question_text="오늘 가장 고마웠던 사람은?"
+    ).exists()
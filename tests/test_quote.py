@@ -0,0 +1,354 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.models.quote import BULK_INSERT_MAX_ROWS, QuoteModel, quote_content_hash
+from app.scraping.quote_scraper import _parse_quotes, crawl_quotes
+from app.services.content_loader import service_load_quotes
+from app.services.quote_sampler import QuoteSampler
+from app.services.quote_service import service_create_quote, service_save_bulk_quotes
+
+
+def _page_html(page: int, count: int = 2) -> str:
+    rows = "".join(
+        f"""
+        <tr class="{"even" if i % 2 == 0 else "odd"}">
+          <td class="td_subject"><div class="bo_tit"><a>제목 {page}-{i}</a></div></td>
+        </tr>
+        <tr><td>  {page}페이지의 {i}번째   명언 내용입니다 - 작가{i} </td></tr>
+        """
+        for i in range(count)
+    )
+    return f"<html><body><table><tbody>{rows}</tbody></table></body></html>"
+
+
+def _stub_client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def _page_of(request: httpx.Request) -> int:
+    return int(request.url.params.get("page", "1"))
+
+
+def test_parse_quotes_splits_content_and_author():
+    quotes = _parse_quotes(_page_html(1))
+
+    assert quotes == [
+        {"content": "1페이지의 0번째 명언 내용입니다", "author": "작가0"},
+        {"content": "1페이지의 1번째 명언 내용입니다", "author": "작가1"},
+    ]
+
+
+@pytest.mark.anyio
+async def test_crawl_quotes_streams_every_page_once():
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(_page_of(request))
+        return httpx.Response(200, text=_page_html(_page_of(request)))
+
+    async with _stub_client(handler) as client:
+        quotes = [
+            q
+            async for q in crawl_quotes(
+                1, 5, concurrency=3, requests_per_second=0, client=client
+            )
+        ]
+
+    assert sorted(requested) == [1, 2, 3, 4, 5]
+    assert len(quotes) == 10
+    assert len({q["content"] for q in quotes}) == 10
+
+
+@pytest.mark.anyio
+async def test_crawl_quotes_retries_transient_errors():
+    attempts = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = _page_of(request)
+        attempts[page] = attempts.get(page, 0) + 1
+        if attempts[page] == 1:
+            return httpx.Response(503)
+        if page == 2 and attempts[page] == 2:
+            raise httpx.ConnectError("boom", request=request)
+        return httpx.Response(200, text=_page_html(page))
+
+    async with _stub_client(handler) as client:
+        quotes = [
+            q
+            async for q in crawl_quotes(
+                1, 2, requests_per_second=0, retries=3, backoff=0, client=client
+            )
+        ]
+
+    assert attempts == {1: 2, 2: 3}
+    assert len(quotes) == 4
+
+
+@pytest.mark.anyio
+async def test_crawl_quotes_skips_pages_that_keep_failing():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if _page_of(request) == 2:
+            return httpx.Response(500)
+        return httpx.Response(200, text=_page_html(_page_of(request)))
+
+    async with _stub_client(handler) as client:
+        quotes = [
+            q
+            async for q in crawl_quotes(
+                1, 3, requests_per_second=0, retries=1, backoff=0, client=client
+            )
+        ]
+
+    assert {q["author"] for q in quotes} == {"작가0", "작가1"}
+    assert len(quotes) == 4
+
+
+@pytest.mark.anyio
+async def test_crawl_quotes_parses_in_process_pool():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=_page_html(_page_of(request)))
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        async with _stub_client(handler) as client:
+            quotes = [
+                q
+                async for q in crawl_quotes(
+                    1, 2, requests_per_second=0, client=client, parse_executor=executor
+                )
+            ]
+
+    assert len(quotes) == 4
+
+
+def test_parse_quotes_with_html_parser_backend():
+    assert len(_parse_quotes(_page_html(1, count=3), parser="html.parser")) == 3
+
+
+@pytest.mark.anyio
+async def test_random_quote_is_one_pk_lookup(client, quotes, query_budget):
+    with query_budget(1):
+        response = await client.get("/quote/random")
+
+    assert response.status_code == 200
+    assert response.json()["id"] in {q.id for q in quotes}
+
+
+@pytest.mark.anyio
+async def test_popular_quotes_are_served_from_memory(
+    client, auth_headers, quotes, query_budget
+):
+    await client.post(f"/quote/{quotes[1].id}/bookmark", headers=auth_headers)
+
+    with query_budget(1):
+        response = await client.get("/quote/popular")
+    assert response.status_code == 200
+    assert response.json()[0]["id"] == quotes[1].id
+
+    with query_budget(0):
+        response = await client.get("/quote/popular")
+    assert response.status_code == 200
+
+
+def test_sampler_add_dedupes_within_call():
+    sampler = QuoteSampler()
+    sampler.add(3, 1, 3)
+    sampler.add(2)
+
+    assert list(sampler._ids) == [3, 1, 2]
+
+
+@pytest.mark.anyio
+async def test_create_quote_skips_duplicates(client, query_budget):
+    payload = {"content": "새 명언", "author": "작가"}
+
+    with query_budget(2):
+        response = await client.post("/quote", json=payload)
+    assert response.status_code == 201
+
+    with query_budget(1):
+        again = await client.post("/quote", json=payload)
+    assert again.json()["id"] == response.json()["id"]
+
+
+@pytest.mark.anyio
+async def test_create_quote_race_returns_existing(db, monkeypatch):
+    existing = await QuoteModel.create(content="동시에 저장한 명언", author="작가")
+
+    # 다른 요청이 중복 확인과 INSERT 사이에 먼저 저장한 상황
+    real_filter = QuoteModel.filter
+    monkeypatch.setattr(
+        QuoteModel, "filter", lambda *args, **kwargs: real_filter(id=-1)
+    )
+    quote, created = await service_create_quote({"content": "동시에  저장한 명언"})
+
+    assert (quote.id, created) == (existing.id, False)
+
+
+@pytest.mark.anyio
+async def test_save_bulk_quotes_clamps_batch_and_author(db, monkeypatch):
+    batches = []
+    insert = QuoteModel.bulk_insert_ignore_duplicates
+
+    async def spy(rows):
+        batches.append(len(rows))
+        return await insert(rows)
+
+    monkeypatch.setattr(QuoteModel, "bulk_insert_ignore_duplicates", spy)
+    quotes = [{"content": f"명언 {i}", "author": "작가"} for i in range(11_000)]
+    quotes[0]["author"] = "  아주   긴 " + "이름" * 100
+
+    saved = await service_save_bulk_quotes(quotes, batch_size=100_000)
+
+    assert saved == 11_000
+    assert batches == [BULK_INSERT_MAX_ROWS, 11_000 - BULK_INSERT_MAX_ROWS]
+    author = (await QuoteModel.get(content="명언 0")).author
+    assert author.startswith("아주 긴 이름") and len(author) == 100
+
+
+@pytest.mark.anyio
+async def test_save_recomputes_content_hash(db):
+    quote = await QuoteModel.create(content="고치기 전 명언", author="작가")
+    quote.content = "고친 명언"
+    await quote.save(update_fields=["content"])
+
+    await quote.refresh_from_db()
+    assert quote.content_hash == quote_content_hash("고친 명언")
+
+
+@pytest.mark.anyio
+async def test_add_bookmark(client, auth_headers, quotes, query_budget):
+    # 인증 + 북마크 수 증가(명언 확인 겸) + INSERT + 북마크 버전 증가
+    with query_budget(4):
+        response = await client.post(
+            f"/quote/{quotes[0].id}/bookmark", headers=auth_headers
+        )
+    assert response.status_code == 201
+
+    with query_budget(3):
+        response = await client.post(
+            f"/quote/{quotes[0].id}/bookmark", headers=auth_headers
+        )
+    assert response.status_code == 200
+
+    await quotes[0].refresh_from_db()
+    assert quotes[0].bookmark_count == 1
+
+
+@pytest.mark.anyio
+async def test_reconcile_bookmark_counts_in_batches(client, auth_headers, quotes):
+    await client.post(f"/quote/{quotes[2].id}/bookmark", headers=auth_headers)
+    await QuoteModel.filter(id=quotes[0].id).update(bookmark_count=5)
+    await QuoteModel.filter(id=quotes[2].id).update(bookmark_count=0)
+
+    fixed = await QuoteModel.reconcile_bookmark_counts(batch_size=2)
+
+    assert sorted(fixed) == [quotes[0].id, quotes[2].id]
+    counts = (
+        await QuoteModel.all().order_by("id").values_list("bookmark_count", flat=True)
+    )
+    assert counts == [0, 0, 1]
+    assert await QuoteModel.reconcile_bookmark_counts(batch_size=2) == []
+
+
+@pytest.mark.anyio
+async def test_add_bookmark_to_missing_quote(client, auth_headers, query_budget):
+    with query_budget(2):
+        response = await client.post("/quote/999/bookmark", headers=auth_headers)
+
+    assert response.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_list_bookmarks_is_one_join(client, auth_headers, quotes, query_budget):
+    for quote in quotes:
+        await client.post(f"/quote/{quote.id}/bookmark", headers=auth_headers)
+
+    # 인증 + 버전 + 북마크/명언 JOIN 1회 (북마크 수와 관계없이 같음)
+    with query_budget(3):
+        response = await client.get("/quote/bookmark", headers=auth_headers)
+
+    assert response.status_code == 200
+    page = response.json()
+    assert [item["id"] for item in page["items"]] == [q.id for q in reversed(quotes)]
+    assert page["total"] == 3
+
+
+@pytest.mark.anyio
+async def test_delete_bookmark(client, auth_headers, quotes, query_budget):
+    await client.post(f"/quote/{quotes[0].id}/bookmark", headers=auth_headers)
+
+    with query_budget(4):
+        response = await client.delete(
+            f"/quote/{quotes[0].id}/bookmark", headers=auth_headers
+        )
+    assert response.status_code == 200
+
+    # 북마크가 없을 때만 명언 존재를 한 번 더 확인합니다.
+    with query_budget(3):
+        response = await client.delete(
+            f"/quote/{quotes[0].id}/bookmark", headers=auth_headers
+        )
+    assert response.status_code == 404
+
+    await quotes[0].refresh_from_db()
+    assert quotes[0].bookmark_count == 0
+
+
+@pytest.mark.anyio
+async def test_fast_json_matches_response_model(
+    client, auth_headers, quotes, monkeypatch
+):
+    for quote in quotes:
+        await client.post(f"/quote/{quote.id}/bookmark", headers=auth_headers)
+    urls = ["/quote/bookmark", "/quote/popular", "/auth/me"]
+
+    expected = [await client.get(url, headers=auth_headers) for url in urls]
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+    fast = [await client.get(url, headers=auth_headers) for url in urls]
+
+    for slow, quick in zip(expected, fast):
+        assert quick.status_code == 200
+        assert quick.json() == slow.json()
+        assert quick.headers.get("ETag") == slow.headers.get("ETag")
+
+
+@pytest.mark.anyio
+async def test_copy_loader_dedupes_and_skips_existing(db, tmp_path):
+    await QuoteModel.create(content="이미 있는 명언", author="누군가")
+    jsonl = tmp_path / "quotes.jsonl"
+    jsonl.write_text(
+        '{"content": "첫   번째 명언", "author": "가"}\n'
+        '{"content": "이미 있는 명언"}\n'
+        "\n"
+        "not json\n"
+        '{"author": "내용 없음"}\n',
+        encoding="utf-8",
+    )
+    csv_file = tmp_path / "quotes.csv"
+    csv_file.write_text(
+        'content,author\n"첫 번째 명언",나\n"여러 줄\n명언",\n', encoding="utf-8"
+    )
+
+    result = await service_load_quotes([jsonl, csv_file])
+
+    assert {k: v for k, v in result.items() if k != "errors"} == {
+        "read": 6,
+        "invalid": 2,
+        "duplicates": 1,
+        "existing": 1,
+        "inserted": 2,
+    }
+    assert [e["line"] for e in result["errors"]] == [f"{jsonl}:4", f"{jsonl}:5"]
+    saved = await QuoteModel.filter(content__in=["첫 번째 명언", "여러 줄 명언"])
+    assert sorted((q.author, q.bookmark_count) for q in saved) == [
+        ("가", 0),
+        ("작자 미상", 0),
+    ]
+
+    # 같은 파일을 다시 적재하면 새로 들어가는 것이 없습니다.
+    again = await service_load_quotes([jsonl, csv_file])
+    assert again["inserted"] == 0
+    assert await QuoteModel.all().count() == 3